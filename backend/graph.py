@@ -0,0 +1,458 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+import polars as pl
+
+# 이보다 좁은 단계는 numpy 호출 비용이 노드별 처리보다 크므로 파이썬 루프로 넘어간다
+VECTOR_FRONTIER = 256
+# 노드와 엣지가 이보다 많으면 ID 를 해시 정렬 검색으로 한 번에 색인한다 (작은 그래프는 사전이 더 빠르다)
+VECTOR_INTERN = 50_000
+# 서버가 동시에 들고 있는 편집 세션 수 (넘으면 가장 오래 쓰지 않은 세션부터 버린다)
+MAX_GRAPH_SESSIONS = 256
+EDIT_OPS = ("add_node", "remove_node", "update_node", "add_edge", "remove_edge")
+
+
+@dataclass
+class GraphAnalysis:
+    is_dag: bool
+    # 순환이 있으면 순환에 걸리지 않은 노드까지만의 부분 순서
+    order: list[str] = field(default_factory=list)
+    # 순환 경로: 시작 노드로 다시 돌아오는 형태 (예: ["a", "b", "a"])
+    cycle: list[str] = field(default_factory=list)
+    # 존재하지 않는 노드를 가리키는 엣지 (source, target)
+    dangling_edges: list[tuple[str, str]] = field(default_factory=list)
+
+
+@dataclass
+class CompactGraph:
+    """Graph over dense integer node indices in CSR form.
+
+    The successors of node ``u`` are ``targets[offsets[u] : offsets[u + 1]]``.
+    """
+
+    ids: list[str]
+    offsets: np.ndarray
+    targets: np.ndarray
+    indegree: np.ndarray
+    dangling: list[tuple[str, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def _hashed_indices(ids: list[str], pairs: list[tuple[str, str]]) -> np.ndarray | None:
+    """Node index of every edge endpoint (-1 if unknown), matched by 64-bit hash with a sorted search.
+
+    Returns ``None`` when two node IDs share a hash (duplicate IDs or a hash
+    collision) or an endpoint only matches by hash, so the caller can fall
+    back to exact dictionary lookups.
+    """
+    names = pl.Series(ids, dtype=pl.String)
+    endpoints = pl.Series([node for pair in pairs for node in pair], dtype=pl.String)
+    keys = names.hash(seed=0).to_numpy()
+    order = np.argsort(keys)
+    ordered = keys[order]
+    if (ordered[1:] == ordered[:-1]).any():
+        return None
+    probes = endpoints.hash(seed=0).to_numpy()
+    slots = np.searchsorted(ordered, probes).clip(max=len(ordered) - 1)
+    found = ordered[slots] == probes
+    index = np.where(found, order[slots], -1)
+    # 해시만 같고 문자열이 다른 경우(충돌)가 없는지 실제 ID 와 한 번에 비교
+    matched = np.flatnonzero(found)
+    if not (names.gather(index[matched]) == endpoints.gather(matched)).all():
+        return None
+    return index
+
+
+def intern_graph(node_ids: Sequence[str], edges: Iterable[tuple[str, str]]) -> CompactGraph:
+    """Map node IDs to dense integer indices and build the CSR adjacency and in-degrees.
+
+    Large graphs match edge endpoints to IDs with vectorized hashing and a
+    sorted search instead of a per-edge dictionary lookup.
+    """
+    ids = list(node_ids)
+    pairs = list(edges)
+    flat = _hashed_indices(ids, pairs) if ids and len(ids) + len(pairs) >= VECTOR_INTERN else None
+    if flat is None:
+        index = dict(zip(ids, range(len(ids)), strict=True))
+        if len(index) < len(ids):
+            ids = list(dict.fromkeys(ids))  # 중복 ID 제거 (입력 순서 유지)
+            index = dict(zip(ids, range(len(ids)), strict=True))
+        flat = np.fromiter(
+            (index.get(node, -1) for pair in pairs for node in pair), dtype=np.int64, count=2 * len(pairs)
+        )
+    u, v = flat[0::2], flat[1::2]
+    dangling: list[tuple[str, str]] = []
+    missing = (u < 0) | (v < 0)
+    if missing.any():
+        dangling = [pairs[i] for i in np.flatnonzero(missing).tolist()]
+        u, v = u[~missing], v[~missing]
+
+    return _csr(ids, u, v, dangling)
+
+
+def _csr(ids: list[str], u: np.ndarray, v: np.ndarray, dangling: list[tuple[str, str]] | None = None) -> CompactGraph:
+    offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(u, minlength=len(ids)), out=offsets[1:])
+    return CompactGraph(
+        ids=ids,
+        offsets=offsets,
+        targets=v[np.argsort(u, kind="stable")],
+        indegree=np.bincount(v, minlength=len(ids)),
+        dangling=dangling or [],
+    )
+
+
+def topological_order(graph: CompactGraph) -> list[int]:
+    """Kahn's algorithm; the result is shorter than the node count when there is a cycle.
+
+    Wide levels are peeled off with array operations (all successors of the
+    level at once); once a level becomes narrow the rest runs as a plain queue.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    remaining = graph.indegree.copy()
+    frontier = np.flatnonzero(remaining == 0)
+    order: list[int] = []
+    while len(frontier) >= VECTOR_FRONTIER:
+        order.extend(frontier.tolist())
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        # 단계 내 모든 노드의 후속 노드 위치를 한 번에 모은다
+        positions = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+        successors, decrements = np.unique(targets[positions], return_counts=True)
+        remaining[successors] -= decrements
+        frontier = successors[remaining[successors] == 0]
+
+    queue = frontier.tolist()
+    if queue:
+        offset_list, target_list, left = offsets.tolist(), targets.tolist(), remaining.tolist()
+        # 순회 중에 리스트 끝에 추가해도 for 문이 이어서 방문한다 (별도 큐 불필요)
+        for u in queue:
+            for v in target_list[offset_list[u] : offset_list[u + 1]]:
+                left[v] -= 1
+                if not left[v]:
+                    queue.append(v)
+        order.extend(queue)
+    return order
+
+
+def find_cycle(graph: CompactGraph, remaining: np.ndarray) -> list[int]:
+    """One cycle among the ``remaining`` nodes (those Kahn could not order), as a closed index path.
+
+    Nodes with no outgoing edge inside the remaining set cannot be on a cycle,
+    so they are peeled off first with Kahn's algorithm on the reversed
+    subgraph. In what is left every node has a successor that is also left,
+    so following one such successor from any node must close a cycle.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    sources = np.repeat(np.arange(len(graph), dtype=np.int64), np.diff(offsets))
+    inside = remaining[sources] & remaining[targets]
+    reverse = _csr(graph.ids, targets[inside], sources[inside])
+    core = remaining.copy()
+    core[topological_order(reverse)] = False
+    if not core.any():
+        return []
+    # 코어 안의 후속 노드 하나씩 (역순으로 대입해 CSR 의 첫 후속 노드가 남는다)
+    keep = core[sources] & core[targets]
+    successor = np.full(len(graph), -1, dtype=np.int64)
+    successor[sources[keep][::-1]] = targets[keep][::-1]
+    step = successor.tolist()
+    position: dict[int, int] = {}
+    path: list[int] = []
+    node = int(np.flatnonzero(core)[0])
+    while node not in position:
+        position[node] = len(path)
+        path.append(node)
+        node = step[node]
+    return path[position[node] :] + [node]
+
+
+def analyze_graph(node_ids: Sequence[str], edges: Iterable[tuple[str, str]]) -> GraphAnalysis:
+    graph = intern_graph(node_ids, edges)
+    order = topological_order(graph)
+    cycle: list[int] = []
+    if len(order) < len(graph):
+        # Kahn 이후 남은 노드는 모두 순환이거나 순환 뒤에 있으므로 그 중에서만 탐색
+        unvisited = np.ones(len(graph), dtype=bool)
+        unvisited[order] = False
+        cycle = find_cycle(graph, unvisited)
+    ids = graph.ids
+    return GraphAnalysis(
+        is_dag=not cycle,
+        order=list(map(ids.__getitem__, order)),
+        cycle=[ids[i] for i in cycle],
+        dangling_edges=graph.dangling,
+    )
+
+
+@dataclass(frozen=True)
+class GraphEdit:
+    """One delta of an editing session.
+
+    The node ops (``add_node``, ``remove_node``, ``update_node``) take ``id``;
+    the edge ops (``add_edge``, ``remove_edge``) take ``source`` and ``target``.
+    """
+
+    op: str
+    id: str | None = None
+    source: str | None = None
+    target: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.op not in EDIT_OPS:
+            raise ValueError(f"op must be one of {list(EDIT_OPS)}, got {self.op!r}")
+        if self.op.endswith("_node") and self.id is None:
+            raise ValueError(f"{self.op} needs 'id'")
+        if self.op.endswith("_edge") and (self.source is None or self.target is None):
+            raise ValueError(f"{self.op} needs 'source' and 'target'")
+
+
+@dataclass
+class GraphUpdate:
+    # 순환을 만들어 거부된 엣지마다 그 순환 경로 ([source, target, ..., source])
+    cycles: list[list[str]] = field(default_factory=list)
+    # 존재하지 않는 노드를 가리켜 추가하지 않은 엣지 (source, target)
+    dangling_edges: list[tuple[str, str]] = field(default_factory=list)
+    # 새로 추가되거나 순위가 바뀐 노드의 순위 (전체 노드를 순위로 정렬하면 위상 순서)
+    ranks: dict[str, int] = field(default_factory=dict)
+    # 편집의 영향을 받아 다시 계산해야 하는 노드와 그 하류 전체 (위상 순서)
+    stale: list[str] = field(default_factory=list)
+
+
+class IncrementalGraph:
+    """DAG kept acyclic under node and edge edits, with a maintained topological order.
+
+    Uses the Pearce–Kelly dynamic topological sort. Every node holds a rank,
+    and only an edge ``u -> v`` with ``rank[u] > rank[v]`` needs work: a
+    search bounded to the nodes ranked between ``v`` and ``u`` either finds a
+    path ``v -> ... -> u`` (the edge would close a cycle and is rejected) or
+    collects the nodes that must move, and only those are re-ranked. Removals
+    never invalidate the order.
+    """
+
+    def __init__(self) -> None:
+        self.rank: dict[str, int] = {}
+        self.successors: dict[str, set[str]] = {}
+        self.predecessors: dict[str, set[str]] = {}
+        self.num_edges = 0
+        self._next_rank = 0
+        # 같은 세션으로 동시에 들어온 요청을 순서대로 처리
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.rank)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.rank
+
+    @classmethod
+    def build(cls, node_ids: Sequence[str], edges: Iterable[tuple[str, str]]) -> tuple["IncrementalGraph", GraphUpdate]:
+        """Load a whole pipeline; cycle-closing and dangling edges are left out and reported."""
+        pairs = list(edges)
+        # 정적 위상 순서대로 넣으면 대부분의 엣지가 순방향이라 재배치 없이 들어간다
+        order = analyze_graph(node_ids, pairs).order
+        nodes = list(dict.fromkeys([*order, *node_ids]))
+        graph = cls()
+        for node in nodes:
+            graph.add_node(node)
+        update = GraphUpdate()
+        for source, target in pairs:
+            if source not in graph.rank or target not in graph.rank:
+                update.dangling_edges.append((source, target))
+                continue
+            cycle, _ = graph.add_edge(source, target)
+            if cycle:
+                update.cycles.append(cycle)
+        # 처음 불러온 그래프는 모든 노드가 새 노드
+        update.ranks = dict(graph.rank)
+        update.stale = graph.order()
+        return graph, update
+
+    def order(self) -> list[str]:
+        return sorted(self.rank, key=self.rank.__getitem__)
+
+    def edges(self) -> list[tuple[str, str]]:
+        return [(source, target) for source in self.order() for target in self.successors[source]]
+
+    def is_dag(self) -> bool:
+        """Whether every edge points forward in the maintained order (i.e. the graph has no cycle)."""
+        rank = self.rank
+        return all(rank[source] < rank[target] for source, targets in self.successors.items() for target in targets)
+
+    def add_node(self, node: str) -> bool:
+        if node in self.rank:
+            return False
+        # 새 노드는 아직 엣지가 없으므로 맨 뒤 순위면 충분하다
+        self.rank[node] = self._next_rank
+        self._next_rank += 1
+        self.successors[node] = set()
+        self.predecessors[node] = set()
+        return True
+
+    def remove_node(self, node: str) -> list[str]:
+        """Remove ``node`` and its edges; returns its former successors."""
+        if node not in self.rank:
+            return []
+        successors = self.successors.pop(node)
+        predecessors = self.predecessors.pop(node)
+        for target in successors:
+            self.predecessors[target].discard(node)
+        for source in predecessors:
+            self.successors[source].discard(node)
+        self.num_edges -= len(successors) + len(predecessors)
+        del self.rank[node]
+        return list(successors)
+
+    def remove_edge(self, source: str, target: str) -> bool:
+        if target not in self.successors.get(source, ()):
+            return False
+        self.successors[source].discard(target)
+        self.predecessors[target].discard(source)
+        self.num_edges -= 1
+        return True
+
+    def add_edge(self, source: str, target: str) -> tuple[list[str], dict[str, int]]:
+        """Insert ``source -> target`` unless it closes a cycle.
+
+        Returns that cycle (empty when the edge was inserted) and the new ranks
+        of the nodes that had to move.
+        """
+        if source == target:
+            return [source, source], {}
+        if target in self.successors[source]:
+            return [], {}
+        lower, upper = self.rank[target], self.rank[source]
+        moved: dict[str, int] = {}
+        if lower < upper:
+            forward, path = self._forward(target, source, upper)
+            if path:
+                return [source, *path], {}
+            backward = self._backward(source, lower)
+            moved = self._reorder(backward, forward)
+        self.successors[source].add(target)
+        self.predecessors[target].add(source)
+        self.num_edges += 1
+        return [], moved
+
+    def _forward(self, start: str, goal: str, upper: int) -> tuple[list[str], list[str]]:
+        # start 에서 순위 upper 미만의 노드만 따라가며 goal 을 찾는다: (방문 노드, start..goal 경로)
+        parent = {start: start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for successor in self.successors[node]:
+                if successor == goal:
+                    path = [goal, node]
+                    while node != start:
+                        node = parent[node]
+                        path.append(node)
+                    return [], path[::-1]
+                if successor not in parent and self.rank[successor] < upper:
+                    parent[successor] = node
+                    stack.append(successor)
+        return list(parent), []
+
+    def _backward(self, start: str, lower: int) -> list[str]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            for predecessor in self.predecessors[stack.pop()]:
+                if predecessor not in seen and self.rank[predecessor] > lower:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+        return list(seen)
+
+    def _reorder(self, backward: list[str], forward: list[str]) -> dict[str, int]:
+        # 두 탐색이 쓰던 순위 자리만 모아, 상류(backward) 전체를 하류(forward) 앞에 다시 배치
+        rank = self.rank
+        nodes = sorted(backward, key=rank.__getitem__) + sorted(forward, key=rank.__getitem__)
+        slots = sorted(rank[node] for node in nodes)
+        moved = {}
+        for node, slot in zip(nodes, slots, strict=True):
+            if rank[node] != slot:
+                rank[node] = moved[node] = slot
+        return moved
+
+    def _closure(self, seeds: Iterable[str], adjacency: dict[str, set[str]]) -> set[str]:
+        seen = set(seeds)
+        stack = list(seen)
+        while stack:
+            for node in adjacency[stack.pop()]:
+                if node not in seen:
+                    seen.add(node)
+                    stack.append(node)
+        return seen
+
+    def descendants(self, node: str) -> list[str]:
+        """Nodes reachable from ``node``, in topological order."""
+        return sorted(self._closure([node], self.successors) - {node}, key=self.rank.__getitem__)
+
+    def ancestors(self, node: str) -> list[str]:
+        """Nodes that reach ``node``, in topological order."""
+        return sorted(self._closure([node], self.predecessors) - {node}, key=self.rank.__getitem__)
+
+    def apply(self, edits: Iterable[GraphEdit]) -> GraphUpdate:
+        """Apply ``edits`` in order; the cost depends on the nodes they touch, not the graph size."""
+        update = GraphUpdate()
+        seeds: set[str] = set()
+        for edit in edits:
+            if edit.op == "add_node" and edit.id is not None:
+                if self.add_node(edit.id):
+                    update.ranks[edit.id] = self.rank[edit.id]
+                    seeds.add(edit.id)
+            elif edit.op == "remove_node" and edit.id is not None:
+                seeds.update(self.remove_node(edit.id))
+                update.ranks.pop(edit.id, None)
+            elif edit.op == "update_node" and edit.id is not None:
+                seeds.add(edit.id)
+            elif edit.source is not None and edit.target is not None:
+                source, target = edit.source, edit.target
+                if edit.op == "remove_edge":
+                    if self.remove_edge(source, target):
+                        seeds.add(target)
+                elif source not in self.rank or target not in self.rank:
+                    update.dangling_edges.append((source, target))
+                else:
+                    cycle, moved = self.add_edge(source, target)
+                    if cycle:
+                        update.cycles.append(cycle)
+                    else:
+                        update.ranks.update(moved)
+                        seeds.add(target)
+        # 실행 결과가 바뀌는 노드: 편집된 노드와 엣지의 도착 노드, 그리고 그 하류
+        stale = self._closure((node for node in seeds if node in self.rank), self.successors)
+        update.stale = sorted(stale, key=self.rank.__getitem__)
+        return update
+
+
+class GraphSessions:
+    """Per-session ``IncrementalGraph``s; the least recently used are dropped beyond ``max_sessions``."""
+
+    def __init__(self, max_sessions: int = MAX_GRAPH_SESSIONS):
+        self.max_sessions = max_sessions
+        self._graphs: OrderedDict[str, IncrementalGraph] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._graphs)
+
+    def add(self, session_id: str, graph: IncrementalGraph) -> None:
+        with self._lock:
+            self._graphs[session_id] = graph
+            while len(self._graphs) > self.max_sessions:
+                self._graphs.popitem(last=False)
+
+    def get(self, session_id: str) -> IncrementalGraph | None:
+        with self._lock:
+            graph = self._graphs.get(session_id)
+            if graph is not None:
+                self._graphs.move_to_end(session_id)
+            return graph
+
+    def remove(self, session_id: str) -> bool:
+        with self._lock:
+            return self._graphs.pop(session_id, None) is not None
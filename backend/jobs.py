@@ -0,0 +1,284 @@
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+
+import polars as pl
+
+from pipeline import PipelineNode, compile_pipeline
+from polaris.cache import RESULT_CACHE_DIR, ResultCache
+from polaris.profile import EDAEngine, profile_path
+from polaris.quality import DEFAULT_SAMPLE_SIZE, RuleSet
+from polaris.scheduler import SectionRun
+from polaris.source import DATA_ROOT, NATIVE_HIVE_FORMATS, DatasetSource
+from polaris.streaming import DEFAULT_BATCH_SIZE, StreamingProfiler
+
+JOB_DB = os.environ.get("POLARIS_JOB_DB", os.path.join(os.path.expanduser("~"), ".polaris", "jobs.sqlite3"))
+# 동시에 실행되는 작업 수 (나머지는 queued 상태로 대기)
+MAX_WORKERS = int(os.environ.get("POLARIS_JOB_WORKERS", "2"))
+TERMINAL_STATES = ("succeeded", "failed", "cancelled")
+
+# 작업 함수에 넘기는 진행률 콜백: (0~1 진행률, 지금까지의 부분 결과)
+Progress = Callable[[float, dict[str, Any] | None], None]
+JobFunction = Callable[[dict[str, Any], Progress], dict[str, Any]]
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobStore:
+    """Job status, progress and results in a SQLite file shared by the API and worker processes."""
+
+    def __init__(self, path: str = JOB_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress REAL NOT NULL DEFAULT 0,
+                    payload TEXT NOT NULL,
+                    partial TEXT,
+                    result TEXT,
+                    error TEXT,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    created REAL NOT NULL,
+                    updated REAL NOT NULL
+                )"""
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # 프로세스/스레드마다 짧게 연결한다 (sqlite3 연결은 스레드 간 공유 불가)
+        db = sqlite3.connect(self.path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def create(self, kind: str, payload: dict[str, Any]) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT INTO jobs (id, kind, status, payload, created, updated) VALUES (?, ?, 'queued', ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), now, now),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Status row without the payload and the final result (cheap to poll)."""
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT id, kind, status, progress, partial, error, cancel_requested, created, updated"
+                " FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["partial"] = json.loads(job["partial"]) if job["partial"] else None
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        return job
+
+    def payload(self, job_id: str) -> dict[str, Any]:
+        with self._connect() as db:
+            row = db.execute("SELECT payload FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        result: dict[str, Any] = json.loads(row["payload"])
+        return result
+
+    def result(self, job_id: str) -> dict[str, Any] | None:
+        with self._connect() as db:
+            row = db.execute("SELECT result FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return json.loads(row["result"]) if row is not None and row["result"] else None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        for key in ("partial", "result"):
+            if fields.get(key) is not None:
+                fields[key] = json.dumps(fields[key])
+        fields["updated"] = time.time()
+        columns = ", ".join(f"{key} = ?" for key in fields)
+        with self._connect() as db:
+            db.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def finish(self, job_id: str, status: str, **fields: Any) -> None:
+        # 이미 끝난 작업의 상태는 덮어쓰지 않는다 (취소와 완료가 겹치는 경우)
+        fields["updated"] = time.time()
+        columns = ", ".join(f"{key} = ?" for key in fields)
+        with self._connect() as db:
+            db.execute(
+                f"UPDATE jobs SET status = ?, {columns} WHERE id = ? AND status NOT IN (?, ?, ?)",
+                (status, *fields.values(), job_id, *TERMINAL_STATES),
+            )
+
+    def transition(self, job_id: str, current: str, new: str) -> bool:
+        """Atomically move a job from ``current`` to ``new``; False if it was not in ``current``."""
+        with self._connect() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET status = ?, updated = ? WHERE id = ? AND status = ?",
+                (new, time.time(), job_id, current),
+            )
+        return cursor.rowcount == 1
+
+    def cancel_requested(self, job_id: str) -> bool:
+        with self._connect() as db:
+            row = db.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row["cancel_requested"])
+
+
+def profile_job(payload: dict[str, Any], progress: Progress) -> dict[str, Any]:
+    profiler = StreamingProfiler(batch_size=payload.get("batch_size", DEFAULT_BATCH_SIZE))
+    # 작업 경로도 API 와 같은 데이터 루트 안으로 제한 (작업 프로세스는 POLARIS_DATA_ROOT 를 물려받는다)
+    source = DatasetSource.from_dict({key: payload.get(key) for key in ("path", "columns", "filters")}, root=DATA_ROOT)
+
+    def report(fraction: float) -> None:
+        progress(fraction, {"rows": profiler.rows})
+
+    files = source.files()
+    if source.format == "csv" and len(files) == 1 and not source.scoped:
+        # 단일 CSV 는 읽은 바이트로 진행률을 추정한다
+        profiler.profile_csv(files[0], report)
+    else:
+        # Parquet/IPC 의 전체 행 수는 메타데이터로 바로 알 수 있다 (그 외에는 완료 시점에만 진행률이 오른다)
+        native = source.format in NATIVE_HIVE_FORMATS and not source.filters
+        total_rows = source.scan().select(pl.len()).collect().item() if native else None
+        profiler.profile_frame(source.scan(), report, total_rows=total_rows)
+    return {"rows": profiler.rows, "columns": profiler.summary().to_dicts()}
+
+
+def eda_job(payload: dict[str, Any], progress: Progress) -> dict[str, Any]:
+    keys = ("lazy", "sections", "rules", "method", "correlation", "columns", "filters")
+    options = {key: payload[key] for key in keys if key in payload}
+    total = len(payload.get("sections") or EDAEngine.SECTIONS)
+    done: list[str] = []
+
+    def section_done(run: SectionRun) -> None:
+        done.append(run.name)
+        progress(len(done) / total, {"sections": done})
+
+    cache = ResultCache(RESULT_CACHE_DIR)
+    profile = profile_path(payload["path"], result_cache=cache, root=DATA_ROOT, on_section=section_done, **options)
+    return profile.to_dict()
+
+
+def pipeline_job(payload: dict[str, Any], progress: Progress) -> dict[str, Any]:
+    nodes = [PipelineNode(node["id"], node.get("type"), node.get("data") or {}) for node in payload["nodes"]]
+    plan = compile_pipeline(nodes, [(edge["source"], edge["target"]) for edge in payload["edges"]])
+    # 출력 파일은 collect_all 한 번으로 쓰므로 취소는 실행 전에만 확인한다 (쓰기 도중에는 멈출 수 없다)
+    progress(0.1, {"outputs": plan.paths})
+    return {"outputs": plan.run()}
+
+
+def quality_job(payload: dict[str, Any], progress: Progress) -> dict[str, Any]:
+    rule_set = RuleSet.from_dicts(payload.get("rules", []), payload.get("sample_size", DEFAULT_SAMPLE_SIZE))
+    source = DatasetSource.from_dict({key: payload.get(key) for key in ("path", "columns", "filters")}, root=DATA_ROOT)
+    lf = source.scan()
+    progress(0.1, None)
+    report = rule_set.evaluate(lf)
+    # 평가 중에 들어온 취소 요청은 결과를 버리는 것으로 처리한다
+    progress(1.0, None)
+    return report.to_dict()
+
+
+JOB_TYPES: dict[str, JobFunction] = {
+    "profile": profile_job,
+    "eda": eda_job,
+    "pipeline": pipeline_job,
+    "quality": quality_job,
+}
+
+
+def execute_job(db_path: str, job_id: str, function: JobFunction) -> None:
+    """Worker process entry point: run ``function`` and record progress and the outcome."""
+    store = JobStore(db_path)
+    if not store.transition(job_id, "queued", "running"):
+        return  # 시작 전에 취소됨
+
+    def progress(fraction: float, partial: dict[str, Any] | None = None) -> None:
+        # 취소는 협조적으로 처리: 진행률을 보고하는 시점에 요청 여부를 확인한다
+        if store.cancel_requested(job_id):
+            raise JobCancelled
+        store.update(job_id, progress=min(max(fraction, 0.0), 1.0), partial=partial)
+
+    try:
+        result = function(store.payload(job_id), progress)
+    except JobCancelled:
+        store.finish(job_id, "cancelled")
+    except Exception as error:
+        store.finish(job_id, "failed", error=f"{type(error).__name__}: {error}")
+    else:
+        store.finish(job_id, "succeeded", progress=1.0, result=json.dumps(result, default=str))
+
+
+class JobManager:
+    """Submits jobs to a bounded process pool; status and results live in the ``JobStore``."""
+
+    def __init__(
+        self, store: JobStore, max_workers: int = MAX_WORKERS, job_types: dict[str, JobFunction] | None = None
+    ):
+        self.store = store
+        self.max_workers = max_workers
+        self.job_types = JOB_TYPES if job_types is None else job_types
+        self._executor: ProcessPoolExecutor | None = None
+        self._futures: dict[str, Future[None]] = {}
+        # 완료 콜백은 실행기의 스레드에서 불리므로 _futures 는 잠금 아래에서만 바꾼다
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Polars 스레드 풀은 fork 후 자식에서 교착될 수 있어 spawn 으로 띄운다
+            context = multiprocessing.get_context("spawn")
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        return self._executor
+
+    def submit(self, kind: str, payload: dict[str, Any]) -> str:
+        if kind not in self.job_types:
+            raise ValueError(f"unknown job kind {kind!r}; expected one of {list(self.job_types)}")
+        job_id = self.store.create(kind, payload)
+        future = self.executor.submit(execute_job, self.store.path, job_id, self.job_types[kind])
+        with self._lock:
+            self._futures[job_id] = future
+        future.add_done_callback(lambda done: self._finished(job_id, done))
+        return job_id
+
+    def _finished(self, job_id: str, future: Future[None]) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+        if future.cancelled():
+            self.store.finish(job_id, "cancelled")
+        elif future.exception() is not None:
+            # 작업 프로세스가 비정상 종료된 경우 (BrokenProcessPool 등)
+            self.store.finish(job_id, "failed", error=f"worker crashed: {future.exception()!r}")
+
+    def cancel(self, job_id: str) -> dict[str, Any] | None:
+        """Drop a queued job immediately; ask a running one to stop at its next progress report."""
+        job = self.store.get(job_id)
+        if job is None or job["status"] in TERMINAL_STATES:
+            return job
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None:
+            future.cancel()  # 아직 작업 프로세스로 넘어가지 않았다면 제출 자체를 취소
+        # 대기 중이던 작업은 바로 취소되고, 작업 프로세스가 집어 들어도 실행하지 않는다
+        if not self.store.transition(job_id, "queued", "cancelled"):
+            self.store.update(job_id, cancel_requested=1)
+        return self.store.get(job_id)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
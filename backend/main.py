@@ -1,8 +1,75 @@
-from fastapi import FastAPI
+import asyncio
+import json
+import os
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Any, Literal
+
+import polars as pl
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Query, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-app = FastAPI()
+from graph import GraphAnalysis, GraphEdit, GraphSessions, GraphUpdate, IncrementalGraph, analyze_graph
+from jobs import TERMINAL_STATES, JobManager, JobStore
+from pipeline import PipelineError, PipelineNode, compile_pipeline
+from polaris.cache import RESULT_CACHE_DIR, ResultCache
+from polaris.ingest import spill_upload
+from polaris.profile import profile_path
+from polaris.quality import DEFAULT_SAMPLE_SIZE, RuleSet, rule_from_dict
+from polaris.sampling import DEFAULT_ROW_BUDGET, DEFAULT_SEED
+from polaris.source import DATA_ROOT, DatasetSource
+
+# SSE 스트림이 작업 상태를 다시 읽는 간격 (초)
+JOB_POLL_INTERVAL = 0.25
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+@lru_cache(maxsize=1)
+def get_job_manager() -> JobManager:
+    return JobManager(JobStore())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    if get_job_manager.cache_info().currsize:
+        get_job_manager().shutdown()
+
+
+JobManagerDep = Annotated[JobManager, Depends(get_job_manager)]
+
+
+@lru_cache(maxsize=1)
+def get_result_cache() -> ResultCache:
+    # 디스크 계층은 Streamlit 앱, 작업 프로세스와 같은 디렉터리를 공유
+    return ResultCache(RESULT_CACHE_DIR)
+
+
+ResultCacheDep = Annotated[ResultCache, Depends(get_result_cache)]
+
+
+@lru_cache(maxsize=1)
+def get_graph_sessions() -> GraphSessions:
+    return GraphSessions()
+
+
+GraphSessionsDep = Annotated[GraphSessions, Depends(get_graph_sessions)]
+
+
+def get_data_root() -> str:
+    # 요청으로 받은 데이터셋 경로는 이 디렉터리 기준으로 풀고, 밖을 가리키면 403
+    return DATA_ROOT
+
+
+DataRootDep = Annotated[str, Depends(get_data_root)]
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS configuration
 origins = [
@@ -14,65 +81,342 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
-    allow_methods=["GET", "POST"],
+    allow_methods=["GET", "POST", "DELETE"],
     allow_headers=["*"],
 )
 
+
 class Node(BaseModel):
     id: str
+    # React Flow 노드의 종류(Input, Filter, Output, text)와 설정값
+    type: str | None = None
+    data: dict[str, Any] = {}
+
 
 class Edge(BaseModel):
     source: str
     target: str
 
+
 class PipelineData(BaseModel):
     nodes: list[Node]
     edges: list[Edge]
 
-def is_cyclic_util(
-    v: int, 
-    visited: dict[int, bool], 
-    rec_stack: dict[int, bool], 
-    graph: dict[int, list[int]]
-) -> bool:
-    visited[v] = True
-    rec_stack[v] = True
-
-    for neighbor in graph[v]:
-        if not visited[neighbor]:
-            if is_cyclic_util(neighbor, visited, rec_stack, graph):
-                return True
-        elif rec_stack[neighbor]:
-            return True
-
-    rec_stack[v] = False
-    return False
 
-def check_if_dag(nodes: list[Node], edges: list[Edge]) -> bool:
-    graph: dict[int, list[int]] = {int(node.id): [] for node in nodes}  # str → int 변환
-    for edge in edges:
-        graph[int(edge.source)].append(int(edge.target))  # str → int 변환
+def analyze_pipeline(nodes: list[Node], edges: list[Edge]) -> GraphAnalysis:
+    return analyze_graph([node.id for node in nodes], [(edge.source, edge.target) for edge in edges])
 
-    visited: dict[int, bool] = {int(node.id): False for node in nodes}  # str → int 변환
-    rec_stack: dict[int, bool] = {int(node.id): False for node in nodes}
 
-    for node in nodes:
-        if not visited[int(node.id)]:
-            if is_cyclic_util(int(node.id), visited, rec_stack, graph):
-                return False
+def check_if_dag(nodes: list[Node], edges: list[Edge]) -> bool:
+    return analyze_pipeline(nodes, edges).is_dag
 
-    return True  # 반환값 추가 (mypy 오류 해결)
 
-@app.post('/pipelines/parse')
+@app.post("/pipelines/parse")
 def parse_pipeline(pipeline: PipelineData) -> dict:
     nodes = pipeline.nodes
     edges = pipeline.edges
 
     num_nodes = len(nodes)
     num_edges = len(edges)
-    is_dag = check_if_dag(nodes, edges)
+    analysis = analyze_pipeline(nodes, edges)
+
+    return {
+        "num_nodes": num_nodes,
+        "num_edges": num_edges,
+        "is_dag": analysis.is_dag,
+        "order": analysis.order,
+        "cycle": analysis.cycle,
+        "dangling_edges": [{"source": source, "target": target} for source, target in analysis.dangling_edges],
+    }
+
+
+class GraphEditModel(BaseModel):
+    op: Literal["add_node", "remove_node", "update_node", "add_edge", "remove_edge"]
+    id: str | None = None
+    source: str | None = None
+    target: str | None = None
+
+
+class GraphEdits(BaseModel):
+    edits: list[GraphEditModel]
+
+
+def _graph_or_404(sessions: GraphSessions, session_id: str) -> IncrementalGraph:
+    graph = sessions.get(session_id)
+    if graph is None:
+        raise HTTPException(status_code=404, detail=f"graph session not found: {session_id}")
+    return graph
+
+
+def _graph_update(session_id: str, graph: IncrementalGraph, update: GraphUpdate) -> dict:
+    # 전체 순서 대신 순위가 바뀐 노드만 돌려준다 (클라이언트는 순위로 정렬해 순서를 갱신)
+    return {
+        "session_id": session_id,
+        "num_nodes": len(graph),
+        "num_edges": graph.num_edges,
+        "is_dag": not update.cycles,
+        "cycle": update.cycles[0] if update.cycles else [],
+        "rejected_edges": [{"source": cycle[0], "target": cycle[1], "cycle": cycle} for cycle in update.cycles],
+        "dangling_edges": [{"source": source, "target": target} for source, target in update.dangling_edges],
+        "ranks": update.ranks,
+        "stale": update.stale,
+    }
+
+
+@app.post("/pipelines/sessions", status_code=201)
+def create_graph_session(pipeline: PipelineData, sessions: GraphSessionsDep) -> dict:
+    """Start an editing session from the current pipeline; later changes are sent as deltas."""
+    graph, update = IncrementalGraph.build(
+        [node.id for node in pipeline.nodes], [(edge.source, edge.target) for edge in pipeline.edges]
+    )
+    session_id = uuid.uuid4().hex
+    sessions.add(session_id, graph)
+    return {**_graph_update(session_id, graph, update), "order": graph.order()}
+
+
+@app.post("/pipelines/sessions/{session_id}/edits")
+def edit_graph_session(session_id: str, request: GraphEdits, sessions: GraphSessionsDep) -> dict:
+    """Apply node/edge deltas in order; edges that would close a cycle are rejected and reported."""
+    graph = _graph_or_404(sessions, session_id)
+    try:
+        # 일부만 적용되지 않도록 전부 검증한 뒤에 적용
+        edits = [GraphEdit(**edit.model_dump()) for edit in request.edits]
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error)) from error
+    with graph.lock:
+        return _graph_update(session_id, graph, graph.apply(edits))
+
+
+@app.get("/pipelines/sessions/{session_id}")
+def graph_session(session_id: str, sessions: GraphSessionsDep) -> dict:
+    graph = _graph_or_404(sessions, session_id)
+    with graph.lock:
+        return {
+            "session_id": session_id,
+            "num_nodes": len(graph),
+            "num_edges": graph.num_edges,
+            "is_dag": graph.is_dag(),
+            "order": graph.order(),
+            "edges": [{"source": source, "target": target} for source, target in graph.edges()],
+        }
+
+
+@app.get("/pipelines/sessions/{session_id}/nodes/{node_id}")
+def graph_session_node(session_id: str, node_id: str, sessions: GraphSessionsDep) -> dict:
+    """Reachability of one node: everything upstream and downstream of it, in topological order."""
+    graph = _graph_or_404(sessions, session_id)
+    with graph.lock:
+        if node_id not in graph:
+            raise HTTPException(status_code=404, detail=f"node not found: {node_id}")
+        return {
+            "id": node_id,
+            "rank": graph.rank[node_id],
+            "ancestors": graph.ancestors(node_id),
+            "descendants": graph.descendants(node_id),
+        }
+
+
+@app.delete("/pipelines/sessions/{session_id}", status_code=204)
+def delete_graph_session(session_id: str, sessions: GraphSessionsDep) -> Response:
+    if not sessions.remove(session_id):
+        raise HTTPException(status_code=404, detail=f"graph session not found: {session_id}")
+    return Response(status_code=204)
+
+
+class PipelineRun(PipelineData):
+    # True 면 실행하지 않고 최적화된 실행 계획만 돌려준다
+    dry_run: bool = False
+
+
+@app.post("/pipelines/run")
+def run_pipeline(pipeline: PipelineRun, data_root: DataRootDep) -> dict:
+    try:
+        plan = compile_pipeline(
+            [PipelineNode(node.id, node.type, node.data) for node in pipeline.nodes],
+            [(edge.source, edge.target) for edge in pipeline.edges],
+            data_root=data_root,
+        )
+        if pipeline.dry_run:
+            return {"outputs": plan.paths, "plan": plan.explain()}
+        outputs = plan.run()
+    except PermissionError as error:
+        raise HTTPException(status_code=403, detail="access to this dataset path is not allowed") from error
+    except FileNotFoundError as error:
+        raise HTTPException(status_code=404, detail="dataset not found") from error
+    except (PipelineError, pl.exceptions.PolarsError) as error:
+        raise HTTPException(status_code=422, detail=str(error)) from error
+    return {"outputs": outputs}
+
+
+class QualityRule(BaseModel):
+    type: str
+    column: str
+    name: str | None = None
+    min: float | None = None
+    max: float | None = None
+    pattern: str | None = None
+    full_match: bool | None = None
+    values: list[str | int | float | bool] | None = None
+    max_age_days: float | None = None
+    now: datetime | None = None
+    op: str | None = None
+    other: str | None = None
+    value: str | int | float | bool | None = None
+
+
+class QualityRequest(BaseModel):
+    path: str
+    rules: list[QualityRule]
+    sample_size: int = DEFAULT_SAMPLE_SIZE
+    # 읽을 컬럼과 행 필터 (규칙과 같은 형식): 스캔 단계로 내려가 나머지는 읽지 않는다
+    columns: list[str] | None = None
+    filters: list[QualityRule] = []
+
+
+@app.post("/quality/evaluate")
+def evaluate_quality(request: QualityRequest, data_root: DataRootDep) -> dict:
+    try:
+        specs = [rule.model_dump(exclude_none=True) for rule in request.rules]
+        rule_set = RuleSet.from_dicts(specs, request.sample_size)
+        source = DatasetSource(
+            request.path,
+            columns=tuple(request.columns) if request.columns else None,
+            filters=tuple(rule_from_dict(rule.model_dump(exclude_none=True)) for rule in request.filters),
+            root=data_root,
+        )
+        report = rule_set.evaluate(source.scan())
+    except PermissionError as error:
+        # 요청한 경로는 응답에 되풀이하지 않는다
+        raise HTTPException(status_code=403, detail="access to this dataset path is not allowed") from error
+    except FileNotFoundError as error:
+        raise HTTPException(status_code=404, detail="dataset not found") from error
+    except (ValueError, TypeError, pl.exceptions.PolarsError) as error:
+        # 잘못된 규칙(없는 컬럼, 타입 불일치 등)은 클라이언트 오류로 돌려준다
+        raise HTTPException(status_code=422, detail=str(error)) from error
+    return report.to_dict()
+
+
+@app.post("/profile", response_model=None)
+def profile_dataset(
+    result_cache: ResultCacheDep,
+    data_root: DataRootDep,
+    file: Annotated[UploadFile | None, File(description="dataset upload (multipart)")] = None,
+    path: Annotated[str | None, Form(description="dataset path on the server")] = None,
+    rules: Annotated[str | None, Form(description="JSON list of data quality rules")] = None,
+    format: Annotated[str, Query(pattern="^(json|arrow)$")] = "json",
+    sections: Annotated[str | None, Query(description="comma-separated section names")] = None,
+    columns: Annotated[str | None, Query(description="comma-separated columns to read")] = None,
+    filters: Annotated[str | None, Form(description="JSON list of row filters (rule specs)")] = None,
+    lazy: bool | None = None,
+    method: str = "exact",
+    correlation: str = "pearson",
+    row_budget: int = DEFAULT_ROW_BUDGET,
+    seed: int = DEFAULT_SEED,
+) -> dict | Response:
+    """Profile an uploaded or server-side dataset without a browser session.
+
+    ``format=json`` returns every section summary, the column metrics and the
+    quality results; ``format=arrow`` returns the column metrics table as an
+    Arrow IPC stream. ``path`` is resolved inside the data root
+    (``POLARIS_DATA_ROOT``) and may be a directory or glob (e.g. hive-partitioned
+    Parquet); ``columns`` and ``filters`` are pushed down to the scan.
+    """
+    if (file is None) == (path is None):
+        raise HTTPException(status_code=422, detail="send exactly one of 'file' or 'path'")
+    spilled = None
+    try:
+        if file is not None:
+            # 업로드는 청크 단위로 임시 파일에 옮겨 두고 Polars 가 경로로 읽는다
+            suffix = os.path.splitext(file.filename or "")[1] or ".csv"
+            spilled = spill_upload(file.file, suffix=suffix)
+        profile = profile_path(
+            spilled or str(path),
+            lazy=lazy,
+            result_cache=result_cache,
+            sections=sections.split(",") if sections else None,
+            rules=json.loads(rules) if rules else None,
+            columns=columns.split(",") if columns else None,
+            filters=json.loads(filters) if filters else None,
+            method=method,
+            correlation=correlation,
+            row_budget=row_budget,
+            seed=seed,
+            root=None if spilled else data_root,
+        )
+    except PermissionError as error:
+        raise HTTPException(status_code=403, detail="access to this dataset path is not allowed") from error
+    except FileNotFoundError as error:
+        raise HTTPException(status_code=404, detail="dataset not found") from error
+    except (ValueError, TypeError, pl.exceptions.PolarsError) as error:
+        raise HTTPException(status_code=422, detail=str(error)) from error
+    finally:
+        if spilled is not None:
+            os.remove(spilled)
+    if format == "arrow":
+        return Response(content=profile.to_ipc(), media_type=ARROW_STREAM_MEDIA_TYPE)
+    return profile.to_dict()
+
+
+class JobRequest(BaseModel):
+    kind: str
+    payload: dict[str, Any] = {}
+
+
+def _job_or_404(jobs: JobManager, job_id: str) -> dict[str, Any]:
+    job = jobs.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"job not found: {job_id}")
+    return job
+
+
+@app.post("/jobs", status_code=202)
+def submit_job(request: JobRequest, jobs: JobManagerDep) -> dict:
+    try:
+        job_id = jobs.submit(request.kind, request.payload)
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error)) from error
+    return _job_or_404(jobs, job_id)
+
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str, jobs: JobManagerDep) -> dict:
+    return _job_or_404(jobs, job_id)
+
+
+@app.post("/jobs/{job_id}/cancel")
+def cancel_job(job_id: str, jobs: JobManagerDep) -> dict:
+    job = jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"job not found: {job_id}")
+    return job
+
+
+@app.get("/jobs/{job_id}/result")
+def job_result(job_id: str, jobs: JobManagerDep) -> dict:
+    job = _job_or_404(jobs, job_id)
+    if job["status"] != "succeeded":
+        # 아직 실행 중이거나 실패/취소된 작업: 상태와 함께 409
+        raise HTTPException(status_code=409, detail={"status": job["status"], "error": job["error"]})
+    return jobs.store.result(job_id) or {}
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str, jobs: JobManagerDep) -> StreamingResponse:
+    """Server-sent events with the job's progress and partial results until it finishes."""
+    await run_in_threadpool(_job_or_404, jobs, job_id)
 
-    print("Nodes:", nodes)
-    print("Edges:", edges)
+    async def stream() -> AsyncIterator[str]:
+        last_update = None
+        while True:
+            job = await run_in_threadpool(jobs.store.get, job_id)
+            if job is None:
+                return
+            if job["updated"] != last_update:
+                last_update = job["updated"]
+                event = "end" if job["status"] in TERMINAL_STATES else "progress"
+                yield f"event: {event}\ndata: {json.dumps(job)}\n\n"
+                if event == "end":
+                    return
+            await asyncio.sleep(JOB_POLL_INTERVAL)
 
-    return {'num_nodes': num_nodes, 'num_edges': num_edges, 'is_dag': is_dag}
\ No newline at end of file
+    return StreamingResponse(stream(), media_type="text/event-stream")
@@ -0,0 +1,199 @@
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+import polars as pl
+
+from graph import analyze_graph
+from polaris.ingest import CSV_READ_OPTIONS
+from polaris.quality import COMPARE_OPS
+from polaris.source import DATA_ROOT, DatasetSource
+
+# 실행 결과 파일을 쓰는 위치 (Output 노드의 파일 이름은 이 디렉터리 안으로만 쓴다)
+OUTPUT_DIR = os.environ.get("POLARIS_PIPELINE_OUTPUT_DIR", os.path.join(os.path.expanduser("~"), ".polaris", "outputs"))
+OUTPUT_FORMATS = {"csv": ".csv", "parquet": ".parquet"}
+# Input 노드가 URL 로 읽을 수 있는 원격 스킴과 호스트 (호스트 목록이 비어 있으면 원격 읽기 없음)
+REMOTE_SCHEMES = ("https", "s3", "gs")
+REMOTE_HOSTS = tuple(
+    host.strip().lower() for host in os.environ.get("POLARIS_REMOTE_HOSTS", "").split(",") if host.strip()
+)
+# 데이터가 흐르지 않는 노드 (캔버스 메모용)
+PASSIVE_NODE_TYPES = {"text"}
+
+
+class PipelineError(ValueError):
+    """The graph cannot be compiled: a cycle, a dangling edge or an invalid node configuration."""
+
+
+@dataclass
+class PipelineNode:
+    id: str
+    type: str | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Stage:
+    """A node's lowered plan: a base ``LazyFrame`` plus filters not applied yet.
+
+    Filters along a linear chain accumulate here and are applied as one
+    predicate, so a chain of Filter nodes becomes a single ``filter``.
+    """
+
+    plan: pl.LazyFrame
+    predicates: list[pl.Expr] = field(default_factory=list)
+    _frame: pl.LazyFrame | None = None
+
+    def frame(self) -> pl.LazyFrame:
+        # 여러 하위 노드가 같은 LazyFrame 객체를 공유해야 공통 부분 계획으로 한 번만 실행된다
+        if self._frame is None:
+            self._frame = self.plan.filter(pl.all_horizontal(self.predicates)) if self.predicates else self.plan
+        return self._frame
+
+
+@dataclass
+class PipelinePlan:
+    # Output 노드 ID -> sink 계획 / 결과 파일 경로
+    sinks: dict[str, pl.LazyFrame]
+    paths: dict[str, str]
+
+    def explain(self) -> str:
+        """The optimized plan of all outputs together, shared subplans shown as ``CACHE``."""
+        if not self.sinks:
+            return ""
+        return pl.explain_all(list(self.sinks.values()))
+
+    def run(self) -> dict[str, str]:
+        """Execute every output in one ``collect_all``: shared inputs are scanned once and
+        independent branches run concurrently on the Polars thread pool."""
+        if self.sinks:
+            for path in self.paths.values():
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            pl.collect_all(list(self.sinks.values()))
+        return self.paths
+
+
+def _setting(node: PipelineNode, *keys: str) -> str:
+    for key in keys:
+        value = node.data.get(key)
+        if value not in (None, ""):
+            return str(value)
+    raise PipelineError(f"{node.type} node {node.id} is missing {keys[0]!r}")
+
+
+def scan_source(location: str, data_root: str | None = None) -> pl.LazyFrame:
+    """Scan a file, directory or glob inside ``data_root`` (reader picked by extension) or an allowed remote URL.
+
+    Remote URLs must use one of ``REMOTE_SCHEMES`` and a host listed in
+    ``POLARIS_REMOTE_HOSTS``; anything else raises ``PermissionError``.
+    """
+    url = urlparse(location)
+    if not url.scheme:
+        return DatasetSource(location, root=data_root or DATA_ROOT).scan()
+    if url.scheme.lower() not in REMOTE_SCHEMES or (url.hostname or "").lower() not in REMOTE_HOSTS:
+        # file:// 이나 내부망 주소로 서버가 대신 요청을 보내지 않도록 허용 목록만 읽는다
+        raise PermissionError("remote source is not in the allowed schemes and hosts")
+    suffix = os.path.splitext(url.path)[1].lower()
+    if suffix == ".parquet":
+        return pl.scan_parquet(location)
+    if suffix in (".arrow", ".ipc", ".feather"):
+        return pl.scan_ipc(location)
+    return pl.scan_csv(location, **CSV_READ_OPTIONS)
+
+
+def filter_predicate(node: PipelineNode, schema: pl.Schema) -> pl.Expr:
+    column = _setting(node, "column")
+    op = node.data.get("operator") or "=="
+    if column not in schema:
+        raise PipelineError(f"filter node {node.id}: unknown column {column!r}")
+    if op not in COMPARE_OPS:
+        raise PipelineError(f"filter node {node.id}: operator must be one of {list(COMPARE_OPS)}, got {op!r}")
+    # 값이 없으면 null 과 비교해 조용히 빈 결과가 되므로 컬럼·연산자와 같이 실행 전에 거부한다
+    if node.data.get("value") is None:
+        raise PipelineError(f"{node.type} node {node.id} is missing 'value'")
+    # UI 는 값을 문자열로 보내므로 컬럼 타입으로 미리 변환해 두면 잘못된 값이 실행 전에 드러난다
+    try:
+        value = pl.Series([node.data.get("value")]).cast(schema[column], strict=True)
+    except pl.exceptions.PolarsError as error:
+        raise PipelineError(f"filter node {node.id}: {node.data.get('value')!r} is not a {schema[column]}") from error
+    return COMPARE_OPS[op](pl.col(column), pl.lit(value.item(), dtype=schema[column]))
+
+
+def output_path(node: PipelineNode, output_dir: str) -> str:
+    fmt = str(node.data.get("format") or "CSV").lower()
+    if fmt not in OUTPUT_FORMATS:
+        raise PipelineError(f"output node {node.id}: format must be one of {list(OUTPUT_FORMATS)}, got {fmt!r}")
+    name = os.path.basename(node.data.get("fileName") or node.id)
+    if not name.lower().endswith(OUTPUT_FORMATS[fmt]):
+        name += OUTPUT_FORMATS[fmt]
+    return os.path.join(output_dir, name)
+
+
+def compile_pipeline(
+    nodes: Sequence[PipelineNode],
+    edges: Sequence[tuple[str, str]],
+    output_dir: str | None = None,
+    data_root: str | None = None,
+) -> PipelinePlan:
+    """Lower a validated pipeline graph into one lazy plan per Output node.
+
+    Input nodes become scans, Filter nodes predicates and Output nodes sinks;
+    several inputs into one node are concatenated. Nodes that feed no Output
+    are never executed. Input paths are confined to ``data_root``
+    (``POLARIS_DATA_ROOT`` by default).
+    """
+    output_dir = output_dir or OUTPUT_DIR
+    active = {node.id: node for node in nodes if node.type not in PASSIVE_NODE_TYPES}
+    flow = [(source, target) for source, target in edges if source in active or target in active]
+    analysis = analyze_graph(list(active), flow)
+    if analysis.dangling_edges:
+        raise PipelineError(f"edges reference unknown or non-data nodes: {analysis.dangling_edges}")
+    if not analysis.is_dag:
+        raise PipelineError(f"pipeline has a cycle: {' -> '.join(analysis.cycle)}")
+
+    parents: dict[str, list[str]] = {node_id: [] for node_id in active}
+    consumers: dict[str, int] = dict.fromkeys(active, 0)
+    for source, target in flow:
+        parents[target].append(source)
+        consumers[source] += 1
+
+    stages: dict[str, Stage] = {}
+    sinks: dict[str, pl.LazyFrame] = {}
+    paths: dict[str, str] = {}
+    for node_id in analysis.order:
+        node = active[node_id]
+        kind = (node.type or "").lower()
+        if kind == "input":
+            if parents[node_id]:
+                raise PipelineError(f"input node {node_id} cannot have incoming edges")
+            stages[node_id] = Stage(scan_source(_setting(node, "path", "url"), data_root))
+            continue
+        if not parents[node_id]:
+            raise PipelineError(f"{node.type} node {node_id} has no input")
+        upstream = [stages[parent] for parent in parents[node_id]]
+        if len(upstream) == 1:
+            stage = upstream[0]
+        else:
+            stage = Stage(pl.concat([parent.frame() for parent in upstream], how="diagonal_relaxed"))
+        if kind == "filter":
+            predicate = filter_predicate(node, stage.plan.collect_schema())
+            if len(upstream) == 1 and consumers[parents[node_id][0]] == 1:
+                # 선형 체인: 앞 노드의 술어에 이어 붙여 하나의 filter 로 합친다
+                stages[node_id] = Stage(stage.plan, [*stage.predicates, predicate])
+            else:
+                stages[node_id] = Stage(stage.frame(), [predicate])
+        elif kind == "output":
+            path = output_path(node, output_dir)
+            if path in paths.values():
+                raise PipelineError(f"output node {node_id} writes to the same file as another output: {path}")
+            frame = stage.frame()
+            if path.endswith(".parquet"):
+                sinks[node_id] = frame.sink_parquet(path, lazy=True)
+            else:
+                sinks[node_id] = frame.sink_csv(path, lazy=True)
+            paths[node_id] = path
+        else:
+            raise PipelineError(f"node {node_id} has unsupported type {node.type!r}")
+    return PipelinePlan(sinks, paths)
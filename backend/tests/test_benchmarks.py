@@ -0,0 +1,53 @@
+import pytest
+
+from benchmarks.dag_validation import over_budget, run
+from benchmarks.profile_suite import SHAPES, compare, make_dataset, run_suite
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_synthetic_datasets_are_deterministic(shape: str) -> None:
+    """같은 행 수와 시드면 같은 데이터셋이 만들어진다"""
+    df = make_dataset(shape, 300)
+    assert df.equals(make_dataset(shape, 300))
+    assert not df.equals(make_dataset(shape, 300, seed=7))
+
+
+def test_compare_flags_only_regressions_above_threshold_and_noise_floor() -> None:
+    """임계 비율과 잡음 하한을 모두 넘는 경우만 회귀로 보고"""
+    baseline = {
+        "results": {
+            "eda/a": {"seconds": 1.0, "peak_mb": 100.0},
+            "eda/b": {"seconds": 0.01, "peak_mb": None},
+            "eda/c": {"seconds": 1.0, "peak_mb": 100.0},
+        }
+    }
+    current = {
+        "results": {
+            "eda/a": {"seconds": 1.5, "peak_mb": 110.0},
+            "eda/b": {"seconds": 0.04, "peak_mb": 5.0},
+            "eda/c": {"seconds": 1.1, "peak_mb": 200.0},
+            "eda/new": {"seconds": 9.0, "peak_mb": 1.0},
+        }
+    }
+    regressions = compare(current, baseline, threshold=0.25)
+    assert [(r["case"], r["metric"]) for r in regressions] == [("eda/a", "seconds"), ("eda/c", "peak_mb")]
+
+
+def test_run_suite_covers_sections_metrics_and_dag() -> None:
+    """모든 EDA 섹션, 품질 지표, DAG 검사가 결과에 포함된다"""
+    report = run_suite(rows=200, graph_nodes=50, repeat=1, lazy=False, shapes=["tall_narrow"], log=lambda *_: None)
+    results = report["results"]
+    assert "eda/tall_narrow/feature_importance" in results
+    assert "quality/tall_narrow/assess_data_quality" in results
+    assert {"dag/random", "dag/chain", "dag/cycle"} <= set(results)
+    assert all(result["seconds"] >= 0 for result in results.values())
+    assert compare(report, report) == []
+
+
+def test_dag_validation_stays_within_budget() -> None:
+    """10만 노드 그래프의 검사는 모든 형태에서 예산 안에 끝나고, 넘으면 그 형태를 보고한다"""
+    results = run(nodes=100_000, edges=100_000, repeat=1)
+    assert results["random"]["is_dag"] and results["chain"]["is_dag"]
+    assert not results["cycle"]["is_dag"]
+    assert over_budget(results, budget_s=2.0) == []
+    assert over_budget(results, budget_s=0.0) == ["random", "chain", "cycle"]
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from polaris.correlation import CorrelationAccumulator, correlate, heatmap_columns, top_pairs
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    rng = np.random.default_rng(0)
+    base = rng.normal(0, 1, 3_000)
+    df = pl.DataFrame(
+        {
+            "a": 1e6 + base,
+            "b": -2 * base + rng.normal(0, 0.5, 3_000),
+            "c": np.exp(base) + rng.normal(0, 0.1, 3_000),
+            "d": rng.normal(0, 1, 3_000),
+        }
+    )
+    # 컬럼마다 다른 위치의 결측으로 쌍별 완전 사례를 확인한다
+    missing = rng.random((3_000, 4)) < 0.1
+    return df.with_columns(
+        pl.when(pl.Series(missing[:, i])).then(None).otherwise(pl.col(col)).alias(col)
+        for i, col in enumerate(df.columns)
+    )
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_batched_correlation_matches_pandas(frame: pl.DataFrame, method: str) -> None:
+    """배치로 누적한 상관행렬이 pandas 와 같다 (Pearson 은 결측을 쌍별로 처리한 결과까지)"""
+    if method == "spearman":
+        # 순위는 컬럼별로 한 번만 매기므로 쌍마다 다시 매기는 pandas 와는 결측이 없을 때만 같다
+        frame = frame.drop_nulls()
+    expected = pd.DataFrame(frame.to_dict(as_series=False)).corr(method=method).to_numpy()
+    for data, batch_size in ((frame, 700), (frame.lazy(), 500)):
+        assert correlate(data, frame.columns, method, batch_size=batch_size) == pytest.approx(expected, abs=1e-9)
+    with pytest.raises(ValueError, match="method"):
+        correlate(frame, frame.columns, "kendall")
+
+
+def test_accumulators_merge_across_different_shifts(frame: pl.DataFrame) -> None:
+    """서로 다른 기준점으로 누적한 두 누적기를 합치면 전체를 한 번에 누적한 결과와 같다"""
+    values = frame.to_numpy()
+    whole, left, right = (CorrelationAccumulator(frame.columns) for _ in range(3))
+    whole.update(values)
+    left.update(values[:1_000])
+    right.update(values[1_000:])
+    assert left.merge(right).result() == pytest.approx(whole.result(), abs=1e-9)
+    assert CorrelationAccumulator(frame.columns).merge(whole).result() == pytest.approx(whole.result())
+
+
+def test_top_pairs_and_heatmap_columns(frame: pl.DataFrame) -> None:
+    """가장 강한 쌍부터 고르고, 컬럼이 많으면 상관이 강한 컬럼만 히트맵에 남긴다"""
+    corr = correlate(frame, frame.columns)
+    pairs = top_pairs(corr, frame.columns, k=2)
+    assert list(zip(pairs["left"], pairs["right"], strict=True)) == [("a", "b"), ("a", "c")]
+    assert pairs["correlation"][0] < 0
+
+    selected = heatmap_columns(corr, frame.columns, max_columns=3)
+    assert sorted(selected) == [0, 1, 2]
+    assert sorted(heatmap_columns(corr, frame.columns)) == [0, 1, 2, 3]
@@ -0,0 +1,114 @@
+import io
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from polaris.cache import DatasetCache
+
+
+def test_slow_load_blocks_only_its_own_key() -> None:
+    """느린 적재 중에도 다른 키는 바로 읽히고, 같은 키를 기다리던 호출은 적재를 다시 하지 않는다"""
+    cache = DatasetCache()
+    started, release = threading.Event(), threading.Event()
+    calls: list[str] = []
+    results: dict[str, pl.DataFrame] = {}
+
+    def slow_loader() -> pl.DataFrame:
+        calls.append("slow")
+        started.set()
+        release.wait(timeout=10)
+        return pl.DataFrame({"x": [2]})
+
+    def load(name: str, key: str, loader: Callable[[], pl.DataFrame]) -> threading.Thread:
+        thread = threading.Thread(target=lambda: results.update({name: cache.get_or_load(key, loader)}))
+        thread.start()
+        return thread
+
+    first = load("first", "slow", slow_loader)
+    assert started.wait(timeout=10)
+    second = load("second", "slow", slow_loader)
+
+    # 전역 잠금을 잡은 채 적재하면 다른 키의 조회도 느린 적재가 끝날 때까지 멈춘다
+    other = load("other", "other", lambda: pl.DataFrame({"x": [3]}))
+    other.join(timeout=5)
+    assert not other.is_alive()
+    assert results["other"]["x"].to_list() == [3]
+
+    release.set()
+    first.join(timeout=10)
+    second.join(timeout=10)
+    assert calls == ["slow"]
+    assert results["first"] is results["second"]
+
+
+class Upload(io.BytesIO):
+    def __init__(self, data: bytes, name: str):
+        super().__init__(data)
+        self.name = name
+
+
+def test_disk_pruning_evicts_least_recently_used_copies(tmp_path: Path) -> None:
+    """업로드 사본도 IPC 사본과 같은 디스크 한도 안에서 오래 쓰지 않은 것부터 지우고, 쓰는 중인 임시 파일은 남긴다"""
+    frame = pl.DataFrame({"x": range(10_000)})
+    buffer = io.BytesIO()
+    frame.write_ipc(buffer)
+    cache = DatasetCache(spill_dir=str(tmp_path), max_disk_bytes=int(len(buffer.getvalue()) * 2.5))
+    in_progress = tmp_path / "upload-x.arrow"
+    in_progress.write_bytes(buffer.getvalue())
+    os.utime(in_progress, (0, 0))
+
+    old = cache.spill_upload("old", Upload(buffer.getvalue(), "old.arrow"))
+    os.utime(old, (1, 1))
+    used = cache.spill_upload("used", Upload(buffer.getvalue(), "used.arrow"))
+    os.utime(used, (2, 2))
+    assert cache.spill_upload("used", Upload(b"ignored", "used.arrow")) == used  # 다시 쓰면 최근 사용이 된다
+    cache.put("frame", frame)
+    assert not os.path.exists(old) and os.path.exists(used) and in_progress.exists()
+    assert cache.ipc_path("frame") == str(tmp_path / "frame.arrow")
+    # 지워진 업로드 사본은 다음에 쓸 때 다시 만든다
+    assert pl.read_ipc(cache.spill_upload("old", Upload(buffer.getvalue(), "old.arrow"))).equals(frame)
+    with pytest.raises(ValueError, match="spill_dir"):
+        DatasetCache().spill_upload("a", Upload(b"", "a.csv"))
+
+
+def test_evicted_frames_reopen_from_the_disk_tier(tmp_path: Path) -> None:
+    """메모리 한도를 넘으면 오래된 프레임을 내보내고, 디스크 사본이 있으면 다시 열어 돌려준다"""
+    frames = {key: pl.DataFrame({"x": range(i, i + 1_000)}) for i, key in enumerate("abc")}
+    size = frames["a"].estimated_size()
+    cache = DatasetCache(max_bytes=int(size * 2.5), spill_dir=str(tmp_path))
+    memory_only = DatasetCache(max_bytes=int(size * 2.5))
+    for key, frame in frames.items():
+        cache.put(key, frame)
+        memory_only.put(key, frame)
+    assert cache.total_bytes <= cache.max_bytes
+    assert memory_only.get("a") is None
+    assert "a" in cache and cache.ipc_path("a") == str(tmp_path / "a.arrow")
+    reopened = cache.get("a")
+    assert reopened is not None and reopened.equals(frames["a"])
+    # 다시 연 프레임은 최근 사용으로 올라가고 그 대신 가장 오래된 b 가 메모리에서 빠진다
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.get_or_load("b", lambda: pl.DataFrame()).equals(frames["b"])
+
+    cache.evict("c")
+    cache.clear()
+    assert cache.total_bytes == 0
+    spilled = cache.get("c")
+    assert spilled is not None and spilled.equals(frames["c"])
+    # 크기 한도보다 큰 프레임도 방금 넣은 것은 유지한다
+    tiny = DatasetCache(max_bytes=1)
+    assert tiny.put("big", frames["a"]) is tiny.get("big")
+
+
+def test_spill_files_are_private_to_the_user(tmp_path: Path) -> None:
+    """업로드 데이터가 든 디스크 사본은 디렉터리(0700)와 파일(0600) 모두 소유자만 읽을 수 있다"""
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir(mode=0o755)
+    cache = DatasetCache(spill_dir=str(spill_dir))
+    cache.put("a", pl.DataFrame({"x": [1]}))
+    assert spill_dir.stat().st_mode & 0o777 == 0o700
+    assert (spill_dir / "a.arrow").stat().st_mode & 0o777 == 0o600
+    assert os.listdir(spill_dir) == ["a.arrow"]
@@ -0,0 +1,34 @@
+import numpy as np
+import polars as pl
+import pytest
+
+from polaris.features import FeatureMatrix
+
+
+def test_feature_matrix_imputes_with_means_and_streams_the_same_rule() -> None:
+    """결측과 NaN 은 컬럼 평균으로 채우고, 지연 프레임에서 맞춘 규칙도 같은 행렬을 만든다"""
+    df = pl.DataFrame({"a": [1.0, None, 3.0, float("nan")], "b": [1, 2, 3, 4], "c": [None, None, None, None]})
+    df = df.with_columns(pl.col("c").cast(pl.Float64))
+    matrix = FeatureMatrix.from_frame(df, ["a", "b", "c"])
+    assert matrix.fill_values == [2.0, 2.5, 0.0]
+    assert matrix.missing == [2, 0, 4] and not matrix.complete
+    assert matrix.take(None).tolist() == [[1, 1, 0], [2, 2, 0], [3, 3, 0], [2, 4, 0]]
+    assert matrix.values is not None and matrix.values.flags.c_contiguous
+
+    lazy = FeatureMatrix.fit(df.lazy(), ["a", "b", "c"])
+    assert (lazy.fill_values, lazy.missing) == (matrix.fill_values, matrix.missing)
+    assert np.array_equal(lazy.transform(df.tail(2)), matrix.take(np.array([2, 3])))
+    assert matrix.column("b").tolist() == [1, 2, 3, 4]
+
+
+def test_feature_batches_are_views_in_the_requested_dtype() -> None:
+    """float32 행렬의 배치는 데이터를 복사하지 않는 행 구간 뷰이다"""
+    df = pl.DataFrame({"x": np.arange(10.0), "y": np.arange(10)})
+    matrix = FeatureMatrix.from_frame(df, ["x", "y"], dtype=np.float32)
+    assert matrix.values is not None and matrix.values.dtype == np.float32 and matrix.complete
+    batches = list(matrix.batches(4))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert all(np.shares_memory(batch, matrix.values) for batch in batches)
+    with pytest.raises(ValueError, match="dtype"):
+        FeatureMatrix(["x"], [0.0], [0], dtype=np.int64)
+    assert FeatureMatrix.from_stats(pl.DataFrame(), ["x"]).fill_values == [0.0]
@@ -0,0 +1,205 @@
+import random
+
+import numpy as np
+import pytest
+
+import graph
+from graph import GraphEdit, GraphSessions, IncrementalGraph, analyze_graph, intern_graph
+
+
+@pytest.fixture
+def frontend_pipeline() -> tuple[list[str], list[tuple[str, str]]]:
+    """프론트엔드가 만드는 형태의 숫자가 아닌 노드 ID"""
+    nodes = ["customInput-1", "filter-1", "filter-2", "customOutput-1"]
+    edges = [
+        ("customInput-1", "filter-1"),
+        ("customInput-1", "filter-2"),
+        ("filter-1", "customOutput-1"),
+        ("filter-2", "customOutput-1"),
+    ]
+    return nodes, edges
+
+
+def test_topological_order(frontend_pipeline: tuple[list[str], list[tuple[str, str]]]) -> None:
+    """모든 엣지가 순서상 앞에서 뒤로 향한다"""
+    nodes, edges = frontend_pipeline
+    result = analyze_graph(nodes, edges)
+    assert result.is_dag is True
+    assert sorted(result.order) == sorted(nodes)
+    position = {node: i for i, node in enumerate(result.order)}
+    assert all(position[source] < position[target] for source, target in edges)
+    assert result.cycle == []
+
+
+def test_cycle_path() -> None:
+    """순환 경로는 시작 노드로 다시 돌아오는 실제 엣지의 나열"""
+    edges = [("a", "b"), ("b", "c"), ("c", "d"), ("d", "b"), ("a", "e")]
+    result = analyze_graph(["a", "b", "c", "d", "e"], edges)
+    assert result.is_dag is False
+    assert result.cycle[0] == result.cycle[-1]
+    assert set(result.cycle) == {"b", "c", "d"}
+    assert all(pair in edges for pair in zip(result.cycle, result.cycle[1:], strict=False))
+    # 순환에 걸리지 않은 노드까지의 부분 순서
+    assert result.order == ["a", "e"]
+
+
+def test_self_loop() -> None:
+    """자기 자신으로 향하는 엣지도 순환"""
+    result = analyze_graph(["a", "b"], [("a", "b"), ("b", "b")])
+    assert result.is_dag is False
+    assert result.cycle == ["b", "b"]
+
+
+def test_dangling_edges() -> None:
+    """존재하지 않는 노드를 가리키는 엣지는 오류 대신 따로 보고"""
+    result = analyze_graph(["a", "b"], [("a", "b"), ("b", "ghost"), ("ghost", "a")])
+    assert result.is_dag is True
+    assert result.dangling_edges == [("b", "ghost"), ("ghost", "a")]
+    assert result.order == ["a", "b"]
+
+
+def test_deep_chain_without_recursion() -> None:
+    """재귀 한도를 훨씬 넘는 긴 체인과 그 끝의 순환"""
+    n = 200_000
+    nodes = [f"n{i}" for i in range(n)]
+    edges = [(nodes[i], nodes[i + 1]) for i in range(n - 1)]
+    assert analyze_graph(nodes, edges).order == nodes
+
+    result = analyze_graph(nodes, [*edges, (nodes[-1], nodes[0])])
+    assert result.is_dag is False
+    assert len(result.cycle) == n + 1
+
+
+def test_wide_levels_match_edges() -> None:
+    """넓은 단계(배열 연산 경로)와 좁은 단계가 섞인 그래프에서도 올바른 순서"""
+    width = 1_000
+    nodes = [f"n{i}" for i in range(3 * width + 2)]
+    edges = [(nodes[i], nodes[width + (i * 7) % width]) for i in range(width)]
+    edges += [(nodes[width + i], nodes[2 * width + i // 2]) for i in range(width)]
+    edges += [(nodes[2 * width + i], nodes[3 * width]) for i in range(width)]
+    edges.append((nodes[3 * width], nodes[3 * width + 1]))
+    result = analyze_graph(nodes, edges)
+    assert result.is_dag is True
+    assert len(result.order) == len(nodes)
+    position = {node: i for i, node in enumerate(result.order)}
+    assert all(position[source] < position[target] for source, target in edges)
+
+    result = analyze_graph(nodes, [*edges, (nodes[3 * width + 1], nodes[5])])
+    assert result.is_dag is False
+    assert result.cycle[0] == result.cycle[-1]
+
+
+@pytest.mark.parametrize("closing", [False, True])
+def test_vector_interning_matches_dictionary_lookups(monkeypatch: pytest.MonkeyPatch, closing: bool) -> None:
+    """해시 색인 경로가 중복 ID, 끊어진 엣지, 순환까지 사전 경로와 같은 결과를 낸다"""
+    rng = random.Random(3)
+    nodes = [f"customInput-{i}" for i in range(2_000)]
+    rng.shuffle(nodes)
+    edges = [(nodes[u], nodes[v]) for u, v in (sorted(rng.sample(range(len(nodes)), 2)) for _ in range(3_000))]
+    edges += [("ghost", nodes[0]), (nodes[1], "ghost-2")]
+    if closing:
+        edges += list(zip(nodes[:500], nodes[1:501], strict=False)) + [(nodes[500], nodes[0])]
+    for node_ids in (nodes, [*nodes, nodes[7]]):
+        monkeypatch.setattr(graph, "VECTOR_INTERN", 0)
+        vector = intern_graph(node_ids, edges)
+        vector_result = analyze_graph(node_ids, edges)
+        monkeypatch.setattr(graph, "VECTOR_INTERN", 10**12)
+        exact = intern_graph(node_ids, edges)
+        assert vector.ids == exact.ids == nodes
+        assert np.array_equal(vector.offsets, exact.offsets)
+        assert np.array_equal(vector.targets, exact.targets)
+        assert vector.dangling == exact.dangling == [("ghost", nodes[0]), (nodes[1], "ghost-2")]
+        assert vector_result == analyze_graph(node_ids, edges)
+        assert vector_result.is_dag is not closing
+
+
+def test_incremental_rejects_cycle_closing_edge() -> None:
+    """순환을 만드는 엣지는 들어가지 않고 그 순환 경로가 보고된다"""
+    graph, update = IncrementalGraph.build(["a", "b", "c"], [("a", "b"), ("b", "c")])
+    assert update.cycles == [] and graph.order() == ["a", "b", "c"]
+    update = graph.apply([GraphEdit("add_edge", source="c", target="a"), GraphEdit("add_edge", source="b", target="b")])
+    assert update.cycles == [["c", "a", "b", "c"], ["b", "b"]]
+    assert graph.num_edges == 2
+    assert update.stale == []
+
+
+def test_incremental_reorders_only_affected_nodes() -> None:
+    """역방향 엣지는 두 순위 사이의 노드만 옮기고 나머지 순위는 그대로 둔다"""
+    nodes = [f"n{i}" for i in range(6)]
+    graph = IncrementalGraph()
+    graph.apply([GraphEdit("add_node", id=node) for node in nodes])
+    graph.apply([GraphEdit("add_edge", source="n0", target="n1"), GraphEdit("add_edge", source="n4", target="n5")])
+    before = dict(graph.rank)
+    update = graph.apply([GraphEdit("add_edge", source="n4", target="n1")])
+    assert update.cycles == []
+    assert set(update.ranks) == {"n1", "n4"}
+    assert all(graph.rank[node] == before[node] for node in ("n0", "n2", "n3", "n5"))
+    assert graph.order() == ["n0", "n4", "n2", "n3", "n1", "n5"]
+    # 엣지의 도착 노드와 그 하류만 다시 계산 대상
+    assert update.stale == ["n1"]
+    assert graph.descendants("n4") == ["n1", "n5"]
+    assert graph.ancestors("n1") == ["n0", "n4"]
+
+
+def test_incremental_node_removal_and_dangling_edges() -> None:
+    """노드를 지우면 그 엣지도 사라지고, 없는 노드로 향하는 엣지는 따로 보고"""
+    graph, _ = IncrementalGraph.build(["a", "b", "c"], [("a", "b"), ("b", "c")])
+    update = graph.apply([GraphEdit("remove_node", id="b"), GraphEdit("add_edge", source="a", target="ghost")])
+    assert graph.num_edges == 0
+    assert graph.order() == ["a", "c"]
+    assert update.dangling_edges == [("a", "ghost")]
+    assert update.stale == ["c"]
+    update = graph.apply([GraphEdit("update_node", id="a"), GraphEdit("add_edge", source="a", target="c")])
+    assert update.stale == ["a", "c"]
+
+
+def test_graph_edit_validation() -> None:
+    with pytest.raises(ValueError, match="op must be"):
+        GraphEdit("rename_node", id="a")
+    with pytest.raises(ValueError, match="needs 'source'"):
+        GraphEdit("add_edge", source="a")
+
+
+def test_incremental_matches_full_analysis() -> None:
+    """무작위 편집을 이어가도 유지되는 순서와 엣지가 매번 전체 분석과 일치한다"""
+    rng = random.Random(7)
+    nodes = [f"n{i}" for i in range(40)]
+    graph, _ = IncrementalGraph.build(nodes[:20], [])
+    for _ in range(600):
+        roll = rng.random()
+        if roll < 0.1:
+            edit = GraphEdit("add_node", id=rng.choice(nodes))
+        elif roll < 0.15:
+            edit = GraphEdit("remove_node", id=rng.choice(nodes))
+        elif roll < 0.75:
+            edit = GraphEdit("add_edge", source=rng.choice(nodes), target=rng.choice(nodes))
+        else:
+            edges = graph.edges()
+            if not edges:
+                continue
+            source, target = rng.choice(edges)
+            edit = GraphEdit("remove_edge", source=source, target=target)
+        update = graph.apply([edit])
+        order, edges = graph.order(), graph.edges()
+        position = {node: i for i, node in enumerate(order)}
+        assert all(position[source] < position[target] for source, target in edges)
+        assert len(edges) == graph.num_edges
+        assert analyze_graph(order, edges).is_dag is True
+        if edit.op == "add_edge" and edit.source in graph and edit.target in graph:
+            # 거부 여부가 엣지를 넣었을 때의 전체 분석 결과와 같다
+            expected = analyze_graph(order, [*edges, (edit.source, edit.target)]).is_dag
+            assert bool(update.cycles) == (not expected and (edit.source, edit.target) not in edges)
+        for cycle in update.cycles:
+            assert cycle[0] == cycle[-1]
+            assert all(pair in edges for pair in zip(cycle[1:], cycle[2:], strict=False))
+
+
+def test_graph_sessions_evict_least_recently_used() -> None:
+    sessions = GraphSessions(max_sessions=2)
+    for session_id in ("a", "b"):
+        sessions.add(session_id, IncrementalGraph())
+    assert sessions.get("a") is not None
+    sessions.add("c", IncrementalGraph())
+    assert sessions.get("b") is None
+    assert len(sessions) == 2
+    assert sessions.remove("a") is True and sessions.remove("a") is False
@@ -0,0 +1,24 @@
+import pytest
+
+from benchmarks.import_time import PAGES, import_times, measure_page
+
+
+@pytest.mark.parametrize("page", PAGES)
+def test_pages_defer_heavy_backends(page: str) -> None:
+    """페이지를 import 하는 것만으로는 sklearn/seaborn/matplotlib 등을 불러오지 않는다"""
+    result = measure_page(page)
+    assert result["loaded_deferred"] == []
+    assert result["total_ms"] > 0
+
+
+def test_utils_package_loads_submodules_on_first_use() -> None:
+    """`from utils import X` 는 X 가 정의된 하위 모듈만 불러온다"""
+    times = import_times(["utils"])
+    assert "utils" in times and "utils.eda" not in times and "streamlit" not in times
+
+    import utils
+    from utils.quality import DataQuality
+
+    assert utils.DataQuality is DataQuality
+    with pytest.raises(AttributeError):
+        _ = utils.missing
@@ -0,0 +1,59 @@
+import os
+from io import BytesIO
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from polaris.ingest import read_upload, scan_path, scan_upload, spill_upload_to, upload_suffix, write_ipc
+
+
+class Upload(BytesIO):
+    """Streamlit UploadedFile 처럼 이름이 붙은 업로드"""
+
+    def __init__(self, data: bytes, name: str):
+        super().__init__(data)
+        self.name = name
+
+
+def parquet_bytes(df: pl.DataFrame) -> bytes:
+    buffer = BytesIO()
+    df.write_parquet(buffer)
+    return buffer.getvalue()
+
+
+def test_uploads_are_read_with_the_reader_of_their_extension(tmp_path: Path) -> None:
+    """업로드는 확장자에 맞는 리더로 읽고, 모르는 확장자는 CSV 로 보며, 임시 사본은 남기지 않는다"""
+    df = pl.DataFrame({"x": [1, 2, 3], "s": ["a", "b", None]})
+    csv = Upload(df.write_csv().encode(), "data.TXT")
+    parquet = Upload(parquet_bytes(df), "data.PQ")
+    assert (upload_suffix(csv), upload_suffix(parquet), upload_suffix(BytesIO())) == (".csv", ".pq", ".csv")
+
+    for upload in (csv, parquet):
+        upload.seek(1)
+        assert read_upload(upload, str(tmp_path)).equals(df)
+        # 업로드의 읽기 위치는 건드리지 않는다
+        assert upload.tell() == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_spilled_upload_is_written_once(tmp_path: Path) -> None:
+    """고정 경로 사본은 처음 한 번만 쓰고, 이후 호출은 같은 파일을 다시 연다"""
+    df = pl.DataFrame({"x": range(100)})
+    path = str(tmp_path / "key-upload.parquet")
+    assert scan_upload(Upload(parquet_bytes(df), "a.parquet"), path).collect().equals(df)
+    assert spill_upload_to(Upload(b"ignored", "a.parquet"), path) == path
+    assert scan_path(path).collect().equals(df)
+    assert sorted(os.listdir(tmp_path)) == ["key-upload.parquet"]
+    with pytest.raises(FileNotFoundError):
+        scan_path(str(tmp_path / "missing.csv"))
+
+
+def test_write_ipc_replaces_atomically(tmp_path: Path) -> None:
+    """IPC 사본은 임시 파일을 거쳐 교체되고 압축 없이 저장되어 메모리 매핑으로 다시 열린다"""
+    path = str(tmp_path / "frame.arrow")
+    write_ipc(pl.DataFrame({"x": [1]}), path)
+    write_ipc(pl.DataFrame({"x": [1, 2]}), path)
+    assert os.listdir(tmp_path) == ["frame.arrow"]
+    assert pl.read_ipc(path).equals(pl.DataFrame({"x": [1, 2]}))
+    assert scan_path(path).collect().height == 2
@@ -0,0 +1,66 @@
+import json
+import logging
+
+import numpy as np
+import polars as pl
+import pytest
+
+from polaris.instrument import Recorder, phase
+from polaris.profile import EDAEngine
+from polaris.scheduler import run_sections
+
+
+def test_phases_nest_under_the_active_span() -> None:
+    """phase() 는 활성 스팬의 하위 단계로 기록되고, 스팬 밖에서는 아무것도 하지 않는다"""
+    recorder = Recorder()
+    with phase("fit") as outside:
+        assert outside is None
+    with recorder.span("cluster_analysis", "compute", rows=10, columns=2):
+        with phase("fit", rows=5):
+            np.ones((256, 1024)).sum()
+    rows = recorder.rows()
+    assert [(row["name"], row["phase"], row["parent"]) for row in rows] == [
+        ("cluster_analysis", "compute", None),
+        ("cluster_analysis", "fit", "cluster_analysis:compute"),
+    ]
+    assert rows[0]["wall_s"] >= rows[1]["wall_s"] > 0
+    assert rows[0]["rows"] == 10 and rows[1]["rows"] == 5
+
+
+def test_sections_in_worker_threads_attach_to_the_report_span() -> None:
+    """스레드 풀에서 계산되는 섹션도 호출한 스레드의 리포트 스팬 아래에 기록"""
+    df = pl.DataFrame({"a": np.arange(300.0), "b": np.arange(300.0) % 7, "c": np.arange(300) % 3})
+    recorder = Recorder()
+    engine = EDAEngine(df, recorder=recorder)
+    with recorder.span("eda_report", "report"):
+        runs = list(run_sections(engine.section_tasks(["cluster_analysis", "pca_visualization"]), max_workers=2))
+    assert all(run.error is None for run in runs)
+    rows = recorder.rows()
+    computes = {row["name"]: row for row in rows if row["phase"] == "compute"}
+    assert set(computes) == {"cluster_analysis", "pca_visualization"}
+    assert all(row["parent"] == "eda_report:report" for row in computes.values())
+    fits = [row for row in rows if row["phase"] == "fit"]
+    assert {row["parent"] for row in fits} == {
+        "eda_report:report/cluster_analysis:compute",
+        "eda_report:report/pca_visualization:compute",
+    }
+
+
+def test_profiler_and_structured_log(caplog: pytest.LogCaptureFixture) -> None:
+    """compute 스팬마다 cProfile 결과를 붙이고, 끝난 스팬은 JSON 로그로 남긴다"""
+    recorder = Recorder(profiler="cprofile")
+    with caplog.at_level(logging.INFO, logger="polaris.telemetry"):
+        with pytest.raises(ZeroDivisionError), recorder.span("broken", "compute"):
+            sorted(range(1000), key=lambda value: -value)
+            raise ZeroDivisionError("division by zero")
+    (span,) = recorder.spans
+    assert span.profile is not None and "function calls" in span.profile
+    assert span.error is not None and span.error.startswith("ZeroDivisionError")
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record["name"] == "broken" and record["error"] == span.error
+
+
+def test_unknown_profiler() -> None:
+    """지원하지 않는 프로파일러는 거부"""
+    with pytest.raises(ValueError, match="profiler must be one of"):
+        Recorder(profiler="perf")
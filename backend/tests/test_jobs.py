@@ -0,0 +1,130 @@
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import pytest
+
+from jobs import TERMINAL_STATES, JobCancelled, JobManager, JobStore, Progress, eda_job, profile_job, quality_job
+
+
+def counting_job(payload: dict[str, Any], progress: Progress) -> dict[str, Any]:
+    for i in range(payload["steps"]):
+        progress((i + 1) / payload["steps"], {"done": i + 1})
+    return {"total": payload["steps"]}
+
+
+def slow_job(payload: dict[str, Any], progress: Progress) -> dict[str, Any]:
+    for i in range(1000):
+        progress(i / 1000, None)
+        time.sleep(0.01)
+    return {}
+
+
+def failing_job(payload: dict[str, Any], progress: Progress) -> dict[str, Any]:
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> Iterator[JobManager]:
+    """작업 함수를 테스트용으로 바꾼 단일 워커 작업 관리자"""
+    jobs = JobManager(
+        JobStore(str(tmp_path / "jobs.sqlite3")),
+        max_workers=1,
+        job_types={"count": counting_job, "slow": slow_job, "fail": failing_job},
+    )
+    yield jobs
+    jobs.shutdown()
+
+
+def wait_for(jobs: JobManager, job_id: str, states: tuple[str, ...] = TERMINAL_STATES) -> dict[str, Any]:
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        job = jobs.store.get(job_id)
+        assert job is not None
+        if job["status"] in states:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not reach {states}")
+
+
+def test_job_result_and_progress(manager: JobManager) -> None:
+    """작업 결과와 마지막 부분 결과가 저장소에 남는다"""
+    job_id = manager.submit("count", {"steps": 3})
+    job = wait_for(manager, job_id)
+    assert job["status"] == "succeeded"
+    assert job["progress"] == 1.0
+    assert job["partial"] == {"done": 3}
+    assert manager.store.result(job_id) == {"total": 3}
+
+
+def test_failed_job_records_error(manager: JobManager) -> None:
+    """작업 함수의 예외는 failed 상태와 오류 메시지로 기록"""
+    job = wait_for(manager, manager.submit("fail", {}))
+    assert job["status"] == "failed"
+    assert job["error"] == "RuntimeError: boom"
+
+
+def test_cancel_running_and_queued_jobs(manager: JobManager) -> None:
+    """대기 중인 작업은 즉시, 실행 중인 작업은 다음 진행률 보고 때 취소"""
+    running = manager.submit("slow", {})
+    queued = manager.submit("count", {"steps": 1})
+    wait_for(manager, running, ("running",))
+
+    cancelled = manager.cancel(queued)
+    assert cancelled is not None and cancelled["status"] == "cancelled"
+    manager.cancel(running)
+    assert wait_for(manager, running)["status"] == "cancelled"
+    assert manager.store.get(queued)["status"] == "cancelled"
+    assert manager.store.result(running) is None
+
+
+def test_unknown_job_kind(manager: JobManager) -> None:
+    """등록되지 않은 작업 종류는 거부"""
+    with pytest.raises(ValueError, match="unknown job kind"):
+        manager.submit("nope", {})
+
+
+def test_eda_job_reports_sections(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """EDA 작업은 섹션이 끝날 때마다 진행률과 끝난 섹션 목록을 보고"""
+    monkeypatch.setattr("jobs.RESULT_CACHE_DIR", str(tmp_path / "results"))
+    monkeypatch.setattr("jobs.DATA_ROOT", str(tmp_path))
+    path = tmp_path / "data.csv"
+    path.write_text("x,y\n" + "\n".join(f"{i},{i % 7}" for i in range(50)) + "\n")
+    reports: list[tuple[float, dict[str, Any] | None]] = []
+    sections = ["dataset_overview", "correlation_matrix"]
+    payload = {"path": str(path), "sections": sections}
+    result = eda_job(payload, lambda fraction, partial: reports.append((fraction, partial)))
+
+    assert set(result["sections"]) == set(sections)
+    assert [fraction for fraction, _ in reports] == [0.5, 1.0]
+    last = reports[-1][1]
+    assert last is not None and sorted(last["sections"]) == sorted(sections)
+
+
+def test_profile_job_reads_parquet_sources(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """프로파일 작업은 CSV 가 아닌 소스도 형식에 맞게 읽고 배치마다 진행률을 보고"""
+    monkeypatch.setattr("jobs.DATA_ROOT", str(tmp_path))
+    path = tmp_path / "data.parquet"
+    pl.DataFrame({"x": range(10), "y": [i % 3 for i in range(10)]}).write_parquet(path)
+    reports: list[float] = []
+    result = profile_job({"path": str(path), "batch_size": 4}, lambda fraction, partial: reports.append(fraction))
+
+    assert result["rows"] == 10
+    assert [column["column"] for column in result["columns"]] == ["x", "y"]
+    assert reports == [0.4, 0.8, 0.99, 1.0]
+
+
+def test_quality_job_checks_cancellation_between_stages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """품질 작업도 단계 사이에 진행률을 보고하므로 취소 요청이 반영된다"""
+    monkeypatch.setattr("jobs.DATA_ROOT", str(tmp_path))
+    path = tmp_path / "data.csv"
+    path.write_text("x\n1\n2\n")
+
+    def cancel(fraction: float, partial: dict[str, Any] | None) -> None:
+        raise JobCancelled()
+
+    payload = {"path": str(path), "rules": [{"type": "not_null", "column": "x"}]}
+    with pytest.raises(JobCancelled):
+        quality_job(payload, cancel)
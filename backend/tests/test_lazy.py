@@ -0,0 +1,49 @@
+from datetime import date
+
+import polars as pl
+
+from polaris.lazy import LazyProfile, columns_of
+
+
+def test_lazy_profile_matches_eager_statistics() -> None:
+    """한 번의 collect_all 로 모은 통계가 프레임에서 직접 계산한 값과 같다"""
+    df = pl.DataFrame(
+        {
+            "n": [1, 5, None, 3, 5],
+            "f": [0.5, None, 2.0, -1.0, 4.0],
+            "s": ["a", " N/A", "b", "a", None],
+            "b": [True, False, True, True, None],
+            "d": [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 1), None, date(2024, 1, 3)],
+            "l": [[1], [2, 3], [], None, [4]],
+        }
+    )
+    profile = LazyProfile(df.lazy(), top_k=2, bin_count=4, head=2)
+    assert columns_of(profile.schema, pl.Float64, pl.Int64) == ["n", "f"]
+    stats = profile.collect()
+
+    assert stats["overview", "rows"].item() == 5
+    assert stats["overview", "null_counts"].row(0) == df.null_count().row(0)
+    assert stats["numeric", "min"].row(0) == (1, -1.0)
+    assert stats["numeric", "max"].row(0) == (5, 4.0)
+    assert stats["top", "s"].row(0) == ("a", 2)
+    assert stats["top", "b"].height == 2
+    assert stats["invalid", "counts"]["s"].item() == 1
+    assert stats["invalid", "values"]["s"].item().to_list() == [" N/A"]
+    assert stats["dates", "d"]["count"].to_list() == [1, 2, 1, 1]
+    assert stats["structured", "head"].columns == ["l"] and stats["structured", "head"].height == 2
+
+    histogram = LazyProfile.histogram(stats, "f")
+    assert histogram.columns == ["breakpoint", "count"]
+    assert histogram.height == 4 and histogram["count"].sum() == 4
+
+
+def test_lazy_profile_skips_sections_without_columns() -> None:
+    """해당 타입의 컬럼이 없으면 그 섹션의 질의를 만들지 않는다"""
+    queries = LazyProfile(pl.LazyFrame({"s": ["x"]})).queries()
+    assert set(queries) == {
+        ("overview", "rows"),
+        ("overview", "null_counts"),
+        ("top", "s"),
+        ("invalid", "counts"),
+        ("invalid", "values"),
+    }
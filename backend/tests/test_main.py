@@ -1,10 +1,29 @@
+import io
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import polars as pl
 import pytest
 from fastapi.testclient import TestClient
 
-from main import Edge, Node, app, check_if_dag
+from jobs import JobManager, JobStore
+from main import Edge, Node, app, check_if_dag, get_data_root, get_job_manager, get_result_cache
+from polaris.cache import ResultCache
 
 client = TestClient(app)
 
+
+@pytest.fixture(autouse=True)
+def data_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """요청 경로를 읽을 수 있는 데이터 루트를 임시 디렉터리로 교체 (작업 프로세스는 환경 변수로 물려받는다)"""
+    monkeypatch.setenv("POLARIS_DATA_ROOT", str(tmp_path))
+    app.dependency_overrides[get_data_root] = lambda: str(tmp_path)
+    yield tmp_path
+    app.dependency_overrides.pop(get_data_root, None)
+
+
 @pytest.fixture
 def nodes_and_edges_no_cycle() -> tuple[list[Node], list[Edge]]:
     """순환 없는 DAG 테스트에 사용할 예시 데이터"""
@@ -12,6 +31,7 @@ def nodes_and_edges_no_cycle() -> tuple[list[Node], list[Edge]]:
     edges = [Edge(source="1", target="2"), Edge(source="2", target="3")]
     return nodes, edges
 
+
 @pytest.fixture
 def nodes_and_edges_with_cycle() -> tuple[list[Node], list[Edge]]:
     """순환이 있는 DAG 테스트에 사용할 예시 데이터"""
@@ -19,48 +39,390 @@ def nodes_and_edges_with_cycle() -> tuple[list[Node], list[Edge]]:
     edges = [Edge(source="1", target="2"), Edge(source="2", target="3"), Edge(source="3", target="1")]
     return nodes, edges
 
+
 @pytest.fixture
 def empty_nodes_and_edges() -> tuple[list[Node], list[Edge]]:
     """노드와 엣지가 비어 있는 DAG 테스트에 사용할 예시 데이터"""
     return [], []
 
+
 @pytest.fixture
 def nodes_and_no_edges() -> tuple[list[Node], list[Edge]]:
     """엣지가 없는 경우 DAG 테스트에 사용할 예시 데이터"""
     nodes = [Node(id="1"), Node(id="2"), Node(id="3")]
     return nodes, []
 
+
 # 테스트 함수에서 fixture를 사용하여 데이터 전달
 def test_check_if_dag_no_cycle(nodes_and_edges_no_cycle: tuple[list[Node], list[Edge]]) -> None:
     """순환 없는 DAG 테스트"""
     nodes, edges = nodes_and_edges_no_cycle
     assert check_if_dag(nodes, edges) is True
 
+
 def test_check_if_dag_with_cycle(nodes_and_edges_with_cycle: tuple[list[Node], list[Edge]]) -> None:
     """순환이 있는 경우 (DAG가 아님)"""
     nodes, edges = nodes_and_edges_with_cycle
     assert check_if_dag(nodes, edges) is False
 
+
 def test_check_if_dag_no_nodes(empty_nodes_and_edges: tuple[list[Node], list[Edge]]) -> None:
     """노드가 없는 경우 (DAG로 간주)"""
     nodes, edges = empty_nodes_and_edges
     assert check_if_dag(nodes, edges) is True
 
+
 def test_check_if_dag_no_edges(nodes_and_no_edges: tuple[list[Node], list[Edge]]) -> None:
     """엣지가 없는 경우 (DAG로 간주)"""
     nodes, edges = nodes_and_no_edges
     assert check_if_dag(nodes, edges) is True
 
+
 def test_parse_pipeline_endpoint() -> None:
     """FastAPI 엔드포인트 테스트"""
     payload = {
         "nodes": [{"id": "1"}, {"id": "2"}, {"id": "3"}],
-        "edges": [{"source": "1", "target": "2"}, {"source": "2", "target": "3"}]
+        "edges": [{"source": "1", "target": "2"}, {"source": "2", "target": "3"}],
     }
     response = client.post("/pipelines/parse", json=payload)
-    
+
     assert response.status_code == 200
     data = response.json()
     assert data["num_nodes"] == 3
     assert data["num_edges"] == 2
     assert data["is_dag"] is True
+    assert data["order"] == ["1", "2", "3"]
+
+
+def test_parse_pipeline_reports_cycle_and_dangling_edges() -> None:
+    """순환 경로와 끊어진 엣지를 응답에 포함"""
+    payload = {
+        "nodes": [{"id": "customInput-1"}, {"id": "filter-1"}, {"id": "customOutput-1"}],
+        "edges": [
+            {"source": "customInput-1", "target": "filter-1"},
+            {"source": "filter-1", "target": "customInput-1"},
+            {"source": "filter-1", "target": "customOutput-9"},
+        ],
+    }
+    response = client.post("/pipelines/parse", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["is_dag"] is False
+    assert data["cycle"] in (
+        ["customInput-1", "filter-1", "customInput-1"],
+        ["filter-1", "customInput-1", "filter-1"],
+    )
+    assert data["dangling_edges"] == [{"source": "filter-1", "target": "customOutput-9"}]
+
+
+def test_graph_session_edits() -> None:
+    """세션을 만든 뒤 변경분만 보내면 순위가 바뀐 노드, 거부된 엣지, 다시 계산할 노드를 돌려준다"""
+    payload = {
+        "nodes": [{"id": "customInput-1"}, {"id": "filter-1"}, {"id": "customOutput-1"}],
+        "edges": [{"source": "customInput-1", "target": "filter-1"}],
+    }
+    response = client.post("/pipelines/sessions", json=payload)
+    assert response.status_code == 201
+    created = response.json()
+    session_id = created["session_id"]
+    assert created["order"] == ["customInput-1", "customOutput-1", "filter-1"]
+
+    edits = {
+        "edits": [
+            {"op": "add_edge", "source": "filter-1", "target": "customOutput-1"},
+            {"op": "add_edge", "source": "customOutput-1", "target": "customInput-1"},
+        ]
+    }
+    data = client.post(f"/pipelines/sessions/{session_id}/edits", json=edits).json()
+    assert data["num_edges"] == 2
+    assert data["is_dag"] is False
+    assert data["rejected_edges"] == [
+        {
+            "source": "customOutput-1",
+            "target": "customInput-1",
+            "cycle": ["customOutput-1", "customInput-1", "filter-1", "customOutput-1"],
+        }
+    ]
+    # 역방향 엣지라 두 노드의 순위만 맞바뀐다
+    assert data["ranks"] == {"filter-1": 1, "customOutput-1": 2}
+    assert data["stale"] == ["customOutput-1"]
+
+    node = client.get(f"/pipelines/sessions/{session_id}/nodes/filter-1").json()
+    assert node["ancestors"] == ["customInput-1"]
+    assert node["descendants"] == ["customOutput-1"]
+    snapshot = client.get(f"/pipelines/sessions/{session_id}").json()
+    assert snapshot["order"] == ["customInput-1", "filter-1", "customOutput-1"]
+    assert snapshot["is_dag"] is True
+
+    bad = {"edits": [{"op": "add_node", "id": "x"}, {"op": "add_edge", "source": "x"}]}
+    assert client.post(f"/pipelines/sessions/{session_id}/edits", json=bad).status_code == 422
+    assert client.get(f"/pipelines/sessions/{session_id}").json()["num_nodes"] == 3
+    assert client.get(f"/pipelines/sessions/{session_id}/nodes/ghost").status_code == 404
+    assert client.delete(f"/pipelines/sessions/{session_id}").status_code == 204
+    assert client.post(f"/pipelines/sessions/{session_id}/edits", json=edits).status_code == 404
+
+
+def test_run_pipeline_endpoint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """UI 에서 그린 Input -> Filter -> Output 파이프라인을 실행"""
+    monkeypatch.setattr("pipeline.OUTPUT_DIR", str(tmp_path / "out"))
+    source = tmp_path / "in.csv"
+    source.write_text("id,score\n1,5\n2,50\n3,500\n")
+    payload = {
+        "nodes": [
+            {"id": "customInput-1", "type": "Input", "data": {"path": str(source)}},
+            {"id": "filter-1", "type": "Filter", "data": {"column": "score", "operator": ">=", "value": "50"}},
+            {"id": "customOutput-1", "type": "Output", "data": {"fileName": "kept", "format": "CSV"}},
+        ],
+        "edges": [
+            {"source": "customInput-1", "target": "filter-1"},
+            {"source": "filter-1", "target": "customOutput-1"},
+        ],
+    }
+    response = client.post("/pipelines/run", json={**payload, "dry_run": True})
+    assert response.status_code == 200
+    assert "score" in response.json()["plan"]
+    assert not (tmp_path / "out").exists()
+
+    response = client.post("/pipelines/run", json=payload)
+    assert response.status_code == 200
+    output = response.json()["outputs"]["customOutput-1"]
+    assert output == str(tmp_path / "out" / "kept.csv")
+    assert Path(output).read_text() == "id,score\n2,50\n3,500\n"
+
+    payload["edges"].append({"source": "customOutput-1", "target": "customInput-1"})
+    assert client.post("/pipelines/run", json=payload).status_code == 422
+
+    # 데이터 루트 밖의 파일과 허용되지 않은 URL 은 403
+    payload["edges"].pop()
+    for setting in ({"path": "/etc/passwd"}, {"url": "http://169.254.169.254/latest/meta-data"}):
+        payload["nodes"][0]["data"] = setting
+        response = client.post("/pipelines/run", json=payload)
+        assert response.status_code == 403
+        assert "169.254" not in response.text and "/etc/passwd" not in response.text
+
+
+@pytest.fixture
+def quality_csv(tmp_path: Path) -> str:
+    """데이터 품질 규칙 테스트에 사용할 예시 CSV"""
+    path = tmp_path / "people.csv"
+    path.write_text("age,email,start,end\n30,a@b.com,1,2\n-5,bad,3,1\n200,c@d.org,2,\n")
+    return str(path)
+
+
+def test_evaluate_quality_endpoint(quality_csv: str) -> None:
+    """규칙별 실패 건수와 실패 행 샘플을 한 번에 돌려준다"""
+    payload = {
+        "path": quality_csv,
+        "rules": [
+            {"type": "range", "column": "age", "min": 0, "max": 120},
+            {"type": "regex", "column": "email", "pattern": r"[^@]+@[^@]+\.\w+"},
+            {"type": "compare", "column": "start", "op": "<=", "other": "end", "name": "start_before_end"},
+            {"type": "not_null", "column": "end"},
+        ],
+    }
+    response = client.post("/quality/evaluate", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["rows"] == 3
+    results = {result["name"]: result for result in data["results"]}
+    assert results["range:age"]["failed"] == 2
+    assert [row["__row__"] for row in results["range:age"]["samples"]] == [1, 2]
+    assert results["regex:email"]["failed"] == 1
+    # null 이 섞인 비교는 검사 대상에서 제외된다
+    assert results["start_before_end"]["checked"] == 2
+    assert results["start_before_end"]["failed"] == 1
+    assert results["not_null:end"]["pass_rate"] == pytest.approx(2 / 3)
+
+
+def test_evaluate_quality_pushes_down_filters(quality_csv: str) -> None:
+    """행 필터를 통과한 행만 평가한다"""
+    payload = {
+        "path": quality_csv,
+        "columns": ["age", "email"],
+        "filters": [{"type": "range", "column": "age", "min": 0}],
+        "rules": [{"type": "range", "column": "age", "max": 120}],
+    }
+    response = client.post("/quality/evaluate", json=payload)
+    assert response.status_code == 200
+    assert response.json()["rows"] == 2
+    assert response.json()["results"][0]["failed"] == 1
+
+
+def test_evaluate_quality_unknown_column(quality_csv: str) -> None:
+    """없는 컬럼을 참조하는 규칙은 422"""
+    payload = {"path": quality_csv, "rules": [{"type": "not_null", "column": "missing"}]}
+    response = client.post("/quality/evaluate", json=payload)
+    assert response.status_code == 422
+
+
+def test_evaluate_quality_missing_file(tmp_path: Path) -> None:
+    """존재하지 않는 데이터셋 경로는 404"""
+    payload = {"path": str(tmp_path / "nope.csv"), "rules": []}
+    response = client.post("/quality/evaluate", json=payload)
+    assert response.status_code == 404
+
+
+def test_dataset_paths_are_confined_to_the_data_root(quality_csv: str, tmp_path: Path) -> None:
+    """데이터 루트 밖의 경로, '..', 루트 밖을 가리키는 심볼릭 링크는 경로를 되풀이하지 않고 403"""
+    outside = tmp_path.parent / f"{tmp_path.name}-outside"
+    outside.mkdir()
+    (outside / "secret.csv").write_text("token\nabc\n")
+    (tmp_path / "link").symlink_to(outside)
+    for path in (str(outside / "secret.csv"), "../" + outside.name + "/secret.csv", "link/*.csv", "/etc/**"):
+        response = client.post("/quality/evaluate", json={"path": path, "rules": []})
+        assert response.status_code == 403
+        assert path not in response.text
+        response = client.post("/profile", data={"path": path}, params={"sections": "dataset_overview"})
+        assert response.status_code == 403
+
+    # 루트 기준 상대 경로는 허용
+    response = client.post("/quality/evaluate", json={"path": Path(quality_csv).name, "rules": []})
+    assert response.status_code == 200
+    response = client.post("/quality/evaluate", json={"path": "nope.csv", "rules": []})
+    assert response.json()["detail"] == "dataset not found"
+
+
+@pytest.fixture
+def job_manager(tmp_path: Path) -> Iterator[JobManager]:
+    """임시 SQLite 저장소를 쓰는 작업 관리자로 교체"""
+    jobs = JobManager(JobStore(str(tmp_path / "jobs.sqlite3")), max_workers=1)
+    app.dependency_overrides[get_job_manager] = lambda: jobs
+    yield jobs
+    app.dependency_overrides.clear()
+    jobs.shutdown()
+
+
+def test_job_endpoints(job_manager: JobManager, quality_csv: str) -> None:
+    """작업 제출, 상태 조회, SSE 진행 이벤트, 결과 조회"""
+    payload = {"path": quality_csv, "rules": [{"type": "range", "column": "age", "min": 0, "max": 120}]}
+    response = client.post("/jobs", json={"kind": "quality", "payload": payload})
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+    assert response.json()["status"] in ("queued", "running", "succeeded")
+
+    events = client.get(f"/jobs/{job_id}/events").text
+    assert "event: end" in events
+    assert '"status": "succeeded"' in events
+    assert client.get(f"/jobs/{job_id}").json()["status"] == "succeeded"
+    result = client.get(f"/jobs/{job_id}/result").json()
+    assert result["results"][0]["failed"] == 2
+
+
+def test_job_endpoint_errors(job_manager: JobManager, tmp_path: Path) -> None:
+    """없는 작업 종류는 422, 없는 작업은 404, 실패한 작업의 결과는 409"""
+    assert client.post("/jobs", json={"kind": "nope"}).status_code == 422
+    assert client.get("/jobs/missing").status_code == 404
+    assert client.post("/jobs/missing/cancel").status_code == 404
+
+    job_id = client.post("/jobs", json={"kind": "profile", "payload": {"path": str(tmp_path / "no.csv")}}).json()["id"]
+    deadline = time.time() + 30
+    while client.get(f"/jobs/{job_id}").json()["status"] != "failed" and time.time() < deadline:
+        time.sleep(0.05)
+    response = client.get(f"/jobs/{job_id}/result")
+    assert response.status_code == 409
+    assert response.json()["detail"]["status"] == "failed"
+
+
+@pytest.fixture(autouse=True)
+def result_cache(tmp_path: Path) -> Iterator[ResultCache]:
+    """섹션 결과 캐시를 임시 디렉터리로 교체"""
+    cache = ResultCache(str(tmp_path / "results"))
+    app.dependency_overrides[get_result_cache] = lambda: cache
+    yield cache
+    app.dependency_overrides.pop(get_result_cache, None)
+
+
+@pytest.fixture
+def profile_csv(tmp_path: Path) -> str:
+    """헤드리스 프로파일 테스트에 사용할 예시 CSV"""
+    path = tmp_path / "sales.csv"
+    rows = "\n".join(f"{i},{i * 1.5},{'ab'[i % 2]}" for i in range(60))
+    path.write_text("id,amount,grade\n" + rows + "\n")
+    return str(path)
+
+
+def test_profile_endpoint_json(profile_csv: str) -> None:
+    """서버 경로의 데이터셋을 UI 없이 프로파일링하고 규칙 결과까지 JSON 으로 받는다"""
+    rules = json.dumps([{"type": "range", "column": "amount", "min": 0, "max": 30}])
+    response = client.post(
+        "/profile",
+        data={"path": profile_csv, "rules": rules},
+        params={"sections": "dataset_overview,correlation_matrix"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["sections"]) == {"dataset_overview", "correlation_matrix"}
+    columns = {column["column"]: column for column in data["columns"]}
+    assert columns["amount"]["count"] == 60
+    assert columns["grade"]["distinct"] == 2
+    results = {result["name"]: result for result in data["quality"]["results"]}
+    assert results["range:amount"]["failed"] == 39
+    # NaN/inf 없이 표준 JSON 으로 직렬화된다
+    json.dumps(data, allow_nan=False)
+
+
+def test_profile_endpoint_arrow_upload(profile_csv: str) -> None:
+    """업로드한 파일의 컬럼 지표를 Arrow IPC 스트림으로 받는다"""
+    with open(profile_csv, "rb") as handle:
+        response = client.post(
+            "/profile",
+            files={"file": ("sales.csv", handle, "text/csv")},
+            params={"format": "arrow", "sections": "dataset_overview", "lazy": True},
+        )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    columns = pl.read_ipc_stream(io.BytesIO(response.content))
+    assert columns["column"].to_list() == ["id", "amount", "grade"]
+    assert columns.filter(pl.col("column") == "id")["max"].item() == "59"
+
+
+def test_profile_endpoint_partitioned_parquet(tmp_path: Path) -> None:
+    """hive 파티션 디렉터리를 고른 컬럼과 행 필터만 읽어 프로파일링한다"""
+    for day in ("2026-10-01", "2026-10-02", "2026-10-03"):
+        (tmp_path / "sales" / f"day={day}").mkdir(parents=True)
+        frame = pl.DataFrame({"id": range(20), "amount": [1.5] * 20, "grade": ["a", "b"] * 10})
+        frame.write_parquet(tmp_path / "sales" / f"day={day}" / "part-0.parquet")
+    filters = json.dumps([{"type": "compare", "column": "day", "op": ">=", "value": "2026-10-02"}])
+    response = client.post(
+        "/profile",
+        data={"path": str(tmp_path / "sales"), "filters": filters},
+        params={"sections": "dataset_overview", "columns": "id,day"},
+    )
+    assert response.status_code == 200
+    columns = {column["column"]: column for column in response.json()["columns"]}
+    assert set(columns) == {"id", "day"}
+    assert columns["id"]["count"] == 40
+    assert columns["day"]["min"] == "2026-10-02"
+
+    unknown = client.post("/profile", data={"path": str(tmp_path / "sales")}, params={"columns": "nope"})
+    assert unknown.status_code == 422
+
+
+def test_profile_endpoint_errors(profile_csv: str, tmp_path: Path) -> None:
+    """입력이 없거나 둘 다 있으면 422, 없는 경로는 404, 모르는 섹션은 422"""
+    assert client.post("/profile").status_code == 422
+    with open(profile_csv, "rb") as handle:
+        both = client.post("/profile", data={"path": profile_csv}, files={"file": ("a.csv", handle)})
+    assert both.status_code == 422
+    assert client.post("/profile", data={"path": str(tmp_path / "nope.csv")}).status_code == 404
+    response = client.post("/profile", data={"path": profile_csv}, params={"sections": "nope"})
+    assert response.status_code == 422
+
+
+def test_profile_endpoint_reuses_cached_sections(profile_csv: str, result_cache: ResultCache) -> None:
+    """같은 데이터와 파라미터의 섹션은 캐시에서 가져오고, 바뀐 파라미터의 섹션만 다시 계산"""
+    params = {"sections": "dataset_overview,correlation_matrix"}
+    first = client.post("/profile", data={"path": profile_csv}, params=params).json()
+    assert first["cached"] == []
+
+    second = client.post("/profile", data={"path": profile_csv}, params=params).json()
+    assert second["cached"] == ["column_metrics", "correlation_matrix", "dataset_overview"]
+    assert second["sections"] == first["sections"]
+
+    # 디스크 계층은 다른 프로세스(새 캐시 인스턴스)와도 공유된다
+    app.dependency_overrides[get_result_cache] = lambda: ResultCache(result_cache.directory)
+    third = client.post("/profile", data={"path": profile_csv}, params={**params, "correlation": "spearman"}).json()
+    assert third["cached"] == ["column_metrics", "dataset_overview"]
+    assert third["sections"]["correlation_matrix"]["method"] == "spearman"
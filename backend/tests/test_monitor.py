@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from polaris.monitor import QualityMonitor, population_stability, top_share_distance
+from polaris.sketches import SpaceSaving
+from polaris.streaming import Histogram
+
+
+def histogram_of(values: np.ndarray) -> Histogram:
+    histogram = Histogram()
+    histogram.update(values)
+    return histogram
+
+
+def space_saving_of(values: list[str]) -> SpaceSaving:
+    sketch = SpaceSaving(capacity=10)
+    sketch.update(pl.Series(values))
+    return sketch
+
+
+def test_population_stability_separates_same_and_shifted_distributions() -> None:
+    """같은 분포의 PSI 는 주의 기준보다 작고, 표준편차만큼 이동한 분포는 유의미한 변화로 본다"""
+    rng = np.random.default_rng(0)
+    baseline = histogram_of(rng.normal(0, 1, 50_000))
+    assert population_stability(baseline, histogram_of(rng.normal(0, 1, 20_000))) < 0.01
+    shifted = population_stability(baseline, histogram_of(rng.normal(1, 1, 20_000)))
+    assert shifted is not None and shifted > 0.2
+    assert population_stability(baseline, Histogram()) is None
+
+
+def test_top_share_distance_is_total_variation_of_shares() -> None:
+    """상위값 비율의 총변동 거리: 같으면 0, 겹치지 않으면 1, 부분 이동은 옮겨간 비율만큼"""
+    baseline = space_saving_of(["a"] * 50 + ["b"] * 50)
+    assert top_share_distance(baseline, space_saving_of(["a", "b"] * 10)) == pytest.approx(0.0)
+    assert top_share_distance(baseline, space_saving_of(["c"] * 10)) == pytest.approx(1.0)
+    assert top_share_distance(baseline, space_saving_of(["a"] * 70 + ["b"] * 30)) == pytest.approx(0.2)
+    assert top_share_distance(baseline, SpaceSaving()) is None
+
+
+def test_update_reports_drift_and_schema_changes(tmp_path: Path) -> None:
+    """기준선과 다른 분포·널 비율·스키마의 델타는 드리프트로 보고하고 기준선에 합친다"""
+    rng = np.random.default_rng(1)
+    monitor = QualityMonitor(str(tmp_path / "feed.pqm"), precision=10)
+    monitor.update(pl.DataFrame({"x": rng.normal(0, 1, 5_000), "c": rng.choice(["a", "b"], 5_000)}))
+    same = monitor.update(pl.DataFrame({"x": rng.normal(0, 1, 2_000), "c": rng.choice(["a", "b"], 2_000)}))
+    assert same.drifted == [] and same.schema_changes == []
+
+    drifted = monitor.update(
+        pl.DataFrame({"x": rng.normal(3, 1, 2_000), "c": ["z"] * 2_000, "new": [1] * 2_000}).with_columns(
+            pl.col("x").cast(pl.Utf8)
+        )
+    )
+    assert set(drifted.drifted) == {"x", "c"}
+    assert drifted.schema_changes == ["dtype changed: x Float64 -> String", "new column: new"]
+    row = drifted.columns.row(0, named=True)
+    assert row["mean_shift_std"] == pytest.approx(3, abs=0.2)
+    assert row["out_of_range"] is True
+    assert monitor.rows == 9_000
+    assert [entry["delta_rows"] for entry in monitor.history] == [5_000, 2_000, 2_000]
+
+
+def test_update_csv_reads_only_appended_complete_lines(tmp_path: Path) -> None:
+    """CSV 피드는 지난번 이후 덧붙은 완성된 줄만 읽고, 저장했다 다시 열어도 이어서 읽는다"""
+    path = tmp_path / "feed.csv"
+    path.write_text("x,c\n1,a\n2,b\n")
+    state = str(tmp_path / "feed.pqm")
+    monitor = QualityMonitor(state, precision=10)
+    assert monitor.update_csv(str(path)).delta_rows == 2
+
+    # 쓰는 중인 마지막 줄(개행 없음)은 다음 갱신까지 미룬다
+    with open(path, "a") as f:
+        f.write("3,c\n4,")
+    assert monitor.update_csv(str(path)).delta_rows == 1
+    monitor.save()
+
+    monitor = QualityMonitor.open(state)
+    with open(path, "a") as f:
+        f.write("d\n")
+    report = monitor.update_csv(str(path))
+    assert report.delta_rows == 1
+    assert monitor.profile.columns["x"].max == 4
+    assert monitor.update_csv(str(path)).delta_rows == 0
+    assert monitor.source is not None and monitor.source["offset"] == path.stat().st_size
+
+
+def test_update_csv_rejects_rewritten_feeds(tmp_path: Path) -> None:
+    """헤더가 바뀌거나 이미 읽은 구간이 고쳐진 파일은 이어 읽지 않는다"""
+    path = tmp_path / "feed.csv"
+    path.write_text("x,c\n1,a\n2,b\n")
+    monitor = QualityMonitor(str(tmp_path / "feed.pqm"), precision=10)
+    monitor.update_csv(str(path))
+
+    path.write_text("x,c\n1,a\n9,b\n3,c\n")
+    with pytest.raises(ValueError, match="append-only"):
+        monitor.update_csv(str(path))
+    path.write_text("x,d\n1,a\n2,b\n3,c\n")
+    with pytest.raises(ValueError, match="different header"):
+        monitor.update_csv(str(path))
+    assert monitor.rows == 2
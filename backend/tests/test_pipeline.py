@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from pipeline import PipelineError, PipelineNode, compile_pipeline, scan_source
+
+
+@pytest.fixture(autouse=True)
+def data_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Input 노드가 읽을 수 있는 데이터 루트를 임시 디렉터리로 교체"""
+    monkeypatch.setattr("pipeline.DATA_ROOT", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> str:
+    """파이프라인 입력으로 쓸 예시 Parquet 파일"""
+    path = tmp_path / "sales.parquet"
+    pl.DataFrame({"region": ["a", "b", "a", "c"], "amount": [10, 20, 30, 40], "note": ["x"] * 4}).write_parquet(path)
+    return str(path)
+
+
+def test_filter_chain_is_fused_and_pushed_down(source: str, tmp_path: Path) -> None:
+    """연속된 Filter 노드는 하나의 술어로 합쳐져 스캔까지 내려간다"""
+    nodes = [
+        PipelineNode("customInput-1", "Input", {"sourceType": "upload", "path": source}),
+        PipelineNode("filter-1", "Filter", {"column": "amount", "operator": ">", "value": "15"}),
+        PipelineNode("filter-2", "Filter", {"column": "region", "operator": "!=", "value": "c"}),
+        PipelineNode("customOutput-1", "Output", {"fileName": "result", "format": "Parquet"}),
+        PipelineNode("text-1", "text", {"text": "memo"}),
+    ]
+    edges = [("customInput-1", "filter-1"), ("filter-1", "filter-2"), ("filter-2", "customOutput-1")]
+    plan = compile_pipeline(nodes, edges, str(tmp_path / "out"))
+
+    explained = plan.explain()
+    assert "SELECTION" in explained
+    assert "FILTER" not in explained
+    outputs = plan.run()
+    assert outputs == {"customOutput-1": str(tmp_path / "out" / "result.parquet")}
+    result = pl.read_parquet(outputs["customOutput-1"])
+    assert result["amount"].to_list() == [20, 30]
+
+
+def test_branches_share_the_input_scan(source: str, tmp_path: Path) -> None:
+    """한 입력에서 갈라진 두 출력은 같은 부분 계획을 공유하고 함께 실행된다"""
+    nodes = [
+        PipelineNode("in", "Input", {"path": source}),
+        PipelineNode("high", "Filter", {"column": "amount", "operator": ">=", "value": "30"}),
+        PipelineNode("low", "Filter", {"column": "amount", "operator": "<", "value": "30"}),
+        PipelineNode("out-high", "Output", {"fileName": "high.csv", "format": "CSV"}),
+        PipelineNode("out-low", "Output", {"fileName": "low", "format": "CSV"}),
+        PipelineNode("out-all", "Output", {"fileName": "all", "format": "CSV"}),
+    ]
+    edges = [("in", "high"), ("in", "low"), ("high", "out-high"), ("low", "out-low"), ("in", "out-all")]
+    plan = compile_pipeline(nodes, edges, str(tmp_path))
+    assert "CACHE" in plan.explain()
+    outputs = plan.run()
+    assert pl.read_csv(outputs["out-high"])["amount"].to_list() == [30, 40]
+    assert pl.read_csv(outputs["out-low"])["amount"].to_list() == [10, 20]
+    assert pl.read_csv(outputs["out-all"]).height == 4
+
+
+def test_merged_inputs_are_concatenated(source: str, tmp_path: Path) -> None:
+    """여러 입력이 한 노드로 들어오면 세로로 이어 붙인다"""
+    nodes = [
+        PipelineNode("in-1", "Input", {"path": source}),
+        PipelineNode("in-2", "Input", {"path": source}),
+        PipelineNode("out", "Output", {"fileName": "both"}),
+    ]
+    outputs = compile_pipeline(nodes, [("in-1", "out"), ("in-2", "out")], str(tmp_path)).run()
+    assert pl.read_csv(outputs["out"]).height == 8
+
+
+@pytest.mark.parametrize(
+    ("nodes", "edges", "message"),
+    [
+        (
+            [PipelineNode("f1", "Filter", {"column": "amount", "value": "1"}), PipelineNode("f2", "Filter")],
+            [("f1", "f2"), ("f2", "f1")],
+            "cycle",
+        ),
+        ([PipelineNode("out", "Output")], [("ghost", "out")], "unknown"),
+        ([PipelineNode("out", "Output")], [], "no input"),
+        ([PipelineNode("in", "Input")], [], "missing 'path'"),
+    ],
+)
+def test_invalid_pipelines(nodes: list[PipelineNode], edges: list[tuple[str, str]], message: str) -> None:
+    """순환, 끊어진 엣지, 빠진 설정은 실행 전에 PipelineError"""
+    with pytest.raises(PipelineError, match=message):
+        compile_pipeline(nodes, edges)
+
+
+def test_filter_value_must_match_column_type(source: str) -> None:
+    """컬럼 타입으로 변환할 수 없는 필터 값은 실행 전에 거부"""
+    nodes = [
+        PipelineNode("in", "Input", {"path": source}),
+        PipelineNode("f", "Filter", {"column": "amount", "operator": ">", "value": "lots"}),
+    ]
+    with pytest.raises(PipelineError, match="is not a"):
+        compile_pipeline(nodes, [("in", "f")])
+
+
+def test_filter_without_value_is_rejected(source: str) -> None:
+    """값이 빠진 필터는 빈 결과를 내는 대신 실행 전에 거부"""
+    nodes = [
+        PipelineNode("in", "Input", {"path": source}),
+        PipelineNode("f", "Filter", {"column": "amount", "operator": ">"}),
+    ]
+    with pytest.raises(PipelineError, match="missing 'value'"):
+        compile_pipeline(nodes, [("in", "f")])
+
+
+def test_input_sources_are_allowlisted(source: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """데이터 루트 밖의 경로와 허용 목록에 없는 원격 URL 은 읽지 않는다"""
+    assert scan_source("sales.parquet").collect().height == 4
+    for location in ("/etc/passwd", "../x.csv", "file:///etc/passwd", "http://169.254.169.254/latest/meta-data"):
+        with pytest.raises(PermissionError):
+            scan_source(location)
+    with pytest.raises(PermissionError):
+        compile_pipeline([PipelineNode("in", "Input", {"url": "https://example.com/data.csv"})], [])
+    # 허용한 호스트의 https URL 만 원격으로 스캔 (실제 요청은 collect 할 때 일어난다)
+    monkeypatch.setattr("pipeline.REMOTE_HOSTS", ("example.com",))
+    scan_source("https://example.com/data.parquet")
+    with pytest.raises(PermissionError):
+        scan_source("http://example.com/data.parquet")
@@ -0,0 +1,46 @@
+import struct
+
+import numpy as np
+import polars as pl
+
+from polaris.render import ImageCache, figure_to_png, histogram_bins, histogram_chart, small_multiples
+
+
+def png_size(image: bytes) -> tuple[int, int]:
+    assert image[:8] == b"\x89PNG\r\n\x1a\n"
+    width, height = struct.unpack(">II", image[16:24])
+    return width, height
+
+
+def test_histogram_bins_feed_both_chart_backends() -> None:
+    """한 번의 집계로 모든 컬럼의 구간을 만들고, 같은 구간으로 plotly 막대와 패널 그림을 그린다"""
+    rng = np.random.default_rng(0)
+    df = pl.DataFrame({"x": rng.normal(0, 1, 1_000), "y": rng.uniform(0, 10, 1_000)})
+    bins = histogram_bins(df, ["x", "y"], bin_count=8)
+    assert histogram_bins(df, []) == {}
+    assert all(b.height == 8 and b["count"].sum() == 1_000 for b in bins.values())
+
+    bar = histogram_chart(bins["y"], title="y").data[0]
+    assert len(bar.x) == 8 and bar.y.sum() == 1_000
+
+    fig = small_multiples(bins, cols_per_row=3, panel_size=(2, 1.5))
+    visible = [ax for ax in fig.axes if ax.get_visible()]
+    assert [ax.get_title() for ax in visible] == ["x", "y"] and len(fig.axes) == 3
+    width, _ = png_size(figure_to_png(fig, width_px=300, pixel_ratio=2))
+    # 표시 폭의 2배 픽셀로 그리고, bbox_inches="tight" 가 빈 여백만큼 잘라낸다
+    assert 300 < width <= 600
+
+
+def test_image_cache_is_bounded_by_total_size() -> None:
+    """이미지 캐시는 총 바이트 한도를 넘으면 가장 오래 쓰지 않은 그림부터 버린다"""
+    cache = ImageCache(max_bytes=250)
+    for key in "abc":
+        cache.put(key, key.encode() * 100)
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    cache.put("d", b"d" * 100)
+    assert cache.get("c") is None and cache.get("b") is not None
+    cache.put("b", b"changed")
+    assert cache.get("b") == b"b" * 100
+    cache.put("huge", b"x" * 1_000)
+    assert cache.get("huge") is not None and cache.get("b") is None
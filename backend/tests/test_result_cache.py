@@ -0,0 +1,134 @@
+import os
+import pickle
+import stat
+import time
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from polaris.cache import ResultCache, cache_key, result_cache_secret
+from polaris.instrument import Recorder
+from polaris.profile import EDAEngine
+from polaris.quality import QualityAssessment
+
+
+def test_memory_tier_evicts_least_recently_used() -> None:
+    """메모리 계층은 크기 한도를 넘으면 가장 오래 쓰지 않은 결과부터 버린다"""
+    cache = ResultCache(max_bytes=2500)
+    for name in ("a", "b", "c"):
+        cache.put(name, b"x" * 1000)
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    cache.put("d", b"x" * 1000)
+    assert cache.get("c") is None
+    assert cache.get("b") is not None
+
+
+def test_disk_tier_is_shared_and_expires(tmp_path: Path) -> None:
+    """디스크 계층은 같은 디렉터리를 쓰는 다른 인스턴스와 공유되고 TTL 이 지나면 사라진다"""
+    key = cache_key("dataset", "section", {"method": "exact"})
+    ResultCache(str(tmp_path)).put(key, {"rows": 3})
+    other = ResultCache(str(tmp_path), ttl=60)
+    assert other.get(key) == {"rows": 3}
+
+    path = tmp_path / f"{key}.pkl"
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+    assert ResultCache(str(tmp_path), ttl=60).get(key) is None
+    assert not path.exists()
+
+
+def test_disk_tier_drops_least_recently_read(tmp_path: Path) -> None:
+    """디스크 한도를 넘으면 가장 오래 읽지 않은 파일부터 지운다"""
+    cache = ResultCache(str(tmp_path), max_disk_bytes=2500)
+    cache.put("a", b"x" * 1000)
+    cache.put("b", b"x" * 1000)
+    past = time.time() - 10
+    os.utime(tmp_path / "b.pkl", (past, past))
+    cache.put("c", b"x" * 1000)
+    assert sorted(os.listdir(tmp_path)) == ["a.pkl", "c.pkl"]
+
+
+@pytest.mark.parametrize("params", [{"method": "exact"}, {"method": "sketch"}])
+def test_cache_key_depends_on_parameters(params: dict) -> None:
+    """파라미터가 다르면 키도 다르고, 딕셔너리 순서는 상관없다"""
+    key = cache_key("dataset", "section", {**params, "top_k": 20})
+    assert key == cache_key("dataset", "section", {"top_k": 20, **params})
+    assert key != cache_key("dataset", "section", {**params, "top_k": 10})
+
+
+def test_quality_assessment_reuses_cached_report(tmp_path: Path) -> None:
+    """같은 데이터와 규칙의 품질 평가는 캐시에서 지표와 규칙 결과를 함께 복원"""
+    df = pl.DataFrame({"age": [30, -5, 200], "email": ["a@b.com", "bad", None]})
+    rules = [{"type": "range", "column": "age", "min": 0, "max": 120}]
+    cache = ResultCache(str(tmp_path))
+    first = QualityAssessment(df, fingerprint="people", result_cache=cache)
+    metrics = first.assess_data_quality(rules=rules)
+
+    second = QualityAssessment(df, fingerprint="people", result_cache=ResultCache(str(tmp_path)))
+    assert second.assess_data_quality(rules=rules).equals(metrics)
+    assert second.report is not None and second.report["range:age"].failed == 2
+    assert len(os.listdir(tmp_path)) == 1
+    second.assess_data_quality(rules=[])
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_lazy_engine_scans_only_for_cache_misses(tmp_path: Path) -> None:
+    """lazy 모드에서 모든 섹션이 캐시에 있으면 통계 스캔을 하지 않고, 빠진 섹션이 있을 때만 한 번 스캔한다"""
+    lf = pl.LazyFrame({"x": [1.0, 2.0, 3.0], "grade": ["a", "b", "a"]})
+    sections = ["dataset_overview", "categorical_data_analysis"]
+    first = EDAEngine(lf, fingerprint="grades", result_cache=ResultCache(str(tmp_path)))
+    expected = first.profile(sections)
+    assert first._stats is not None
+
+    recorder = Recorder()
+    second = EDAEngine(lf, fingerprint="grades", result_cache=ResultCache(str(tmp_path)), recorder=recorder)
+    assert second.profile(sections).sections == expected.sections
+    assert second._stats is None and second.cache_hits == {*sections, "column_metrics"}
+    assert [span["rows"] for span in recorder.rows()] == [None, None]
+
+    second.profile(["visualize_numeric_data"])
+    assert second._stats is not None and second.cache_hits == {*sections, "column_metrics"}
+
+
+class Exploit:
+    """역직렬화되면 표시 파일을 만드는 객체 (실행되면 안 된다)"""
+
+    def __init__(self, marker: str):
+        self.marker = marker
+
+    def __reduce__(self) -> tuple:
+        return (open, (self.marker, "w"))
+
+
+def test_disk_tier_ignores_files_it_did_not_sign(tmp_path: Path) -> None:
+    """서명이 맞지 않는 파일(다른 사용자가 쓴 pickle, 다른 키의 파일)은 읽지 않고 지운다"""
+    directory = tmp_path / "results"
+    cache = ResultCache(str(directory), secret=b"k" * 32)
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+    marker = tmp_path / "pwned"
+    forged = directory / f"{cache_key('d', 's')}.pkl"
+    forged.write_bytes(b"\0" * 32 + pickle.dumps(Exploit(str(marker))))
+    assert cache.get(cache_key("d", "s")) is None
+    assert not marker.exists()
+    assert not forged.exists()
+
+    cache.put("a", {"rows": 1})
+    os.replace(directory / "a.pkl", directory / "b.pkl")
+    assert ResultCache(str(directory), secret=b"k" * 32).get("b") is None
+    cache.put("a", {"rows": 1})
+    assert ResultCache(str(directory), secret=b"other" * 8).get("a") is None
+
+
+def test_result_cache_secret_is_private_and_stable(tmp_path: Path) -> None:
+    """서명 키는 처음 쓸 때 0600 으로 만들어지고 이후 같은 값을 돌려준다"""
+    path = tmp_path / "keys" / "result-cache.key"
+    secret = result_cache_secret(str(path))
+    assert len(secret) == 32
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert result_cache_secret(str(path)) == secret
+    os.chmod(path, 0o644)
+    with pytest.raises(PermissionError):
+        result_cache_secret(str(path))
@@ -0,0 +1,65 @@
+import numpy as np
+import polars as pl
+
+from polaris.sampling import (
+    quantile_strata,
+    reservoir_sample,
+    sample_indices,
+    score_in_batches,
+    stratified_indices,
+)
+
+
+def test_uniform_sample_is_sorted_unique_and_seeded() -> None:
+    """예산 안이면 표본을 만들지 않고, 넘으면 같은 시드에서 같은 정렬된 행 위치를 고른다"""
+    assert sample_indices(100, 100) is None
+    picked = sample_indices(10_000, 500, seed=7)
+    assert picked is not None and len(np.unique(picked)) == 500
+    assert np.array_equal(picked, np.sort(picked))
+    assert np.array_equal(picked, sample_indices(10_000, 500, seed=7))
+
+
+def test_stratified_sample_keeps_every_stratum_in_proportion() -> None:
+    """층화 표본은 드문 층도 최소 한 행을 남기고 큰 층은 크기에 비례해 뽑는다"""
+    strata = np.repeat([0, 1, 2], [9_000, 990, 10])
+    picked = stratified_indices(strata, 1_000)
+    assert picked is not None
+    counts = np.bincount(strata[picked], minlength=3)
+    assert counts[0] == 900 and counts[1] == 99 and counts[2] == 1
+    assert stratified_indices(strata, 20_000) is None
+
+
+def test_quantile_strata_bucket_targets_and_mark_missing() -> None:
+    """수치 목표값은 분위수 구간으로 나누고, 유한하지 않은 값은 -1 층에 둔다"""
+    values = np.concatenate([np.arange(1_000, dtype=float), [np.nan, np.inf]])
+    strata = quantile_strata(values, bins=4)
+    assert np.bincount(strata[:1_000]).tolist() == [250, 250, 250, 250]
+    assert strata[-2:].tolist() == [-1, -1]
+    assert quantile_strata(np.array([np.nan, np.nan])).tolist() == [0, 0]
+
+
+def test_reservoir_sample_is_uniform_over_the_stream() -> None:
+    """배치 스트림의 저수지 표본은 예산 크기이고 각 행이 고르게 뽑힌다"""
+    df = pl.DataFrame({"row": range(2_000)})
+    sample, seen = reservoir_sample(df.iter_slices(300), budget=100, seed=1)
+    assert seen == 2_000 and sample.height == 100
+    assert sample["row"].n_unique() == 100
+
+    hits = np.zeros(10, dtype=np.int64)
+    for seed in range(400):
+        sample, _ = reservoir_sample(df.iter_slices(300), budget=100, seed=seed)
+        hits += np.bincount(sample["row"].to_numpy() // 200, minlength=10)
+    # 200 행씩 나눈 10개 구간이 기대치(400 * 100 / 10)에서 크게 벗어나지 않는다
+    assert np.all(np.abs(hits - 4_000) < 300)
+
+    small, seen = reservoir_sample(df.head(30).iter_slices(7), budget=100)
+    assert seen == 30 and small["row"].to_list() == list(range(30))
+    empty, seen = reservoir_sample([], budget=10)
+    assert seen == 0 and empty.is_empty()
+
+
+def test_score_in_batches_concatenates_predictions() -> None:
+    """배치별 예측을 이어 붙이고, 배치가 없으면 빈 배열을 돌려준다"""
+    batches = [np.arange(3), np.arange(3, 5)]
+    assert score_in_batches(lambda batch: batch * 2, batches).tolist() == [0, 2, 4, 6, 8]
+    assert len(score_in_batches(lambda batch: batch, [])) == 0
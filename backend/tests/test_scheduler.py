@@ -0,0 +1,37 @@
+import contextvars
+import threading
+
+from polaris.scheduler import run_sections
+
+REQUEST = contextvars.ContextVar("request", default=None)
+
+
+def test_sections_run_concurrently_and_report_errors() -> None:
+    """섹션은 동시에 실행되고, 실패한 섹션은 예외 대신 결과로 전달되며, 호출자의 컨텍스트를 본다"""
+    barrier = threading.Barrier(2, timeout=10)
+
+    def meet() -> str:
+        # 두 섹션이 동시에 실행될 때만 장벽을 통과한다
+        barrier.wait()
+        return str(REQUEST.get())
+
+    def fail() -> None:
+        raise RuntimeError("broken section")
+
+    token = REQUEST.set("req-1")
+    try:
+        runs = {run.name: run for run in run_sections({"a": meet, "b": meet, "bad": fail}, max_workers=3)}
+    finally:
+        REQUEST.reset(token)
+    assert (runs["a"].result, runs["b"].result) == ("req-1", "req-1")
+    assert isinstance(runs["bad"].error, RuntimeError) and runs["bad"].result is None
+    assert all(run.seconds >= 0 for run in runs.values())
+
+
+def test_single_worker_runs_in_order_on_the_calling_thread() -> None:
+    """작업이 하나뿐이거나 작업자를 1로 두면 호출한 스레드에서 순서대로 실행한다"""
+    caller = threading.get_ident()
+    assert [run.result for run in run_sections({"thread": threading.get_ident})] == [caller]
+    runs = list(run_sections({"x": lambda: 1, "y": lambda: 2, "thread": threading.get_ident}, max_workers=1))
+    assert [(run.name, run.result) for run in runs] == [("x", 1), ("y", 2), ("thread", caller)]
+    assert list(run_sections({})) == []
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from benchmarks.topk_memory import measure
+from polaris.monitor import QualityMonitor
+from polaris.sketches import DuplicateEstimator, HyperLogLog, SpaceSaving
+
+
+def test_space_saving_streams_high_cardinality_column_in_chunks() -> None:
+    """고유값이 많은 컬럼도 청크 단위로 흘려 보내며 카운터 수는 capacity 를 넘지 않는다"""
+    rng = np.random.default_rng(0)
+    heavy = ["a"] * 30_000 + ["b"] * 20_000
+    values = pl.Series("c", [*heavy, *(f"v{i}" for i in range(200_000))]).sample(fraction=1.0, shuffle=True, seed=1)
+    sketch = SpaceSaving(capacity=50)
+    sketch.update(values, chunk_size=int(rng.integers(5_000, 10_000)))
+    assert len(sketch.counts) <= 50
+    assert sketch.total == len(values)
+    (first, first_count, first_error), (second, second_count, second_error) = sketch.top(2)
+    assert (first, second) == ("a", "b")
+    # 보고된 빈도는 실제 빈도 이상이고 그 초과분은 error 와 max_error 안에 있다
+    assert 30_000 <= first_count <= 30_000 + first_error
+    assert 20_000 <= second_count <= 20_000 + second_error
+    assert max(first_error, second_error) <= sketch.max_error
+
+
+def test_space_saving_memory_does_not_grow_with_cardinality() -> None:
+    """모든 값이 고유한 컬럼에서 스케치의 최대 메모리는 정확한 value_counts 보다 작다"""
+    rows = 2_000_000
+    exact = measure("exact", rows, rows)
+    sketch = measure("sketch", rows, rows)
+    assert sketch["peak_over_column_mb"] < exact["peak_over_column_mb"]
+    assert measure("sketch", rows, 10)["peak_over_column_mb"] <= sketch["peak_over_column_mb"] + 16
+
+
+def test_persisted_sketches_refuse_another_hash_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """다른 Polars 버전의 해시로 만든 기준선은 조용히 합치지 않고 거부한다"""
+    sketch = HyperLogLog(precision=10)
+    sketch.update(pl.Series(range(1000)))
+    assert HyperLogLog.from_bytes(sketch.to_bytes()).estimate() == sketch.estimate()
+
+    monitor = QualityMonitor(str(tmp_path / "baseline.bin"))
+    monitor.update(pl.DataFrame({"x": range(100), "y": ["a", "b"] * 50}))
+    monitor.save()
+    monkeypatch.setattr("polaris.sketches.HASH_VERSION", "polars-0.0.0")
+    with pytest.raises(ValueError, match="rebuild the baseline"):
+        QualityMonitor.open(monitor.path)
+
+
+@pytest.mark.parametrize("distinct", [500, 50_000, 400_000])
+def test_hyperloglog_estimate_stays_within_error_bound(distinct: int) -> None:
+    """추정값은 상대 표준오차의 3배 안에 있고, 나눠 만든 스케치를 합치면 한 번에 만든 것과 같다"""
+    values = pl.Series(np.arange(distinct) * 7919).cast(pl.Utf8)
+    whole = HyperLogLog(precision=12)
+    whole.update(pl.concat([values, values.head(distinct // 3)]))
+    assert abs(whole.estimate() - distinct) <= 3 * whole.relative_error * distinct
+
+    left, right = HyperLogLog(precision=12), HyperLogLog(precision=12)
+    left.update(values.head(distinct // 2))
+    right.update(values.tail(distinct - distinct // 2))
+    assert np.array_equal(left.merge(right).registers, whole.registers)
+    with pytest.raises(ValueError, match="precision"):
+        whole.merge(HyperLogLog(precision=10))
+
+
+def test_space_saving_merge_keeps_its_guarantees() -> None:
+    """합친 요약도 보고한 빈도가 실제 이상 실제+error 이하이고, total/capacity 를 넘는 값은 모두 남는다"""
+    rng = np.random.default_rng(4)
+    parts = [pl.Series("v", rng.zipf(1.3, 40_000) % 5_000).cast(pl.Utf8) for _ in range(3)]
+    merged = SpaceSaving(capacity=40)
+    for part in parts:
+        sketch = SpaceSaving(capacity=40)
+        sketch.update(part, chunk_size=7_000)
+        merged.merge(SpaceSaving.from_bytes(sketch.to_bytes()))
+    values = pl.concat(parts)
+    exact = dict(values.value_counts().iter_rows())
+    assert merged.total == len(values)
+    for item, count, error in merged.top(40):
+        assert exact[item] <= count <= exact[item] + error
+        assert error <= merged.max_error
+    heavy = {item for item, count in exact.items() if count > merged.total / merged.capacity}
+    assert heavy <= set(merged.counts)
+
+
+def test_duplicate_estimator_counts_repeated_rows() -> None:
+    """행 해시 HLL 로 추정한 중복 행 수는 실제 중복 수에 가깝고 배치 병합에도 그대로다"""
+    df = pl.DataFrame({"a": np.arange(20_000) % 15_000, "b": (np.arange(20_000) % 15_000).astype(str)})
+    whole = DuplicateEstimator(precision=14)
+    whole.update(df)
+    parts = DuplicateEstimator(precision=14)
+    for batch in df.iter_slices(6_000):
+        part = DuplicateEstimator(precision=14)
+        part.update(batch)
+        parts.merge(DuplicateEstimator.from_bytes(part.to_bytes()))
+    assert parts.rows == whole.rows == 20_000
+    assert parts.duplicate_rows() == whole.duplicate_rows()
+    assert abs(whole.duplicate_rows() - 5_000) <= 3 * whole.distinct.relative_error * 15_000
+    only_a = DuplicateEstimator()
+    only_a.update(df.with_columns(b=pl.lit("x")), subset=["b"])
+    assert only_a.distinct_rows() == 1
@@ -0,0 +1,156 @@
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from polaris.ingest import read_upload
+from polaris.quality import CompareRule, FreshnessRule, RangeRule, rule_from_dict
+from polaris.source import DatasetSource, partition_values, resolve_data_path
+from polaris.streaming import StreamingProfiler
+
+DAYS = [date(2026, 10, 1) + timedelta(days=i) for i in range(4)]
+WRITERS = {"csv": "csv", "parquet": "parquet", "ipc": "arrow", "ndjson": "ndjson"}
+
+
+def write_partitioned(root: Path, fmt: str) -> Path:
+    """day=YYYY-MM-DD 디렉터리마다 파일 하나씩 쓴 hive 파티션 데이터셋"""
+    for i, day in enumerate(DAYS):
+        part = root / fmt / f"day={day}"
+        part.mkdir(parents=True)
+        frame = pl.DataFrame({"id": range(i * 10, i * 10 + 10), "amount": [i * 1.5] * 10, "grade": ["a", "b"] * 5})
+        getattr(frame, f"write_{fmt}")(part / f"part-0.{WRITERS[fmt]}")
+    (root / fmt / "_SUCCESS").write_text("")
+    return root / fmt
+
+
+@pytest.mark.parametrize("fmt", WRITERS)
+def test_partitioned_directory_scans_with_partition_column(tmp_path: Path, fmt: str) -> None:
+    """포맷과 관계없이 key=value 디렉터리는 타입이 있는 파티션 컬럼이 된다 (메타 파일은 무시)"""
+    source = DatasetSource(str(write_partitioned(tmp_path, fmt)))
+    assert source.format == fmt
+    assert len(source.files()) == 4
+    df = source.scan().collect()
+    assert df.height == 40
+    assert df.schema["day"] == pl.Date
+    assert sorted(df["day"].unique().to_list()) == DAYS
+
+
+@pytest.mark.parametrize("fmt", WRITERS)
+def test_filters_on_partition_columns_prune_files(tmp_path: Path, fmt: str) -> None:
+    """파티션 컬럼만 보는 필터는 해당 파일을 아예 읽지 않고, 컬럼 선택도 스캔에 반영된다"""
+    source = DatasetSource(
+        str(write_partitioned(tmp_path, fmt)),
+        columns=("id", "day"),
+        filters=(CompareRule("day", op=">=", value="2026-10-03"), RangeRule("id", max=34)),
+    )
+    assert source.pruned_partitions()["day"].to_list() == DAYS[2:]
+    df = source.scan().collect()
+    assert df.columns == ["id", "day"]
+    assert sorted(df["id"].to_list()) == list(range(20, 35))
+
+
+def test_parquet_scan_pushes_projection_and_predicate(tmp_path: Path) -> None:
+    """Parquet 스캔에는 고른 컬럼과 행 필터가 그대로 내려간다"""
+    root = write_partitioned(tmp_path, "parquet")
+    source = DatasetSource(str(root), columns=("id",), filters=(RangeRule("id", min=35),))
+    plan = source.scan().explain()
+    assert "PROJECT 1/4 COLUMNS" in plan
+    assert 'col("id") >= 35' in plan
+    # 파티션 필터로 모두 걸러져도 빈 결과를 같은 스키마로 돌려준다
+    empty = DatasetSource(source.path, filters=(CompareRule("day", op=">", value="2030-01-01"),)).scan().collect()
+    assert empty.height == 0 and "day" in empty.columns
+
+
+def test_glob_source_and_relative_freshness(tmp_path: Path) -> None:
+    """glob 으로 고른 파일만 읽고, 상대 기간 필터는 만든 시각(시 단위)에 고정된다"""
+    root = write_partitioned(tmp_path, "parquet")
+    source = DatasetSource(str(root / "day=2026-10-0[12]" / "*.parquet"))
+    assert source.scan().select(pl.len()).collect().item() == 20
+
+    recent = DatasetSource(str(root), filters=(rule_from_dict({"type": "freshness", "column": "day"}),))
+    (rule,) = recent.filters
+    assert isinstance(rule, FreshnessRule) and rule.now is not None
+    assert rule.now == datetime.now().replace(minute=0, second=0, microsecond=0)
+    assert recent.fingerprint() == DatasetSource(str(root), filters=recent.filters).fingerprint()
+
+
+def test_fingerprint_tracks_files_and_scope(tmp_path: Path) -> None:
+    """파일이 바뀌거나 범위가 달라지면 식별자도 바뀌고, key 가 있으면 범위가 없을 때 그대로 쓴다"""
+    root = write_partitioned(tmp_path, "csv")
+    source = DatasetSource(str(root))
+    assert source.fingerprint() == DatasetSource(str(root)).fingerprint()
+    assert DatasetSource(str(root), columns=("id",)).fingerprint() != source.fingerprint()
+    assert DatasetSource(str(root), key="abc").fingerprint() == "abc"
+    assert DatasetSource(str(root), key="abc", columns=("id",)).fingerprint() != "abc"
+
+    before = source.fingerprint()
+    os.utime(source.files()[0], ns=(0, 0))
+    assert source.fingerprint() != before
+
+    # 이름, 크기, 수정 시각이 같아도 다른 디렉터리의 파일은 다른 데이터다
+    for name, value in (("a", 1), ("b", 2)):
+        (tmp_path / name).mkdir()
+        pl.DataFrame({"id": [value]}).write_csv(tmp_path / name / "d.csv")
+        os.utime(tmp_path / name / "d.csv", ns=(0, 0))
+    left, right = (DatasetSource(str(tmp_path / name / "d.csv")) for name in "ab")
+    assert left.fingerprint() != right.fingerprint()
+
+
+def test_fingerprint_ignores_trailing_separators(tmp_path: Path) -> None:
+    """같은 glob 이나 디렉터리를 끝 구분자를 붙여 써도 같은 소스이고 식별자도 같다"""
+    root = write_partitioned(tmp_path, "csv")
+    plain = DatasetSource(os.path.join(str(root), "day=*", "*.csv"))
+    trailing = DatasetSource(os.path.join(str(root) + os.sep, "day=*" + os.sep, "*.csv"))
+    assert trailing == plain and trailing.fingerprint() == plain.fingerprint()
+    assert DatasetSource(str(root) + os.sep).fingerprint() == DatasetSource(str(root)).fingerprint()
+    assert trailing.partitions().equals(plain.partitions())
+
+
+def test_source_errors(tmp_path: Path) -> None:
+    """없는 경로는 FileNotFoundError, 없는 컬럼이나 모르는 포맷은 ValueError"""
+    with pytest.raises(FileNotFoundError):
+        DatasetSource(str(tmp_path / "nope"))
+    with pytest.raises(FileNotFoundError):
+        DatasetSource(str(tmp_path / "*.parquet"))
+    root = write_partitioned(tmp_path, "csv")
+    with pytest.raises(ValueError, match="unknown columns"):
+        DatasetSource(str(root), columns=("missing",)).scan()
+    with pytest.raises(ValueError, match="format"):
+        DatasetSource(str(root), format="xlsx")
+
+
+def test_partition_values_decodes_segments() -> None:
+    """경로의 key=value 조각만 파티션 값으로 읽는다"""
+    assert partition_values("region=ap%2Dnorth/day=2026-10-01/part.parquet") == {
+        "region": "ap-north",
+        "day": "2026-10-01",
+    }
+    assert partition_values("data/part.parquet") == {}
+
+
+def test_uploads_and_streaming_read_any_format(tmp_path: Path) -> None:
+    """업로드는 파일 이름의 확장자로 읽고, 스트리밍 프로파일은 어떤 소스의 스캔이든 배치로 읽는다"""
+    frame = pl.DataFrame({"id": range(100), "grade": ["a", "b"] * 50})
+    path = tmp_path / "upload.parquet"
+    frame.write_parquet(path)
+    with open(path, "rb") as handle:
+        assert read_upload(handle).equals(frame)
+
+    source = DatasetSource(str(path), filters=(RangeRule("id", min=90),))
+    profiler = StreamingProfiler(batch_size=4).profile_frame(source.scan(), total_rows=10)
+    assert profiler.rows == 10
+
+
+def test_root_confines_paths_globs_and_symlinks(tmp_path: Path) -> None:
+    """root 를 주면 상대 경로는 그 안에서 풀리고, 밖으로 나가는 경로와 링크는 PermissionError"""
+    root = tmp_path / "data"
+    dataset = write_partitioned(root, "parquet")
+    assert DatasetSource("parquet", root=str(root)).files() == DatasetSource(str(dataset)).files()
+    assert resolve_data_path("parquet/", str(root)) == str(dataset)
+    (tmp_path / "secret.csv").write_text("token\nabc\n")
+    (root / "escape").symlink_to(tmp_path)
+    for path in ("../secret.csv", str(tmp_path / "secret.csv"), "escape/secret.csv", "*/secret.csv", "/etc/**"):
+        with pytest.raises(PermissionError):
+            DatasetSource(path, root=str(root))
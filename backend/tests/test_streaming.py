@@ -0,0 +1,121 @@
+from datetime import date, datetime, time, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from polaris.streaming import ColumnAccumulator, Histogram, StreamingProfiler
+
+
+def exact_counts(values: np.ndarray, histogram: Histogram) -> np.ndarray:
+    # 구간 경계가 폭의 배수이므로 같은 경계로 센 정확한 도수와 같아야 한다
+    index = ((values - histogram.start) // histogram.width).astype(np.int64)
+    return np.bincount(index, minlength=histogram.bin_count)
+
+
+def test_histogram_merge_matches_single_pass_in_either_order() -> None:
+    """범위와 폭이 다른 두 히스토그램을 합치면 순서와 관계없이 한 번에 센 결과와 같다"""
+    rng = np.random.default_rng(0)
+    low, high = rng.uniform(0, 10, 5_000), rng.uniform(100, 300, 3_000)
+    single = Histogram()
+    single.update(low)
+    single.update(high)
+    for first, second in ((low, high), (high, low)):
+        left, right = Histogram(), Histogram()
+        left.update(first)
+        right.update(second)
+        merged = left.merge(right)
+        assert (merged.width, merged.start) == (single.width, single.start)
+        assert np.array_equal(merged.counts, single.counts)
+        assert np.array_equal(merged.counts, exact_counts(np.concatenate([low, high]), merged))
+
+
+def test_histogram_alignment_projects_both_sides_onto_one_grid() -> None:
+    """비교용 정렬은 두 분포를 같은 구간 위로 옮기며 도수 합을 보존한다"""
+    rng = np.random.default_rng(1)
+    narrow, wide = Histogram(), Histogram()
+    narrow.update(rng.normal(50, 1, 4_000))
+    wide.update(rng.normal(0, 100, 6_000))
+    expected, actual = narrow.aligned(wide)
+    assert (expected.sum(), actual.sum()) == (4_000, 6_000)
+    assert len(expected) == len(actual) == narrow.bin_count
+    # 좁은 분포는 넓은 격자의 한두 구간에 몰린다
+    assert np.count_nonzero(expected) <= 2
+
+    same, again = narrow.aligned(narrow)
+    assert np.array_equal(same, narrow.counts) and np.array_equal(again, narrow.counts)
+    assert Histogram().merge(narrow).counts.sum() == 4_000
+    assert np.array_equal(Histogram().aligned(narrow)[0], np.zeros(narrow.bin_count))
+
+
+def test_welford_moments_merge_like_one_pass() -> None:
+    """배치별 Welford 모멘트를 Chan 결합식으로 합치면 전체 평균과 분산이 그대로 나온다"""
+    rng = np.random.default_rng(2)
+    # 큰 오프셋에서도 자릿수 손실 없이 분산을 유지해야 한다
+    values = 1e9 + rng.normal(0, 3, 30_000)
+    whole = ColumnAccumulator("x", pl.Float64)
+    parts = [ColumnAccumulator("x", pl.Float64) for _ in range(3)]
+    for i, chunk in enumerate(np.array_split(values, 9)):
+        whole.update(pl.Series(chunk))
+        parts[i % 3].update(pl.Series(chunk))
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    for accumulator in (whole, merged):
+        assert accumulator.moment_count == len(values)
+        assert accumulator.mean == pytest.approx(values.mean(), rel=1e-15)
+        assert accumulator.std == pytest.approx(values.std(ddof=1), rel=1e-9)
+    assert merged.min == values.min() and merged.max == values.max()
+
+
+def test_profiler_state_round_trips_with_temporal_bounds() -> None:
+    """직렬화한 프로파일러를 되살리면 날짜·시간 min/max 의 타입과 모든 요약이 그대로다"""
+    df = pl.DataFrame(
+        {
+            "n": [3, None, 1, 7],
+            "f": [0.5, 2.5, None, -1.0],
+            "s": ["a", "b", "a", None],
+            "b": [True, False, True, True],
+            "d": [date(2024, 1, 3), date(2023, 12, 31), None, date(2024, 2, 1)],
+            "dt": [datetime(2024, 1, 1, 9), None, datetime(2023, 5, 6, 7, 8, 9), datetime(2024, 3, 1)],
+            "t": [time(9, 30), time(23, 59, 59), None, time(0, 0, 1)],
+            "td": [timedelta(hours=1), timedelta(seconds=-5), timedelta(days=2), None],
+        }
+    )
+    profiler = StreamingProfiler(batch_size=2, top_k=5, precision=10)
+    for batch in df.iter_slices(2):
+        profiler.update(batch)
+    restored = StreamingProfiler.from_bytes(profiler.to_bytes())
+
+    assert restored.schema == df.schema
+    assert restored.summary().equals(profiler.summary())
+    assert restored.top_values("s").equals(profiler.top_values("s"))
+    assert restored.histogram("n").equals(profiler.histogram("n"))
+    bounds = {name: (column.min, column.max) for name, column in restored.columns.items()}
+    assert bounds["d"] == (date(2023, 12, 31), date(2024, 2, 1))
+    assert bounds["dt"] == (datetime(2023, 5, 6, 7, 8, 9), datetime(2024, 3, 1))
+    assert bounds["t"] == (time(0, 0, 1), time(23, 59, 59))
+    assert bounds["td"] == (timedelta(seconds=-5), timedelta(days=2))
+    assert type(bounds["d"][0]) is date
+
+    # 되살린 상태에 새 배치를 이어 합쳐도 처음부터 센 결과와 같다
+    extra = df.head(2)
+    restored.update(extra)
+    profiler.update(extra)
+    assert restored.summary().equals(profiler.summary())
+    with pytest.raises(ValueError, match="not a serialized"):
+        StreamingProfiler.from_bytes(b"nope")
+
+
+def test_profiler_merge_matches_single_profile() -> None:
+    """행을 나눠 따로 프로파일한 뒤 합친 결과가 한 번에 프로파일한 결과와 같다"""
+    rng = np.random.default_rng(3)
+    df = pl.DataFrame({"x": rng.normal(0, 1, 4_000), "c": rng.choice(["a", "b", "c"], 4_000)})
+    whole = StreamingProfiler(batch_size=1_000).profile_frame(df.lazy())
+    left = StreamingProfiler(batch_size=1_000).profile_frame(df.head(1_500).lazy())
+    right = StreamingProfiler(batch_size=1_000).profile_frame(df.tail(2_500).lazy())
+    merged = left.merge(right)
+    assert merged.rows == whole.rows == 4_000
+    expected, actual = whole.summary(), merged.summary()
+    assert actual.drop("mean", "std").equals(expected.drop("mean", "std"))
+    assert actual["mean"].to_list() == pytest.approx(expected["mean"].to_list())
+    assert merged.top_values("c").sort("c").equals(whole.top_values("c").sort("c"))
+    assert np.array_equal(merged.columns["x"].histogram.counts, whole.columns["x"].histogram.counts)
@@ -0,0 +1,92 @@
+"""Timing of the backend DAG validation on large synthetic pipelines.
+
+Node IDs are strings shaped like the frontend's (``customInput-17``). Shapes:
+
+- ``random``: edges go from earlier to later nodes of a shuffled order (a DAG)
+- ``chain``: one long path, far deeper than Python's recursion limit
+- ``cycle``: the random DAG plus one edge closing a long cycle
+
+Time grows linearly with the graph. 100k nodes and edges validate well under
+a second (about 0.1-0.25 s per shape on one core). 1M take about 1.5-2.5 s,
+and interning the string IDs is roughly 70% of that.
+
+    python benchmarks/dag_validation.py --nodes 100000 --edges 100000 --budget-s 0.5
+
+With ``--budget-s`` the script exits non-zero when any shape's best time is
+over the budget, so it can gate CI on a known machine. Without it, the
+default 1M run only reports timings.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+from graph import analyze_graph  # noqa: E402
+
+
+def make_graph(shape: str, nodes: int, edges: int, seed: int = 42) -> tuple[list[str], list[tuple[str, str]]]:
+    rng = random.Random(seed)
+    ids = [f"customInput-{i}" for i in range(nodes)]
+    rng.shuffle(ids)
+    if shape == "chain":
+        return ids, list(zip(ids, ids[1:], strict=False))
+    pairs = []
+    for _ in range(edges):
+        u, v = sorted(rng.sample(range(nodes), 2))
+        pairs.append((ids[u], ids[v]))
+    if shape == "cycle":
+        pairs.append((ids[-1], ids[0]))
+        pairs.extend(zip(ids[: nodes // 2], ids[1 : nodes // 2 + 1], strict=False))
+    return ids, pairs
+
+
+def run(nodes: int, edges: int, repeat: int = 3) -> dict[str, dict]:
+    """Best-of-``repeat`` timing of ``analyze_graph`` for every shape."""
+    results = {}
+    for shape in ("random", "chain", "cycle"):
+        node_ids, pairs = make_graph(shape, nodes, edges)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            analysis = analyze_graph(node_ids, pairs)
+            timings.append(time.perf_counter() - start)
+        results[shape] = {
+            "nodes": len(node_ids),
+            "edges": len(pairs),
+            "is_dag": analysis.is_dag,
+            "cycle_length": len(analysis.cycle),
+            "best_s": round(min(timings), 3),
+        }
+    return results
+
+
+def over_budget(results: dict[str, dict], budget_s: float) -> list[str]:
+    """Shapes whose best time exceeds ``budget_s`` seconds."""
+    return [shape for shape, result in results.items() if result["best_s"] > budget_s]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget-s", type=float, default=None, help="fail when any shape is slower than this")
+    args = parser.parse_args()
+
+    results = run(args.nodes, args.edges, args.repeat)
+    print(json.dumps(results, indent=2))
+    if args.budget_s is not None:
+        slow = over_budget(results, args.budget_s)
+        if slow:
+            print(f"over the {args.budget_s}s budget: {', '.join(slow)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Cold-start import cost of every dashboard page, measured with ``python -X importtime``.
+
+Each page's modules are imported in a fresh interpreter (a cold start, as in a
+new container), and the script reports the cumulative import time and whether
+any of the heavy scientific backends were loaded. Those (sklearn, scipy,
+seaborn, matplotlib and, for the quality page, plotly's figure factories) are
+imported only when a section actually fits a model or draws a figure, so
+loading one at import time is a regression. With ``--budget-ms`` a page that
+takes longer to import also fails; timings depend on the machine.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 1500 --output imports.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 페이지가 import 하는 진입 모듈
+PAGES = {
+    "main": ["utils.datasets"],
+    "eda_page": ["utils.datasets", "utils.eda", "utils.streaming"],
+    "data_quality_page": ["utils.datasets", "utils.quality"],
+    "profile_api": ["polaris.profile"],
+}
+# 그림을 그리거나 모델을 학습할 때만 불러와야 하는 모듈
+DEFERRED = ("sklearn", "scipy", "seaborn", "matplotlib")
+PAGE_DEFERRED = {
+    "data_quality_page": ("plotly.graph_objs", "plotly.subplots", "polaris.profile"),
+}
+
+
+def import_times(modules: list[str]) -> dict[str, tuple[int, int]]:
+    """``{module: (depth, cumulative_us)}`` for every module loaded by importing ``modules`` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": ROOT},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package" 형식 (들여쓰기 = 중첩 깊이)
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        stripped = name.lstrip()
+        times[stripped] = ((len(name) - len(stripped) - 1) // 2, int(cumulative))
+    return times
+
+
+def measure_page(page: str) -> dict:
+    modules = PAGES[page]
+    times = import_times(modules)
+    # 진입 모듈과 그 상위 패키지의 최상위 항목만 더하면 인터프리터 기동 시 import 는 빠진다
+    roots = {".".join(module.split(".")[: i + 1]) for module in modules for i in range(module.count(".") + 1)}
+    total_us = sum(cumulative for name, (depth, cumulative) in times.items() if depth == 0 and name in roots)
+    deferred = DEFERRED + PAGE_DEFERRED.get(page, ())
+    loaded = sorted(
+        module for module in deferred if any(name == module or name.startswith(f"{module}.") for name in times)
+    )
+    return {"page": page, "modules": modules, "total_ms": round(total_us / 1000, 1), "loaded_deferred": loaded}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", default=",".join(PAGES))
+    parser.add_argument("--budget-ms", type=float, help="fail when a page takes longer than this to import")
+    parser.add_argument("--output", help="write the results JSON here")
+    args = parser.parse_args()
+
+    results = [measure_page(page) for page in args.pages.split(",") if page]
+    failed = False
+    for result in results:
+        over_budget = args.budget_ms is not None and result["total_ms"] > args.budget_ms
+        failed = failed or over_budget or bool(result["loaded_deferred"])
+        loaded = ", ".join(result["loaded_deferred"]) or "-"
+        print(f"{result['page']:20s} {result['total_ms']:9.1f} ms  eagerly loaded: {loaded}", file=sys.stderr)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
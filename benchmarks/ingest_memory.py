@@ -0,0 +1,105 @@
+"""Peak-RSS comparison of upload ingestion strategies.
+
+Each strategy runs in a fresh interpreter so ``ru_maxrss`` reflects only that
+strategy. The upload is simulated with an in-memory ``BytesIO`` holding the
+whole file, the same as Streamlit's ``UploadedFile``. ``ipc_reopen`` is the
+dataset cache's disk tier: the memory-mapped Arrow IPC copy of the same data.
+
+    python benchmarks/ingest_memory.py --rows 2000000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STRATEGIES = {
+    "stringio": """
+from io import StringIO
+df = pl.read_csv(StringIO(upload.getvalue().decode("utf-8")), infer_schema_length=10000)
+""",
+    "spill": """
+from polaris.ingest import read_upload
+df = read_upload(upload)
+""",
+    "ipc_reopen": """
+df = pl.read_ipc(sys.argv[2])
+""",
+}
+
+RUNNER = """
+import io, os, resource, sys, tempfile
+import polars as pl
+
+def current_rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+with open(sys.argv[1], "rb") as f:
+    upload = io.BytesIO(f.read())
+baseline = current_rss()
+{body}
+df.shape
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+print(baseline, peak, current_rss())
+"""
+
+
+def write_reference_csv(path: str, rows: int) -> None:
+    import numpy as np
+    import polars as pl
+
+    rng = np.random.default_rng(42)
+    pl.DataFrame(
+        {
+            "id": np.arange(rows),
+            "amount": rng.normal(100, 15, rows),
+            "count": rng.integers(0, 1000, rows),
+            "category": rng.choice(["alpha", "beta", "gamma", "delta"], rows),
+            "comment": rng.choice(["ok", "late delivery", "n/a", "refund requested"], rows),
+        }
+    ).write_csv(path)
+
+
+def measure(strategy: str, csv_path: str, ipc_path: str) -> tuple[int, int, int]:
+    code = RUNNER.format(body=STRATEGIES[strategy])
+    out = subprocess.run(
+        [sys.executable, "-c", code, csv_path, ipc_path], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    baseline, peak, final = map(int, out.split())
+    return baseline, peak, final
+
+
+def main() -> None:
+    import polars as pl
+
+    from polaris.ingest import write_ipc
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "reference.csv")
+        ipc_path = os.path.join(tmp, "reference.arrow")
+        write_reference_csv(csv_path, args.rows)
+        write_ipc(pl.read_csv(csv_path, infer_schema_length=10000), ipc_path)
+        file_size = os.path.getsize(csv_path)
+        results = {"rows": args.rows, "file_mb": round(file_size / 1024**2, 1), "strategies": {}}
+        for name in STRATEGIES:
+            baseline, peak, final = measure(name, csv_path, ipc_path)
+            results["strategies"][name] = {
+                "peak_rss_mb": round(peak / 1024**2, 1),
+                "peak_over_upload_x_file": round((peak - baseline) / file_size, 2),
+                "resident_after_mb": round(final / 1024**2, 1),
+            }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
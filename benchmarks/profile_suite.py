@@ -0,0 +1,270 @@
+"""Timing and peak memory of the profiling hot paths, with a baseline regression check.
+
+Synthetic datasets are generated from a fixed seed in several shapes:
+
+- ``tall_narrow``: many rows, a handful of numeric/categorical columns
+- ``wide``: few rows, hundreds of numeric columns
+- ``high_cardinality``: string columns with (almost) one distinct value per row
+- ``date_heavy``: several date/datetime columns next to a measure
+- ``nested``: list and struct columns
+
+Every EDA section (the ``compute_*`` half of ``PolarisEDA``, without
+Streamlit rendering), every ``DataQuality`` metric and ``check_if_dag`` on
+large graphs is timed (best of ``--repeat``) and its peak resident memory
+above the starting point is sampled (``polaris.instrument.Recorder`` spans). Results are written as JSON; with
+``--baseline`` each case is compared against a stored run and the script
+exits with status 1 when one is slower (or larger) than the threshold allows.
+``profile_baseline.json`` is a run with the default settings; timings only
+compare on the same machine, so regenerate it where the comparison runs.
+
+    python benchmarks/profile_suite.py --output bench.json
+    python benchmarks/profile_suite.py --baseline benchmarks/profile_baseline.json
+    python benchmarks/profile_suite.py --rows 1000000 --lazy --output nightly.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from collections.abc import Callable, Iterator
+from datetime import date, datetime, timedelta
+from functools import partial
+
+import numpy as np
+import polars as pl
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+from main import Edge, Node, check_if_dag  # noqa: E402
+from polaris.instrument import Recorder  # noqa: E402
+from polaris.profile import EDAEngine  # noqa: E402
+from polaris.quality import QualityAssessment  # noqa: E402
+
+SHAPES = ("tall_narrow", "wide", "high_cardinality", "date_heavy", "nested")
+GRAPH_SHAPES = ("random", "chain", "cycle")
+# 기준선보다 이만큼(비율) 넘게 느려지거나 커지면 회귀로 본다
+DEFAULT_THRESHOLD = 0.25
+# 측정 잡음보다 작은 차이는 비율이 커도 회귀로 보지 않는다
+MIN_SECONDS_DELTA = 0.05
+MIN_MEMORY_DELTA_MB = 32.0
+
+
+def make_dataset(shape: str, rows: int, seed: int = 42) -> pl.DataFrame:
+    """Deterministic synthetic frame of ``shape`` (same ``rows`` and ``seed`` -> same data)."""
+    rng = np.random.default_rng(seed)
+    if shape == "tall_narrow":
+        amount = rng.normal(100, 15, rows)
+        amount[rng.random(rows) < 0.02] = np.nan
+        return pl.DataFrame(
+            {
+                "id": np.arange(rows),
+                "amount": amount,
+                "count": rng.integers(0, 1000, rows),
+                "ratio": rng.random(rows),
+                "flag": rng.integers(0, 2, rows),
+                "category": rng.choice(["alpha", "beta", "gamma", "delta", "n/a"], rows),
+            }
+        ).with_columns(pl.col("amount").fill_nan(None))
+    if shape == "wide":
+        height = max(rows // 20, 100)
+        base = rng.normal(size=(height, 8))
+        # 상관 구조가 있도록 8개의 잠재 변수를 섞어 200개 컬럼을 만든다
+        values = base @ rng.normal(size=(8, 200)) + rng.normal(scale=0.5, size=(height, 200))
+        return pl.DataFrame({f"x{i:03d}": values[:, i] for i in range(200)})
+    if shape == "high_cardinality":
+        return pl.DataFrame(
+            {
+                "user_id": [f"user-{i:09d}" for i in rng.permutation(rows)],
+                "session": [f"s{value:x}" for value in rng.integers(0, rows, rows)],
+                "email": [f"{value:x}@example.com" for value in rng.integers(0, rows * 4, rows)],
+                "country": rng.choice(["KR", "US", "JP", "DE", "FR", "BR"], rows),
+                "score": rng.gamma(2.0, 10.0, rows),
+            }
+        )
+    if shape == "date_heavy":
+        start = datetime(2024, 1, 1)
+        seconds = np.sort(rng.integers(0, 365 * 86400, rows))
+        return pl.DataFrame(
+            {
+                "created": [start + timedelta(seconds=int(s)) for s in seconds],
+                "shipped": [start + timedelta(seconds=int(s) + 86400 * 3) for s in seconds],
+                "day": [date(2024, 1, 1) + timedelta(days=int(s) // 86400) for s in seconds],
+                "due": [date(2024, 1, 1) + timedelta(days=int(d)) for d in rng.integers(0, 400, rows)],
+                "amount": rng.lognormal(3.0, 1.0, rows),
+            }
+        )
+    if shape == "nested":
+        lengths = rng.integers(0, 6, rows)
+        flat = rng.integers(0, 100, int(lengths.sum()))
+        tags = pl.Series("tags", np.split(flat, np.cumsum(lengths)[:-1]), dtype=pl.List(pl.Int64))
+        return pl.DataFrame(
+            {
+                "id": np.arange(rows),
+                "tags": tags,
+                "value": rng.normal(size=rows),
+                "bucket": rng.integers(0, 2, rows),
+            }
+        ).with_columns(point=pl.struct(x=pl.col("value") * 2, y=pl.col("id") % 7))
+    raise ValueError(f"unknown shape {shape!r}; expected one of {SHAPES}")
+
+
+def make_graph(shape: str, nodes: int, seed: int = 42) -> tuple[list[Node], list[Edge]]:
+    rng = np.random.default_rng(seed)
+    ids = [f"customInput-{i}" for i in rng.permutation(nodes)]
+    if shape == "chain":
+        pairs = list(zip(ids, ids[1:], strict=False))
+    else:
+        # 앞선 노드 -> 뒤 노드 방향의 엣지만 만들어 DAG 를 보장
+        u, v = np.sort(rng.integers(0, nodes, size=(nodes, 2)), axis=1).T
+        keep = u != v
+        pairs = [(ids[a], ids[b]) for a, b in zip(u[keep].tolist(), v[keep].tolist(), strict=True)]
+        if shape == "cycle":
+            pairs.extend(zip(ids[: nodes // 2], ids[1 : nodes // 2 + 1], strict=False))
+            pairs.append((ids[nodes // 2], ids[0]))
+    return [Node(id=i) for i in ids], [Edge(source=a, target=b) for a, b in pairs]
+
+
+def measure(run: Callable, repeat: int, setup: Callable[[], object] | None = None) -> dict:
+    """Best wall time of ``repeat`` calls and the peak memory of the first one.
+
+    With ``setup``, each call gets a fresh ``setup()`` result that is built
+    outside the timed and sampled region.
+    """
+    recorder = Recorder()
+    timings = []
+    peak_mb = None
+    for attempt in range(repeat):
+        args = (setup(),) if setup is not None else ()
+        with recorder.span("benchmark", "run") as span:
+            run(*args)
+        timings.append(span.wall_s)
+        if attempt == 0:
+            peak_mb = span.peak_mb
+    return {"seconds": round(min(timings), 4), "peak_mb": peak_mb}
+
+
+def eda_cases(df: pl.DataFrame, lazy: bool) -> Iterator[tuple[str, Callable, Callable[[], object] | None]]:
+    frame = df.lazy() if lazy else df
+    yield "init", lambda: EDAEngine(frame, lazy=lazy), None
+    for name, _ in EDAEngine.SECTIONS:
+        # 섹션마다 새 엔진: 공유 특성 행렬/표본을 만드는 비용까지 각 섹션에 포함해 실행 순서와 무관하게 측정
+        yield name, lambda engine, name=name: engine.section_tasks([name])[name](), lambda: EDAEngine(frame, lazy=lazy)
+
+
+def quality_cases(df: pl.DataFrame) -> Iterator[tuple[str, Callable[[], object]]]:
+    assessment = QualityAssessment(df)
+    numeric = [name for name, dtype in df.schema.items() if dtype.is_numeric()]
+    temporal = [name for name, dtype in df.schema.items() if dtype in (pl.Date, pl.Datetime)]
+    hashable = [name for name, dtype in df.schema.items() if not dtype.is_nested()]
+    yield "completeness", assessment.calculate_completeness
+    if numeric:
+        yield "accuracy", lambda: assessment.calculate_accuracy(numeric[0], (0, 100))
+    if temporal:
+        yield "timeliness", lambda: assessment.calculate_timeliness(temporal[0])
+    for method in ("exact", "sketch"):
+        yield f"consistency_{method}", lambda method=method: assessment.calculate_consistency(hashable, method=method)
+        yield (
+            f"uniqueness_{method}",
+            lambda method=method: [assessment.calculate_uniqueness(column, method=method) for column in hashable],
+        )
+    accuracy = {numeric[0]: (0, 100)} if numeric else None
+    yield "assess_data_quality", lambda: assessment.assess_data_quality(accuracy, temporal[0] if temporal else None)
+
+
+def run_suite(rows: int, graph_nodes: int, repeat: int, lazy: bool, shapes: list[str], log=print) -> dict:
+    results: dict[str, dict] = {}
+    for shape in shapes:
+        df = make_dataset(shape, rows)
+        modes = [("eda", False), ("eda_lazy", True)] if lazy else [("eda", False)]
+        for group, is_lazy in modes:
+            for name, run, setup in eda_cases(df, is_lazy):
+                results[f"{group}/{shape}/{name}"] = measure(run, repeat, setup)
+                log(f"{group}/{shape}/{name}", results[f"{group}/{shape}/{name}"])
+        for name, run in quality_cases(df):
+            results[f"quality/{shape}/{name}"] = measure(run, repeat)
+            log(f"quality/{shape}/{name}", results[f"quality/{shape}/{name}"])
+    for shape in GRAPH_SHAPES if graph_nodes else ():
+        nodes, edges = make_graph(shape, graph_nodes)
+        results[f"dag/{shape}"] = measure(partial(check_if_dag, nodes, edges), repeat)
+        log(f"dag/{shape}", results[f"dag/{shape}"])
+    return {
+        "meta": {
+            "rows": rows,
+            "graph_nodes": graph_nodes,
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "polars": pl.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "polars_threads": pl.thread_pool_size(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """Cases slower or using more memory than the baseline allows (new or removed cases are ignored)."""
+    regressions = []
+    for case, result in current["results"].items():
+        base = baseline["results"].get(case)
+        if base is None:
+            continue
+        checks = [("seconds", MIN_SECONDS_DELTA)]
+        if result.get("peak_mb") is not None and base.get("peak_mb") is not None:
+            checks.append(("peak_mb", MIN_MEMORY_DELTA_MB))
+        for metric, floor in checks:
+            before, after = base[metric], result[metric]
+            if after - before > floor and after > before * (1 + threshold):
+                regressions.append({"case": case, "metric": metric, "baseline": before, "current": after})
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--graph-nodes", type=int, default=200_000, help="0 skips the DAG cases")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--shapes", default=",".join(SHAPES))
+    parser.add_argument("--lazy", action="store_true", help="also time the lazy EDA mode")
+    parser.add_argument("--output", help="write the results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    def log(case: str, result: dict) -> None:
+        print(f"{case:55s} {result['seconds']:9.4f} s {result['peak_mb'] or 0:9.1f} MB", file=sys.stderr)
+
+    shapes = [shape for shape in args.shapes.split(",") if shape]
+    current = run_suite(args.rows, args.graph_nodes, args.repeat, args.lazy, shapes, log)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    else:
+        print(json.dumps(current, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for key in ("rows", "graph_nodes", "cpus", "polars"):
+            if baseline["meta"].get(key) != current["meta"][key]:
+                print(
+                    f"warning: baseline {key}={baseline['meta'].get(key)} differs from {current['meta'][key]}",
+                    file=sys.stderr,
+                )
+        regressions = compare(current, baseline, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['case']} {regression['metric']}: "
+                f"{regression['baseline']} -> {regression['current']}",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
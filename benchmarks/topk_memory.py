@@ -0,0 +1,90 @@
+"""Peak-RSS and time of exact and sketched top-k value counts on high-cardinality columns.
+
+Each method runs in a fresh interpreter, and the peak RSS (``VmHWM``) is
+reset after the column is built so it reflects only that method (Linux).
+``exact`` is ``value_counts`` over the whole column, whose hash table grows
+with the number of distinct values; ``sketch`` streams the column through a
+Space-Saving summary in bounded chunks.
+
+    python benchmarks/topk_memory.py --rows 5000000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+METHODS = {
+    "exact": """
+top = values.value_counts(sort=True).head(10)
+""",
+    "sketch": """
+from polaris.sketches import SpaceSaving
+sketch = SpaceSaving(capacity=100)
+sketch.update(values)
+top = sketch.top(10)
+""",
+}
+
+RUNNER = """
+import os, sys, time
+import numpy as np
+import polars as pl
+
+def status_kb(field):
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field))
+
+rows, distinct = int(sys.argv[1]), int(sys.argv[2])
+rng = np.random.default_rng(42)
+values = pl.Series("value", rng.integers(0, distinct, rows)).cast(pl.Utf8)
+# 컬럼을 만들 때의 최대치를 지우고 현재 RSS 부터 다시 잰다
+with open("/proc/self/clear_refs", "w") as f:
+    f.write("5")
+baseline = status_kb("VmRSS:")
+start = time.perf_counter()
+{body}
+seconds = time.perf_counter() - start
+peak = status_kb("VmHWM:")
+print(baseline, peak, seconds)
+"""
+
+
+def measure(method: str, rows: int, distinct: int) -> dict:
+    """Peak RSS above the loaded column (MiB) and wall time of ``method`` in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-c", RUNNER.format(body=METHODS[method]), str(rows), str(distinct)],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": ROOT},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    baseline, peak, seconds = out.split()
+    return {
+        "peak_over_column_mb": round(max(int(peak) - int(baseline), 0) / 1024, 1),
+        "seconds": round(float(seconds), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--distinct", default="100,100000,5000000", help="comma-separated distinct value counts")
+    args = parser.parse_args()
+
+    results = []
+    for distinct in map(int, args.distinct.split(",")):
+        row = {"rows": args.rows, "distinct": distinct}
+        for method in METHODS:
+            row[method] = measure(method, args.rows, distinct)
+        results.append(row)
+        print(json.dumps(row), file=sys.stderr)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import { create } from "zustand";
+import axios from "axios";
 import {
   Node,
   Edge,
@@ -13,10 +14,36 @@ import {
 
 type NodeIDMap = { [type: string]: number };
 
+export const API_URL = "http://127.0.0.1:8000";
+
+// Deltas sent to the backend graph session instead of the whole pipeline
+export type GraphEdit =
+  | { op: "add_node" | "remove_node" | "update_node"; id: string }
+  | { op: "add_edge" | "remove_edge"; source: string; target: string };
+
+export interface GraphUpdate {
+  session_id: string;
+  num_nodes: number;
+  num_edges: number;
+  is_dag: boolean;
+  cycle: string[];
+  rejected_edges: { source: string; target: string; cycle: string[] }[];
+  ranks: { [id: string]: number };
+  stale: string[];
+}
+
 interface StoreState {
   nodes: Node[];
   edges: Edge[];
   nodeIDs: NodeIDMap;
+  sessionId: string | null;
+  // Topological rank of every node (sorting by rank gives the execution order)
+  ranks: { [id: string]: number };
+  // Nodes whose output changed with the last edit (the edited nodes and everything downstream)
+  stale: string[];
+  syncGraph: (edits: GraphEdit[]) => Promise<GraphUpdate>;
+  // Forget the backend session so the next sync recreates it from the canvas
+  resetSession: () => void;
   getNodeID: (type: string) => string;
   addNode: (node: Node) => void;
   onNodesChange: (changes: NodeChange[]) => void;
@@ -27,10 +54,84 @@ interface StoreState {
   getNumberOfEdges: () => number;
 }
 
+// Edits are posted one request at a time so the backend applies them in order
+let pendingSync: Promise<unknown> = Promise.resolve();
+
+const isNotFound = (error: unknown) =>
+  axios.isAxiosError(error) && error.response?.status === 404;
+
 export const useStore = create<StoreState>((set, get) => ({
   nodes: [],
   edges: [],
   nodeIDs: {},
+  sessionId: null,
+  ranks: {},
+  stale: [],
+
+  syncGraph: (edits: GraphEdit[]) => {
+    // Uploads the current pipeline, which already includes these edits
+    const createSession = async () => {
+      const { nodes, edges } = get();
+      const response = await axios.post(`${API_URL}/pipelines/sessions`, {
+        nodes: nodes.map(({ id, type }) => ({ id, type })),
+        edges: edges.map(({ source, target }) => ({ source, target })),
+      });
+      const update = response.data as GraphUpdate;
+      set({ sessionId: update.session_id, ranks: update.ranks });
+      return update;
+    };
+
+    const request = pendingSync.then(async () => {
+      const { sessionId } = get();
+      let update: GraphUpdate;
+      if (sessionId === null) {
+        update = await createSession();
+      } else {
+        try {
+          const response = await axios.post(
+            `${API_URL}/pipelines/sessions/${sessionId}/edits`,
+            { edits }
+          );
+          update = response.data as GraphUpdate;
+          const removed = new Set(
+            edits.flatMap((edit) => (edit.op === "remove_node" ? [edit.id] : []))
+          );
+          const ranks = { ...get().ranks, ...update.ranks };
+          removed.forEach((id) => delete ranks[id]);
+          set({ ranks });
+        } catch (error) {
+          // Sessions live in server memory: an evicted session or a restarted backend is rebuilt from the canvas
+          if (!isNotFound(error)) {
+            throw error;
+          }
+          set({ sessionId: null });
+          update = await createSession();
+        }
+      }
+      set({ stale: update.stale });
+      if (update.rejected_edges.length > 0) {
+        // Connections that would close a cycle are dropped so the canvas stays a DAG
+        const rejected = new Set(
+          update.rejected_edges.map(({ source, target }) => `${source}->${target}`)
+        );
+        set({
+          edges: get().edges.filter(
+            (edge) => !rejected.has(`${edge.source}->${edge.target}`)
+          ),
+        });
+        const cycles = update.rejected_edges.map(({ cycle }) => cycle.join(" → "));
+        alert(`This connection would create a cycle: ${cycles.join("\n")}`);
+      }
+      return update;
+    });
+    // A failed request should not block the edits queued after it
+    pendingSync = request.catch((error) => console.error("Error:", error));
+    return request;
+  },
+
+  resetSession: () => {
+    set({ sessionId: null, ranks: {} });
+  },
 
   getNodeID: (type: string) => {
     const newIDs = { ...get().nodeIDs };
@@ -46,21 +147,40 @@ export const useStore = create<StoreState>((set, get) => ({
     set({
       nodes: [...get().nodes, node],
     });
+    get().syncGraph([{ op: "add_node", id: node.id }]);
   },
 
   onNodesChange: (changes: NodeChange[]) => {
     set({
       nodes: applyNodeChanges(changes, get().nodes),
     });
+    // Position and selection changes do not affect the graph
+    const edits: GraphEdit[] = changes.flatMap((change) =>
+      change.type === "remove" ? [{ op: "remove_node" as const, id: change.id }] : []
+    );
+    if (edits.length > 0) {
+      get().syncGraph(edits);
+    }
   },
 
   onEdgesChange: (changes: EdgeChange[]) => {
+    const edges = get().edges;
     set({
-      edges: applyEdgeChanges(changes, get().edges),
+      edges: applyEdgeChanges(changes, edges),
+    });
+    const edits: GraphEdit[] = changes.flatMap((change) => {
+      const edge = change.type === "remove" && edges.find((e) => e.id === change.id);
+      return edge
+        ? [{ op: "remove_edge" as const, source: edge.source, target: edge.target }]
+        : [];
     });
+    if (edits.length > 0) {
+      get().syncGraph(edits);
+    }
   },
 
   onConnect: (connection: Connection) => {
+    const { source, target } = connection;
     set({
       edges: addEdge(
         {
@@ -77,6 +197,9 @@ export const useStore = create<StoreState>((set, get) => ({
         get().edges
       ),
     });
+    if (source && target) {
+      get().syncGraph([{ op: "add_edge", source, target }]);
+    }
   },
 
   updateNodeField: (nodeId: string, fieldName: string, fieldValue: any) => {
@@ -94,6 +217,7 @@ export const useStore = create<StoreState>((set, get) => ({
         return node;
       }),
     });
+    get().syncGraph([{ op: "update_node", id: nodeId }]);
   },
 
   getNumberOfNodes: () => {
@@ -1,34 +1,42 @@
 import React from "react";
 import axios from "axios";
-import { useStore } from "./store";
-import { Node, Edge } from "reactflow";
+import { API_URL, useStore } from "./store";
 
 export const SubmitButton: React.FC = () => {
-  const nodes: Node[] = useStore((state) => state.nodes);
-  const edges: Edge[] = useStore((state) => state.edges);
+  const syncGraph = useStore((state) => state.syncGraph);
+  const resetSession = useStore((state) => state.resetSession);
+
+  // Wait for the queued edits, then read the session's graph instead of posting every node and edge
+  const fetchSession = async () => {
+    const { session_id } = await syncGraph([]);
+    return axios.get(`${API_URL}/pipelines/sessions/${session_id}`);
+  };
 
   const handleSubmit = async () => {
     try {
-      console.log("Nodes:", nodes);
-      console.log("Edges:", edges);
-
-      const response = await axios.post(
-        "http://127.0.0.1:8000/pipelines/parse",
-        {
-          nodes,
-          edges,
+      let response;
+      try {
+        response = await fetchSession();
+      } catch (error) {
+        // The session was evicted or the backend restarted: rebuild it from the canvas once
+        if (!(axios.isAxiosError(error) && error.response?.status === 404)) {
+          throw error;
         }
-      );
+        resetSession();
+        response = await fetchSession();
+      }
 
-      const { num_nodes, num_edges, is_dag } = response.data as {
+      const { num_nodes, num_edges, is_dag, order } = response.data as {
         num_nodes: number;
         num_edges: number;
         is_dag: boolean;
+        order: string[];
       };
+      console.log("Execution order:", order);
 
-      const isDagText = is_dag ? "yes" : "no";
+      const dag = is_dag ? "yes" : "no";
       alert(
-        `Number of nodes: ${num_nodes}, Number of edges: ${num_edges}, Is DAG: ${isDagText}`
+        `Number of nodes: ${num_nodes}, Number of edges: ${num_edges}, Is DAG: ${dag}`
       );
     } catch (error) {
       console.error("Error:", error);
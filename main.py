@@ -1,17 +1,47 @@
 import streamlit as st
 
+from polaris.source import DATA_ROOT, DatasetSource
+from utils.datasets import UPLOAD_TYPES, dataset_key
+
+
 def run_app():
     st.title("📊 데이터 분석 대시보드")
     st.write("👈 왼쪽 사이드바에서 분석 페이지를 선택하세요.")
 
-    uploaded_file = st.file_uploader("📂 CSV 파일 업로드", type=["csv"])
-    
+    uploaded_file = st.file_uploader(
+        "📂 데이터 파일 업로드 (CSV, Parquet, Arrow IPC/Feather, NDJSON)", type=UPLOAD_TYPES
+    )
+    dataset_path = st.text_input(
+        "🗂️ 또는 서버의 데이터 경로",
+        help=(
+            "데이터 루트(`POLARIS_DATA_ROOT`) 안의 파일, hive 파티션(key=value) 디렉터리, "
+            "`events/**/*.parquet` 같은 glob 을 업로드 없이 그 자리에서 읽습니다."
+        ),
+    )
+
     if uploaded_file:
         # 세션에 저장
         st.session_state["uploaded_file"] = uploaded_file
+        st.session_state.pop("dataset_path", None)
+        # 여기서는 파싱하지 않는다: Eager 모드만 전체를 읽고(캐시에 보관), Lazy/Streaming 은 디스크 사본을 스캔한다
+        st.session_state["dataset_key"] = dataset_key(uploaded_file)
+    elif dataset_path:
+        try:
+            # API 와 같은 데이터 루트 밖의 경로는 열지 않는다
+            source = DatasetSource(dataset_path, root=DATA_ROOT)
+        except (FileNotFoundError, ValueError) as error:
+            st.error(f"⚠️ 데이터를 찾을 수 없습니다: {error}")
+        except PermissionError as error:
+            st.error(f"⚠️ 읽을 수 없는 경로입니다: {error}")
+        else:
+            # 경로는 분석 페이지에서 필요한 컬럼/행만 스캔하므로 여기서는 읽지 않는다
+            st.session_state["dataset_path"] = dataset_path
+            st.session_state.pop("uploaded_file", None)
+            st.write(f"🔹 {source.format} 파일 {len(source.files()):,}개, {source.size_bytes / 1024**2:,.1f} MB")
     elif "uploaded_file" in st.session_state:
         # 이미 저장된 파일이 있다면 유지
         uploaded_file = st.session_state["uploaded_file"]
 
+
 if __name__ == "__main__":
     run_app()
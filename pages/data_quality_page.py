@@ -1,16 +1,70 @@
-import streamlit as st
+import json
+
 import polars as pl
-from utils import DataQuality
+import streamlit as st
+
+from utils.datasets import load_source, monitor_path, scope_source, session_source
+from utils.quality import DataQuality
 
 st.set_page_config(page_title="Data Quality Report", layout="wide")
 st.title("📌 Data Quality Assessment")
 
-if "uploaded_file" not in st.session_state:
-    st.warning("📂 먼저 메인 페이지에서 파일을 업로드해주세요.")
+source = session_source()
+if source is None:
+    st.warning("📂 먼저 메인 페이지에서 파일을 업로드하거나 데이터 경로를 입력해주세요.")
 else:
-    df = pl.read_csv(st.session_state["uploaded_file"], infer_schema_length=10000)
-    dq = DataQuality(df)
+    source = scope_source(source)
+    df = load_source(source)
+    dq = DataQuality(df, fingerprint=source.fingerprint())
+    method = st.sidebar.radio(
+        "🧮 Uniqueness / Consistency 계산 방식",
+        ["exact", "sketch"],
+        help="sketch: HyperLogLog 와 행 해시로 고유값/중복 행 수를 근사합니다 (상대 오차 약 0.8%).",
+    )
+    rules_text = st.sidebar.text_area(
+        "📏 검증 규칙 (JSON)",
+        "[]",
+        help=(
+            "규칙 목록을 JSON 으로 입력합니다. 지원 타입: range, regex, allowed, not_null, freshness, compare\n\n"
+            '예: [{"type": "range", "column": "age", "min": 0, "max": 120}, '
+            '{"type": "compare", "column": "start", "op": "<=", "other": "end"}]'
+        ),
+    )
+    try:
+        rules = json.loads(rules_text or "[]")
+    except json.JSONDecodeError as error:
+        st.sidebar.error(f"규칙 JSON 을 읽을 수 없습니다: {error}")
+        rules = []
 
     st.subheader("📋 Assessing Data Quality Metrics...")
-    quality_metrics = dq.assess_data_quality()
+    try:
+        quality_metrics = dq.assess_data_quality(method=method, rules=rules)
+    except (ValueError, TypeError, pl.exceptions.PolarsError) as error:
+        st.error(f"⚠️ 규칙을 적용할 수 없습니다: {error}")
+        quality_metrics = dq.assess_data_quality(method=method)
     dq.plot_quality_metrics(quality_metrics)
+    dq.plot_rule_results()
+
+    monitor_name = st.sidebar.text_input(
+        "📈 드리프트 모니터 이름",
+        help=(
+            "같은 이름으로 저장된 기준선과 이번 데이터를 비교하고, 새 행을 기준선에 누적합니다. "
+            "비워 두면 모니터링하지 않습니다."
+        ),
+    )
+    if monitor_name:
+        # 이어 읽기는 범위를 좁히지 않은 단일 CSV 파일에서만 가능
+        appendable = source.format == "csv" and len(source.files()) == 1 and not source.scoped
+        upload_kind = st.sidebar.radio(
+            "업로드 내용",
+            ["delta", "appended"] if appendable else ["delta"],
+            format_func=lambda kind: {"delta": "새 행만", "appended": "행이 추가된 전체 CSV"}[kind],
+            help="appended: 지난 갱신 이후 파일 끝에 추가된 부분만 읽어 갱신 시간이 추가된 행 수에 비례합니다.",
+        )
+        if st.sidebar.button("🔄 기준선 갱신 및 드리프트 확인"):
+            appended_csv = source.files()[0] if upload_kind == "appended" else None
+            try:
+                monitor, report = dq.update_monitor(monitor_path(monitor_name), appended_csv=appended_csv)
+                dq.plot_drift_report(monitor, report)
+            except ValueError as error:
+                st.error(f"⚠️ 모니터를 갱신할 수 없습니다: {error}")
@@ -1,11 +1,78 @@
 import streamlit as st
-from utils import PolarisEDA
+
+from polaris.instrument import Recorder, available_profilers
+from polaris.profile import LAZY_THRESHOLD_BYTES
+from polaris.sampling import DEFAULT_ROW_BUDGET, DEFAULT_SEED
+from utils.datasets import load_source, scan_source, scope_source, session_source
+from utils.eda import PolarisEDA
+from utils.streaming import StreamingEDA
 
 st.set_page_config(page_title="EDA Report", layout="wide")
 st.title("📊 Exploratory Data Analysis (EDA)")
 
-if "uploaded_file" not in st.session_state:
-    st.warning("📂 먼저 메인 페이지에서 파일을 업로드해주세요.")
+source = session_source()
+if source is None:
+    st.warning("📂 먼저 메인 페이지에서 파일을 업로드하거나 데이터 경로를 입력해주세요.")
 else:
-    eda = PolarisEDA(st.session_state["uploaded_file"])
-    eda.generate_eda_report()
+    source = scope_source(source)
+    modes = ["Eager", "Lazy", "Streaming"]
+    mode = st.sidebar.radio(
+        "⚡ 분석 모드",
+        modes,
+        index=1 if source.size_bytes >= LAZY_THRESHOLD_BYTES else 0,
+        help=(
+            "Lazy: 전체 데이터를 메모리에 올리지 않고, 각 섹션에 필요한 통계와 컬럼만 한 번에 계산합니다.\n\n"
+            "Streaming: 파일을 배치 단위로 읽어 메모리 사용량이 파일 크기와 무관한 근사 리포트를 만듭니다."
+        ),
+    )
+    if mode == "Streaming":
+        StreamingEDA(source).generate_eda_report()
+    else:
+        chart = st.sidebar.radio(
+            "📈 수치형 분포 차트",
+            ["plotly", "small_multiples", "seaborn"],
+            help=(
+                "plotly: 미리 계산한 히스토그램 bin 으로 그린 인터랙티브 차트\n\n"
+                "small_multiples: 모든 컬럼을 한 장의 이미지로\n\n"
+                "seaborn: 컬럼별 KDE 포함 히스토그램 (느림)"
+            ),
+        )
+        correlation = st.sidebar.radio(
+            "🔗 상관계수",
+            ["pearson", "spearman"],
+            help="spearman: 순위 기반 상관계수로 단조 관계와 이상치에 강합니다 (전체 컬럼 순위 계산이 필요).",
+        )
+        row_budget = st.sidebar.number_input(
+            "🎯 모델 학습 행 예산",
+            min_value=1_000,
+            value=DEFAULT_ROW_BUDGET,
+            step=50_000,
+            help=(
+                "이상치 탐지, 변수 중요도, 군집, PCA 모델은 이 행 수 이하의 시드 고정 표본으로 학습하고 "
+                "전체 행은 배치로 채점합니다."
+            ),
+        )
+        seed = st.sidebar.number_input("🎲 표본 시드", min_value=0, value=DEFAULT_SEED, step=1)
+        profiler = st.sidebar.radio(
+            "🔬 섹션 프로파일링",
+            ["off", *available_profilers()],
+            help=(
+                "섹션마다 프로파일을 수집해 Performance 패널에 표시합니다. "
+                "켜면 섹션을 순서대로 계산합니다 (pyinstrument 는 설치된 경우에만 표시)."
+            ),
+        )
+        recorder = Recorder(profiler=None if profiler == "off" else profiler)
+        options = dict(row_budget=int(row_budget), seed=int(seed), recorder=recorder)
+        if mode == "Lazy":
+            with recorder.span("dataset", "load", mode="lazy"):
+                eda = PolarisEDA(scan_source(source), lazy=True, key=source.fingerprint(), **options)
+            eda.generate_eda_report(chart=chart, correlation=correlation)
+        else:
+            method = st.sidebar.radio(
+                "🧮 범주형 상위 값 계산",
+                ["exact", "sketch"],
+                help="sketch: Space-Saving 요약으로 전체 value_counts 없이 상위 값을 근사합니다.",
+            )
+            with recorder.span("dataset", "load", mode="eager"):
+                eda = PolarisEDA(load_source(source), key=source.fingerprint(), **options)
+            eda.generate_eda_report(method=method, chart=chart, correlation=correlation)
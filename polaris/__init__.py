@@ -0,0 +1 @@
+"""Polaris profiling engine: data loading, caching and headless computations."""
@@ -0,0 +1,408 @@
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import BinaryIO
+
+import polars as pl
+
+from polaris.ingest import UPLOAD_TAG, spill_upload_to, upload_suffix, write_ipc
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+HASH_CHUNK_SIZE = 8 * 1024**2
+# 섹션 결과 디스크 캐시: Streamlit 세션과 백엔드 프로세스가 같은 디렉터리를 공유
+RESULT_CACHE_DIR = os.environ.get(
+    "POLARIS_RESULT_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".polaris", "results")
+)
+# 파싱한 업로드의 IPC 사본과 업로드 사본: 업로드 데이터가 들어 있으므로 사용자별 디렉터리에 둔다
+SPILL_DIR = os.environ.get("POLARIS_SPILL_DIR", os.path.join(os.path.expanduser("~"), ".polaris", "spill"))
+# 디스크 캐시 파일에 서명하는 사용자별 비밀 키 (캐시 디렉터리 밖에 둔다)
+RESULT_CACHE_KEY_FILE = os.environ.get(
+    "POLARIS_RESULT_CACHE_KEY_FILE", os.path.join(os.path.expanduser("~"), ".polaris", "result-cache.key")
+)
+SIGNATURE_SIZE = hashlib.sha256().digest_size
+# 결과는 데이터와 파라미터로 정해지지만 Timeliness 처럼 현재 시각에 따라 바뀌는 지표도 있어 만료 시간을 둔다
+DEFAULT_RESULT_TTL = 24 * 3600
+
+
+def content_hash(file: BinaryIO) -> str:
+    """Hash an upload by content so that re-uploads of the same file share a key."""
+    digest = hashlib.blake2b(digest_size=16)
+    if hasattr(file, "getbuffer"):
+        # BytesIO 계열(Streamlit UploadedFile)은 복사 없이 버퍼를 그대로 해싱
+        view = file.getbuffer()
+        for start in range(0, len(view), HASH_CHUNK_SIZE):
+            digest.update(view[start : start + HASH_CHUNK_SIZE])
+        view.release()
+    else:
+        position = file.tell()
+        file.seek(0)
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        file.seek(position)
+    return digest.hexdigest()
+
+
+def cache_key(dataset: str, section: str, params: dict | None = None) -> str:
+    payload = json.dumps([dataset, section, params or {}], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as file:
+        return content_hash(file)
+
+
+def private_directory(path: str) -> str:
+    """Create ``path`` accessible only to this user (0700); ``PermissionError`` if another user owns it."""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    stat = os.stat(path)
+    if stat.st_uid != os.getuid():
+        raise PermissionError("cache directory is owned by another user")
+    if stat.st_mode & 0o077:
+        os.chmod(path, 0o700)
+    return path
+
+
+def result_cache_secret(path: str = RESULT_CACHE_KEY_FILE) -> bytes:
+    """The per-user key that signs cached results; created with mode 0600 on first use."""
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # 빈 파일을 읽지 않도록 임시 파일에 다 쓴 뒤 link 로 원자적으로 만든다 (이미 있으면 그 키를 쓴다)
+        temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        descriptor = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(secrets.token_bytes(32))
+        try:
+            os.link(temp, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(temp)
+    stat = os.stat(path)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+        raise PermissionError("result cache key file must be readable only by its owner")
+    with open(path, "rb") as file:
+        secret = file.read()
+    if not secret:
+        raise ValueError("result cache key file is empty")
+    return secret
+
+
+class DatasetCache:
+    """Size-bounded LRU of parsed frames with an optional Arrow IPC disk tier.
+
+    Frames evicted from memory are kept on disk (when ``spill_dir`` is set) and
+    re-opened memory-mapped, which is far cheaper than parsing the CSV again.
+    The spill directory is private to the user (0700), so files found in it
+    were written by this user. IPC copies and upload copies share the
+    ``max_disk_bytes`` budget and are removed least recently used first.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        spill_dir: str | None = None,
+        max_disk_bytes: int = 4 * DEFAULT_MAX_BYTES,
+    ):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._frames: OrderedDict[str, pl.DataFrame] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.RLock()
+        # 적재 중인 키별 잠금: 같은 키는 한 번만 읽고 다른 키의 조회는 막지 않는다
+        self._loading: dict[str, threading.Lock] = {}
+        if spill_dir:
+            private_directory(spill_dir)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def __contains__(self, key: str) -> bool:
+        path = self._spill_path(key)
+        return key in self._frames or (path is not None and os.path.exists(path))
+
+    def _spill_path(self, key: str) -> str | None:
+        if not self.spill_dir:
+            return None
+        return os.path.join(self.spill_dir, f"{key}.arrow")
+
+    def upload_path(self, key: str, suffix: str) -> str | None:
+        """Path for the on-disk copy of an upload (next to the IPC copies, under the same disk budget)."""
+        if not self.spill_dir:
+            return None
+        return os.path.join(self.spill_dir, f"{key}-{UPLOAD_TAG}{suffix}")
+
+    def spill_upload(self, key: str, file: BinaryIO) -> str:
+        """Copy of the upload ``key`` on disk, written on first use; ``ValueError`` without a ``spill_dir``."""
+        path = self.upload_path(key, upload_suffix(file))
+        if path is None:
+            raise ValueError("spilling an upload needs a spill_dir")
+        if os.path.exists(path):
+            _touch(path)
+        else:
+            spill_upload_to(file, path)
+            self._prune_disk(keep=path)
+        return path
+
+    def get(self, key: str) -> pl.DataFrame | None:
+        with self._lock:
+            if key in self._frames:
+                self._frames.move_to_end(key)
+                return self._frames[key]
+            path = self._spill_path(key)
+            if path and os.path.exists(path):
+                _touch(path)
+                return self._insert(key, pl.read_ipc(path), spill=False)
+            return None
+
+    def put(self, key: str, df: pl.DataFrame) -> pl.DataFrame:
+        with self._lock:
+            return self._insert(key, df, spill=True)
+
+    def get_or_load(self, key: str, loader: Callable[[], pl.DataFrame]) -> pl.DataFrame:
+        """Cached frame for ``key``, calling ``loader`` at most once at a time per key.
+
+        ``loader`` runs outside the cache-wide lock, so a slow parse only
+        blocks other callers asking for the same key.
+        """
+        df = self.get(key)
+        if df is not None:
+            return df
+        with self._lock:
+            lock = self._loading.setdefault(key, threading.Lock())
+        with lock:
+            try:
+                # 기다리는 동안 다른 스레드가 먼저 적재했을 수 있다
+                df = self.get(key)
+                if df is None:
+                    df = self.put(key, loader())
+                return df
+            finally:
+                with self._lock:
+                    if self._loading.get(key) is lock:
+                        del self._loading[key]
+
+    def evict(self, key: str) -> None:
+        with self._lock:
+            self._frames.pop(key, None)
+            self._sizes.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._sizes.clear()
+
+    def ipc_path(self, key: str) -> str | None:
+        """Path of the on-disk IPC copy of ``key``, if one has been written."""
+        path = self._spill_path(key)
+        if path and os.path.exists(path):
+            _touch(path)
+            return path
+        return None
+
+    def _insert(self, key: str, df: pl.DataFrame, spill: bool) -> pl.DataFrame:
+        if key in self._frames:
+            self._frames.move_to_end(key)
+            return self._frames[key]
+        size = int(df.estimated_size())
+        path = self._spill_path(key)
+        if spill and path and not os.path.exists(path):
+            write_ipc(df, path)
+            self._prune_disk(keep=path)
+        self._frames[key] = df
+        self._sizes[key] = size
+        # 가장 오래 사용되지 않은 프레임부터 제거 (방금 넣은 프레임은 유지)
+        while self.total_bytes > self.max_bytes and len(self._frames) > 1:
+            oldest, _ = self._frames.popitem(last=False)
+            self._sizes.pop(oldest, None)
+        return df
+
+    def _prune_disk(self, keep: str) -> None:
+        assert self.spill_dir is not None
+        entries = []
+        for name in os.listdir(self.spill_dir):
+            # IPC 사본({key}.arrow)과 업로드 사본({key}-upload.*) 모두 한도에 넣는다 (쓰는 중인 임시 파일은 제외)
+            if name.startswith(f"{UPLOAD_TAG}-") or name.endswith(".tmp"):
+                continue
+            path = os.path.join(self.spill_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # 다른 프로세스가 방금 지운 경우
+            entries.append((stat.st_atime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            if path != keep:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+
+def _touch(path: str) -> None:
+    # 마운트 옵션(relatime 등)과 관계없이 디스크 LRU 순서가 되도록 읽은 시각을 직접 갱신한다
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+
+def default_spill_dir() -> str:
+    return SPILL_DIR
+
+
+class ResultCache:
+    """Computed results by content key: a size-bounded LRU in memory over a directory of signed pickles.
+
+    The disk tier is shared by every process pointing at the same ``directory``
+    (Streamlit sessions, the API and job workers). Entries older than ``ttl``
+    seconds are treated as misses in both tiers; the disk tier drops the least
+    recently read files once it grows past ``max_disk_bytes``.
+
+    The directory is created private to the user (0700), and every file
+    carries an HMAC-SHA256 of its key and payload under ``secret`` (by default
+    the per-user key in ``RESULT_CACHE_KEY_FILE``). A file whose signature
+    does not verify is deleted unread, so nothing written by someone else is
+    ever unpickled.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_bytes: int = 256 * 1024**2,
+        max_disk_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float = DEFAULT_RESULT_TTL,
+        secret: bytes | None = None,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl = ttl
+        # key -> (저장 시각, 직렬화 크기, 값)
+        self._entries: OrderedDict[str, tuple[float, int, object]] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+        self._secret = b""
+        if directory:
+            private_directory(directory)
+            self._secret = secret or result_cache_secret()
+
+    def _path(self, key: str) -> str | None:
+        return os.path.join(self.directory, f"{key}.pkl") if self.directory else None
+
+    def _sign(self, key: str, payload: bytes) -> bytes:
+        # 키도 서명에 넣어 다른 키의 (정상) 파일로 바꿔치기해도 통과하지 못하게 한다
+        return hmac.new(self._secret, key.encode() + b"\0" + payload, hashlib.sha256).digest()
+
+    def get(self, key: str) -> object | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl:
+                    self._entries.move_to_end(key)
+                    return entry[2]
+                self._drop(key)
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+            if now - stat.st_mtime > self.ttl:
+                os.remove(path)
+                return None
+            with open(path, "rb") as file:
+                payload = file.read()
+            # 읽은 시각만 갱신해 디스크 LRU 순서로 쓴다 (mtime 은 저장 시각으로 유지)
+            os.utime(path, (now, stat.st_mtime))
+        except FileNotFoundError:
+            return None  # 다른 프로세스가 방금 지운 경우
+        signature, payload = payload[:SIGNATURE_SIZE], payload[SIGNATURE_SIZE:]
+        if not hmac.compare_digest(signature, self._sign(key, payload)):
+            # 이 사용자의 키로 서명하지 않은 파일은 역직렬화하지 않고 지운다
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return None
+        value = pickle.loads(payload)
+        with self._lock:
+            self._remember(key, stat.st_mtime, len(payload), value)
+        return value
+
+    def put(self, key: str, value: object) -> None:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        path = self._path(key)
+        if path is not None:
+            # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp, "wb") as file:
+                file.write(self._sign(key, payload))
+                file.write(payload)
+            os.replace(temp, path)
+            self._prune_disk(keep=path)
+        with self._lock:
+            self._remember(key, time.time(), len(payload), value)
+
+    def get_or_compute(self, key: str, compute: Callable[[], object]) -> object:
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _remember(self, key: str, stored: float, size: int, value: object) -> None:
+        self._drop(key)
+        self._entries[key] = (stored, size, value)
+        self._total += size
+        while self._total > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self._total -= evicted
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total -= entry[1]
+
+    def _prune_disk(self, keep: str) -> None:
+        assert self.directory is not None
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            if path != keep:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
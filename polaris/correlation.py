@@ -0,0 +1,167 @@
+"""Pearson/Spearman correlation for wide tables, accumulated over row batches.
+
+Every batch contributes its cross-products through matrix multiplications
+(a single ``X.T @ X`` when the batch has no missing values, four masked
+products otherwise), so the whole correlation matrix costs a handful of GEMMs
+per batch instead of one pass per column pair, and missing values are handled
+pairwise like ``pandas.DataFrame.corr``.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+import polars as pl
+
+CORRELATION_METHODS = ("pearson", "spearman")
+DEFAULT_BATCH_SIZE = 100_000
+# 이 컬럼 수를 넘으면 히트맵은 강한 상관을 가진 컬럼만 골라 그린다
+HEATMAP_MAX_COLUMNS = 40
+
+
+def check_correlation_method(method: str) -> None:
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"method must be one of {CORRELATION_METHODS}, got {method!r}")
+
+
+class CorrelationAccumulator:
+    """Pairwise-complete Pearson sums for ``p`` columns, mergeable across batches."""
+
+    def __init__(self, columns: list[str]):
+        p = len(columns)
+        self.columns = columns
+        self.shift: np.ndarray | None = None
+        self.n = np.zeros((p, p))
+        self.sx = np.zeros((p, p))
+        self.sxx = np.zeros((p, p))
+        self.sxy = np.zeros((p, p))
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a ``(rows, p)`` float batch; NaN marks a missing value."""
+        if len(values) == 0:
+            return
+        values = np.asarray(values, dtype=np.float64)
+        if self.shift is None:
+            # 첫 배치 평균만큼 이동해 누적 합의 자릿수 손실을 줄인다 (상관계수는 이동에 불변)
+            with np.errstate(all="ignore"):
+                shift = np.nanmean(values, axis=0) if np.isnan(values).any() else values.mean(axis=0)
+            self.shift = np.nan_to_num(shift)
+        x = values - self.shift
+        missing = np.isnan(x)
+        if not missing.any():
+            sums = x.sum(axis=0)
+            self.n += len(x)
+            self.sx += sums[:, None]
+            self.sxx += (x * x).sum(axis=0)[:, None]
+            self.sxy += x.T @ x
+            return
+        present = (~missing).astype(np.float64)
+        x = np.where(missing, 0.0, x)
+        self.n += present.T @ present
+        self.sx += x.T @ present
+        self.sxx += (x * x).T @ present
+        self.sxy += x.T @ x
+
+    def merge(self, other: "CorrelationAccumulator") -> "CorrelationAccumulator":
+        if other.shift is None:
+            return self
+        if self.shift is None:
+            self.shift, self.n, self.sx, self.sxx, self.sxy = other.shift, other.n, other.sx, other.sxx, other.sxy
+            return self
+        # 다른 기준점으로 누적된 합을 이 누적기의 기준점으로 옮긴다
+        d = other.shift - self.shift
+        sx = other.sx + other.n * d[:, None]
+        sxx = other.sxx + 2 * d[:, None] * other.sx + other.n * (d * d)[:, None]
+        sxy = other.sxy + d[:, None] * other.sx.T + other.sx * d[None, :] + other.n * np.outer(d, d)
+        self.n += other.n
+        self.sx += sx
+        self.sxx += sxx
+        self.sxy += sxy
+        return self
+
+    def result(self) -> np.ndarray:
+        sy, syy = self.sx.T, self.sxx.T
+        with np.errstate(all="ignore"):
+            cov = self.n * self.sxy - self.sx * sy
+            var = (self.n * self.sxx - self.sx * self.sx) * (self.n * syy - sy * sy)
+            corr = cov / np.sqrt(var)
+        corr[(self.n < 2) | ~(var > 0)] = np.nan
+        np.fill_diagonal(corr, np.where(np.diag(self.n) >= 2, 1.0, np.nan))
+        return np.clip(corr, -1.0, 1.0)
+
+
+def _as_float(columns: list[str], method: str) -> list[pl.Expr]:
+    exprs = [pl.col(col).cast(pl.Float64).fill_nan(None) for col in columns]
+    if method == "spearman":
+        # 순위는 전체 컬럼을 봐야 하므로 배치로 나누기 전에 계산한다
+        exprs = [expr.rank("average") for expr in exprs]
+    return [expr.cast(pl.Float64).fill_null(np.nan) for expr in exprs]
+
+
+def correlate_batches(columns: list[str], batches: Iterable[np.ndarray]) -> np.ndarray:
+    accumulator = CorrelationAccumulator(columns)
+    for batch in batches:
+        accumulator.update(batch)
+    return accumulator.result()
+
+
+def correlate(
+    frame: pl.DataFrame | pl.LazyFrame,
+    columns: list[str],
+    method: str = "pearson",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> np.ndarray:
+    """Correlation matrix of ``columns`` computed in row batches of ``batch_size``.
+
+    A ``LazyFrame`` is streamed for Pearson; Spearman needs global ranks and
+    therefore collects the ranked columns first.
+    """
+    check_correlation_method(method)
+    values = frame.select(_as_float(columns, method))
+    if isinstance(values, pl.LazyFrame):
+        if method == "pearson" and hasattr(values, "collect_batches"):
+            batches = (batch.to_numpy() for batch in values.collect_batches(chunk_size=batch_size))
+            return correlate_batches(columns, batches)
+        values = values.collect()
+    return correlate_batches(columns, (batch.to_numpy() for batch in values.iter_slices(batch_size)))
+
+
+def top_pairs(corr: np.ndarray, columns: list[str], k: int = 20) -> pl.DataFrame:
+    """The ``k`` column pairs with the largest absolute correlation."""
+    left, right = np.triu_indices(len(columns), k=1)
+    values = corr[left, right]
+    keep = np.flatnonzero(~np.isnan(values))
+    order = keep[np.argsort(-np.abs(values[keep]), kind="stable")[:k]]
+    return pl.DataFrame(
+        {
+            "left": [columns[i] for i in left[order]],
+            "right": [columns[j] for j in right[order]],
+            "correlation": values[order],
+        },
+        schema={"left": pl.Utf8, "right": pl.Utf8, "correlation": pl.Float64},
+    )
+
+
+def cluster_order(corr: np.ndarray) -> np.ndarray:
+    """Column order that places strongly correlated columns next to each other."""
+    if len(corr) < 3:
+        return np.arange(len(corr))
+    try:
+        from scipy.cluster.hierarchy import leaves_list, linkage
+        from scipy.spatial.distance import squareform
+    except ImportError:
+        return np.arange(len(corr))
+    distance = 1.0 - np.abs(np.nan_to_num(corr))
+    np.fill_diagonal(distance, 0.0)
+    return leaves_list(linkage(squareform(np.clip(distance, 0, None), checks=False), method="average"))
+
+
+def heatmap_columns(corr: np.ndarray, columns: list[str], max_columns: int = HEATMAP_MAX_COLUMNS) -> list[int]:
+    """Indices to draw: all columns when few, else those with the strongest correlations, clustered."""
+    if len(columns) > max_columns:
+        strength = np.abs(np.nan_to_num(corr))
+        np.fill_diagonal(strength, 0.0)
+        selected = np.sort(np.argsort(-strength.max(axis=1), kind="stable")[:max_columns])
+    else:
+        selected = np.arange(len(columns))
+    order = cluster_order(corr[np.ix_(selected, selected)])
+    return selected[order].tolist()
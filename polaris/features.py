@@ -0,0 +1,90 @@
+"""Numeric feature matrix shared by the model-based report sections.
+
+The numeric columns are cast, mean-imputed and copied into one C-contiguous
+NumPy array once per dataset. Samples are row gathers and score batches are
+row-slice views of that array, so the sections that use it stop building
+their own pandas copies and running their own imputers.
+"""
+
+from collections.abc import Iterator
+
+import numpy as np
+import polars as pl
+
+FEATURE_DTYPES = (np.float32, np.float64)
+
+
+class FeatureMatrix:
+    """Imputation rule plus the fitted values of a set of numeric columns.
+
+    ``fill_values`` holds the column means (0 for columns with no values).
+    The same rule is applied to every frame passed to ``transform``, so
+    batches streamed from a ``LazyFrame`` match the in-memory matrix.
+    """
+
+    def __init__(self, columns: list[str], fill_values: list[float], missing: list[int], dtype: type = np.float64):
+        if dtype not in FEATURE_DTYPES:
+            raise ValueError(f"dtype must be one of {FEATURE_DTYPES}, got {dtype}")
+        self.columns = columns
+        self.fill_values = fill_values
+        self.missing = missing
+        self.dtype = dtype
+        self.values: np.ndarray | None = None
+
+    @staticmethod
+    def stats_query[Frame: (pl.DataFrame, pl.LazyFrame)](frame: Frame, columns: list[str]) -> Frame:
+        """One-row aggregation with the mean and missing count of every column."""
+        cleaned = [pl.col(col).cast(pl.Float64).fill_nan(None) for col in columns]
+        return frame.select(
+            *(expr.mean().alias(f"mean:{col}") for expr, col in zip(cleaned, columns, strict=True)),
+            *(expr.null_count().alias(f"missing:{col}") for expr, col in zip(cleaned, columns, strict=True)),
+        )
+
+    @classmethod
+    def from_stats(cls, stats: pl.DataFrame, columns: list[str], dtype: type = np.float64) -> "FeatureMatrix":
+        row = stats.row(0, named=True) if stats.height else {}
+        means = [row.get(f"mean:{col}") for col in columns]
+        fill_values = [float(mean) if mean is not None else 0.0 for mean in means]
+        return cls(columns, fill_values, [row.get(f"missing:{col}", 0) for col in columns], dtype)
+
+    @classmethod
+    def fit(cls, frame: pl.DataFrame | pl.LazyFrame, columns: list[str], dtype: type = np.float64) -> "FeatureMatrix":
+        """Compute the imputation rule with one aggregation over ``frame``."""
+        return cls.from_stats(cls.stats_query(frame.lazy(), columns).collect(), columns, dtype)
+
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame, columns: list[str], dtype: type = np.float64) -> "FeatureMatrix":
+        """Fit the rule on ``df`` and materialize the full matrix."""
+        matrix = cls.fit(df, columns, dtype)
+        matrix.values = matrix.transform(df)
+        return matrix
+
+    @property
+    def complete(self) -> bool:
+        return not any(self.missing)
+
+    def expressions(self) -> list[pl.Expr]:
+        polars_dtype = pl.Float32 if self.dtype == np.float32 else pl.Float64
+        return [
+            pl.col(col).cast(pl.Float64).fill_nan(None).fill_null(fill).cast(polars_dtype)
+            for col, fill in zip(self.columns, self.fill_values, strict=True)
+        ]
+
+    def transform(self, frame: pl.DataFrame) -> np.ndarray:
+        # 단일 컬럼이면 to_numpy 가 복사 없이 버퍼를 그대로 넘겨준다
+        values = frame.select(self.expressions()).to_numpy(order="c")
+        return np.ascontiguousarray(values, dtype=self.dtype)
+
+    def take(self, indices: np.ndarray | None) -> np.ndarray:
+        assert self.values is not None
+        return self.values if indices is None else self.values[indices]
+
+    def column(self, name: str) -> np.ndarray:
+        assert self.values is not None
+        return self.values[:, self.columns.index(name)]
+
+    def batches(self, batch_size: int) -> Iterator[np.ndarray]:
+        """Row-slice views of the matrix; no batch copies the data."""
+        assert self.values is not None
+        for start in range(0, len(self.values), batch_size):
+            yield self.values[start : start + batch_size]
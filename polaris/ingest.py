@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+from typing import Any, BinaryIO
+
+import polars as pl
+
+SPILL_CHUNK_SIZE = 8 * 1024**2
+CSV_READ_OPTIONS: dict[str, Any] = {"infer_schema_length": 10000}
+FORMATS = ("csv", "parquet", "ipc", "ndjson")
+# 업로드 사본 이름에 넣는 표시 ("upload-" 로 시작하는 쓰는 중인 임시 파일은 디스크 정리가 건드리지 않는다)
+UPLOAD_TAG = "upload"
+SUFFIX_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".ipc": "ipc",
+    ".feather": "ipc",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+def detect_format(path: str) -> str:
+    """Reader for ``path`` from its extension (CSV when the extension is unknown)."""
+    return SUFFIX_FORMATS.get(os.path.splitext(path)[1].lower(), "csv")
+
+
+def upload_suffix(file: BinaryIO) -> str:
+    """Extension of an upload's file name, so its spilled copy is read with the matching reader."""
+    suffix = os.path.splitext(getattr(file, "name", "") or "")[1].lower()
+    return suffix if suffix in SUFFIX_FORMATS else ".csv"
+
+
+def spill_upload(file: BinaryIO, spill_dir: str | None = None, suffix: str = ".csv") -> str:
+    """Copy an upload to a temporary file in fixed-size chunks and return its path.
+
+    Polars memory-maps CSV files read from a path, so parsing the spilled copy
+    avoids the decoded ``str``/``StringIO`` copies of the upload entirely.
+    """
+    fd, path = tempfile.mkstemp(prefix=f"{UPLOAD_TAG}-", suffix=suffix, dir=spill_dir)
+    with os.fdopen(fd, "wb") as out:
+        if hasattr(file, "getbuffer"):
+            view = file.getbuffer()
+            for start in range(0, len(view), SPILL_CHUNK_SIZE):
+                out.write(view[start : start + SPILL_CHUNK_SIZE])
+            view.release()
+        else:
+            position = file.tell()
+            file.seek(0)
+            shutil.copyfileobj(file, out, SPILL_CHUNK_SIZE)
+            file.seek(position)
+    return path
+
+
+def read_upload(file: BinaryIO, spill_dir: str | None = None) -> pl.DataFrame:
+    path = spill_upload(file, spill_dir, suffix=upload_suffix(file))
+    try:
+        return scan_path(path).collect()
+    finally:
+        os.remove(path)
+
+
+def spill_upload_to(file: BinaryIO, path: str) -> str:
+    """Spill an upload to a fixed ``path`` unless a previous call already did."""
+    if not os.path.exists(path):
+        os.replace(spill_upload(file, os.path.dirname(path)), path)
+    return path
+
+
+def scan_upload(file: BinaryIO, path: str) -> pl.LazyFrame:
+    return scan_path(spill_upload_to(file, path))
+
+
+def write_ipc(df: pl.DataFrame, path: str) -> None:
+    """Atomically write ``df`` as uncompressed Arrow IPC.
+
+    Uncompressed IPC files are memory-mapped by ``pl.read_ipc``/``pl.scan_ipc``,
+    so reopening one costs neither a parse nor a heap copy. The file is
+    readable only by its owner (0600), like the spilled uploads.
+    """
+    # 업로드 사본(mkstemp)과 같은 권한으로, 다른 스레드가 쓰는 임시 파일과 겹치지 않게 만든다
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as out:
+            df.write_ipc(out, compression="uncompressed")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def scan_files(files: str | list[str], format: str, hive: bool = False) -> pl.LazyFrame:
+    if format == "parquet":
+        return pl.scan_parquet(files, hive_partitioning=hive)
+    if format == "ipc":
+        return pl.scan_ipc(files, hive_partitioning=hive)
+    if format == "ndjson":
+        return pl.scan_ndjson(files)
+    return pl.scan_csv(files, **CSV_READ_OPTIONS)
+
+
+def scan_path(path: str) -> pl.LazyFrame:
+    """Scan one file on disk, picking the reader from the file extension (CSV by default).
+
+    Directories, globs, column selection and row filters are handled by
+    ``polaris.source.DatasetSource``.
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+    return scan_files(path, detect_format(path))
@@ -0,0 +1,236 @@
+"""Per-section instrumentation: wall/CPU time, peak memory and shape of every phase.
+
+A ``Recorder`` opens a span per section and phase (``compute``/``render``);
+code running inside a span marks finer phases such as ``parse``, ``fit``,
+``to_pandas`` or ``rasterize`` with ``phase()``, which is a no-op when nothing
+is being recorded. Finished spans are logged as JSON on the
+``polaris.telemetry`` logger and, when ``opentelemetry`` is installed, also
+exported through the globally configured tracer provider (e.g. an OTLP
+exporter pointed at a local collector).
+"""
+
+import contextvars
+import cProfile
+import importlib.util
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any
+
+trace: ModuleType | None
+try:
+    from opentelemetry import trace
+except ImportError:  # 선택 의존성: 없으면 로그로만 내보낸다
+    trace = None
+
+logger = logging.getLogger("polaris.telemetry")
+
+PROFILERS = ("cprofile", "pyinstrument")
+# 프로파일러를 붙이는 단계 (섹션 단위)
+PROFILED_PHASES = ("compute", "render")
+# cProfile 리포트에 남기는 상위 함수 수
+PROFILE_TOP_N = 25
+RSS_SAMPLE_INTERVAL = 0.005
+
+_current: contextvars.ContextVar["Span | None"] = contextvars.ContextVar("polaris_span", default=None)
+
+
+def current_rss() -> int | None:
+    # Polars/NumPy 는 파이썬 힙 밖에서 할당하므로 tracemalloc 대신 프로세스 RSS 를 본다
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+def available_profilers() -> list[str]:
+    # cProfile 은 표준 라이브러리, pyinstrument 는 설치된 경우에만
+    return [name for name in PROFILERS if name == "cprofile" or importlib.util.find_spec(name) is not None]
+
+
+@dataclass(eq=False)
+class Span:
+    name: str
+    phase: str
+    parent: "Span | None" = None
+    rows: int | None = None
+    columns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_ns: int = 0
+    end_ns: int = 0
+    wall_s: float = 0.0
+    # 스팬을 연 스레드의 CPU 시간 / 같은 구간의 프로세스 전체 CPU 시간 (동시 실행 섹션과 겹침)
+    cpu_s: float = 0.0
+    process_cpu_s: float = 0.0
+    # 시작 시점 대비 최대 RSS 증가량 (프로세스 단위라 동시 실행 섹션의 할당도 포함)
+    peak_mb: float | None = None
+    error: str | None = None
+    profile: str | None = None
+    _recorder: "Recorder | None" = None
+    _start_rss: int | None = None
+    _peak_rss: int | None = None
+    _otel: Any = None
+
+    @property
+    def path(self) -> str:
+        label = f"{self.name}:{self.phase}"
+        return f"{self.parent.path}/{label}" if self.parent is not None else label
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "phase": self.phase,
+            "parent": self.parent.path if self.parent is not None else None,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "wall_s": round(self.wall_s, 6),
+            "cpu_s": round(self.cpu_s, 6),
+            "process_cpu_s": round(self.process_cpu_s, 6),
+            "peak_mb": self.peak_mb,
+            "rows": self.rows,
+            "columns": self.columns,
+            "error": self.error,
+            **({"attributes": self.attributes} if self.attributes else {}),
+        }
+
+
+class Recorder:
+    """Collects ``Span``s from any thread; ``profiler`` adds a profile to every compute/render span.
+
+    cProfile can only be active on one thread at a time, so callers must run
+    sections sequentially while a ``profiler`` is set.
+    """
+
+    def __init__(self, profiler: str | None = None, interval: float = RSS_SAMPLE_INTERVAL):
+        if profiler is not None and profiler not in PROFILERS:
+            raise ValueError(f"profiler must be one of {PROFILERS}, got {profiler!r}")
+        if profiler == "pyinstrument":
+            import pyinstrument  # noqa: F401  선택 의존성: 없으면 바로 ImportError
+        self.profiler = profiler
+        self.interval = interval
+        self.spans: list[Span] = []
+        self._open: set[Span] = set()
+        self._sampler: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._tracer = trace.get_tracer("polaris") if trace is not None else None
+
+    @contextmanager
+    def span(
+        self, name: str, phase: str, rows: int | None = None, columns: int | None = None, **attributes: Any
+    ) -> Iterator[Span]:
+        parent = _current.get()
+        span = Span(name, phase, parent, rows, columns, attributes, _recorder=self)
+        token = _current.set(span)
+        profiler = self._start_profiler() if self.profiler and phase in PROFILED_PHASES else None
+        self._open_span(span)
+        wall, cpu, process_cpu = time.perf_counter(), time.thread_time(), time.process_time()
+        try:
+            yield span
+        except BaseException as error:
+            span.error = f"{type(error).__name__}: {error}"
+            raise
+        finally:
+            span.wall_s = time.perf_counter() - wall
+            span.cpu_s = time.thread_time() - cpu
+            span.process_cpu_s = time.process_time() - process_cpu
+            self._close_span(span)
+            if profiler is not None:
+                span.profile = self._stop_profiler(profiler)
+            _current.reset(token)
+            self._emit(span)
+
+    def _open_span(self, span: Span) -> None:
+        span.start_ns = time.time_ns()
+        span._start_rss = span._peak_rss = current_rss()
+        if self._tracer is not None and trace is not None:
+            context = trace.set_span_in_context(span.parent._otel) if span.parent is not None else None
+            span._otel = self._tracer.start_span(f"{span.phase}:{span.name}", context=context, start_time=span.start_ns)
+        with self._lock:
+            self._open.add(span)
+            if self._sampler is None and span._start_rss is not None:
+                self._sampler = threading.Thread(target=self._sample, name="polaris-rss", daemon=True)
+                self._sampler.start()
+
+    def _close_span(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        rss = current_rss()
+        with self._lock:
+            self._open.discard(span)
+            self.spans.append(span)
+            if rss is not None and span._peak_rss is not None and span._start_rss is not None:
+                span._peak_rss = max(span._peak_rss, rss)
+                span.peak_mb = round((span._peak_rss - span._start_rss) / 1024**2, 1)
+
+    def _sample(self) -> None:
+        # 열린 스팬이 있는 동안만 RSS 를 표본 추출해 각 스팬의 최댓값을 갱신
+        while True:
+            time.sleep(self.interval)
+            rss = current_rss()
+            with self._lock:
+                if not self._open:
+                    self._sampler = None
+                    return
+                for span in self._open:
+                    if rss is not None and span._peak_rss is not None and rss > span._peak_rss:
+                        span._peak_rss = rss
+
+    def _start_profiler(self) -> Any:
+        if self.profiler == "pyinstrument":
+            from pyinstrument import Profiler
+
+            profiler = Profiler(async_mode="disabled")
+            profiler.start()
+            return profiler
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _stop_profiler(self, profiler: Any) -> str:
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+            return stream.getvalue()
+        profiler.stop()
+        return profiler.output_text(unicode=True)
+
+    def _emit(self, span: Span) -> None:
+        record = span.to_dict()
+        logger.info(json.dumps(record, default=str), extra={"span": record})
+        if span._otel is not None:
+            skip = ("start_ns", "end_ns", "attributes")
+            attributes = {key: value for key, value in record.items() if key not in skip}
+            for key, value in {**attributes, **span.attributes}.items():
+                if value is not None:
+                    # OTel 속성은 기본 타입만 허용
+                    plain = value if isinstance(value, (str, bool, int, float)) else str(value)
+                    span._otel.set_attribute(f"polaris.{key}", plain)
+            if span.error is not None and trace is not None:
+                span._otel.set_status(trace.Status(trace.StatusCode.ERROR, span.error))
+            span._otel.end(end_time=span.end_ns)
+
+    def rows(self) -> list[dict]:
+        """Finished spans in start order, as flat dicts (one table row per span)."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start_ns)
+        return [span.to_dict() for span in spans]
+
+
+@contextmanager
+def phase(name: str, rows: int | None = None, columns: int | None = None, **attributes: Any) -> Iterator[Span | None]:
+    """Child span ``name`` of the active span, under the same section name (no-op outside a ``Recorder.span``)."""
+    parent = _current.get()
+    if parent is None or parent._recorder is None:
+        yield None
+        return
+    with parent._recorder.span(parent.name, name, rows, columns, **attributes) as span:
+        yield span
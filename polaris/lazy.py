@@ -0,0 +1,71 @@
+import polars as pl
+
+from polaris.features import FeatureMatrix
+
+NUMERIC_DTYPES = (pl.Float64, pl.Int64)
+INVALID_STRING_VALUES = ["?", "unknown", "n/a", "null", "missing", "-", ""]
+
+
+def columns_of(schema: pl.Schema, *dtypes: type[pl.DataType] | pl.DataType) -> list[str]:
+    return [col for col, dtype in schema.items() if dtype in dtypes]
+
+
+class LazyProfile:
+    """Every statistic the EDA report shows, planned as lazy queries over one source.
+
+    ``collect`` evaluates all of them with a single ``pl.collect_all`` so the
+    optimizer can share the scan between queries, and each query only
+    projects the columns it needs.
+    """
+
+    def __init__(self, lf: pl.LazyFrame, top_k: int = 10, bin_count: int = 20, head: int = 5):
+        self.lf = lf
+        self.schema = lf.collect_schema()
+        self.top_k = top_k
+        self.bin_count = bin_count
+        self.head = head
+
+    def queries(self) -> dict[tuple[str, str], pl.LazyFrame]:
+        lf = self.lf
+        numeric_cols = columns_of(self.schema, *NUMERIC_DTYPES)
+        text_cols = columns_of(self.schema, pl.Utf8)
+        bool_cols = columns_of(self.schema, pl.Boolean)
+        date_cols = columns_of(self.schema, pl.Date)
+        structured_cols = columns_of(self.schema, pl.List, pl.Struct)
+
+        queries = {
+            ("overview", "rows"): lf.select(pl.len().alias("rows")),
+            ("overview", "null_counts"): lf.select(pl.all().null_count()),
+        }
+        if numeric_cols:
+            queries["numeric", "min"] = lf.select(pl.col(numeric_cols).min())
+            queries["numeric", "max"] = lf.select(pl.col(numeric_cols).max())
+            queries["numeric", "features"] = FeatureMatrix.stats_query(lf, numeric_cols)
+            queries["numeric", "hist"] = lf.select(
+                pl.col(col).hist(bin_count=self.bin_count, include_breakpoint=True) for col in numeric_cols
+            )
+        for col in text_cols + bool_cols:
+            queries["top", col] = (
+                lf.group_by(col).agg(pl.len().alias("count")).sort("count", descending=True).head(self.top_k)
+            )
+        if text_cols:
+            cleaned = {col: pl.col(col).str.strip_chars().str.to_lowercase() for col in text_cols}
+            queries["invalid", "counts"] = lf.select(
+                cleaned[col].is_in(INVALID_STRING_VALUES).sum().alias(col) for col in text_cols
+            )
+            queries["invalid", "values"] = lf.select(
+                pl.col(col).filter(cleaned[col].is_in(INVALID_STRING_VALUES)).unique().implode() for col in text_cols
+            )
+        for col in date_cols:
+            queries["dates", col] = lf.group_by(col).agg(pl.len().alias("count")).sort(col)
+        if structured_cols:
+            queries["structured", "head"] = lf.select(structured_cols).head(self.head)
+        return queries
+
+    def collect(self) -> dict[tuple[str, str], pl.DataFrame]:
+        queries = self.queries()
+        return dict(zip(queries, pl.collect_all(queries.values()), strict=True))
+
+    @staticmethod
+    def histogram(stats: dict[tuple[str, str], pl.DataFrame], col: str) -> pl.DataFrame:
+        return stats["numeric", "hist"].select(pl.col(col)).unnest(col)
@@ -0,0 +1,290 @@
+"""Incremental data quality monitoring against a persisted baseline.
+
+A ``QualityMonitor`` stores the mergeable per-column accumulators of
+``StreamingProfiler`` (counts, nulls, min/max, moments, histograms, top-k and
+HyperLogLog sketches) plus a duplicate-row estimator in one compact file.
+Each update profiles only the new rows, compares them with the stored
+baseline and merges them in, so checking a delta costs time proportional to
+the delta, not to the accumulated table.
+"""
+
+import hashlib
+import json
+import math
+import os
+import struct
+import tempfile
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+import polars as pl
+
+from polaris.ingest import CSV_READ_OPTIONS
+from polaris.sketches import DuplicateEstimator, HyperLogLog, SpaceSaving
+from polaris.streaming import DEFAULT_BATCH_SIZE, ColumnAccumulator, Histogram, StreamingProfiler
+
+MONITOR_MAGIC = b"PQM1"
+# PSI 0.1 이상은 주의, 0.2 이상은 유의미한 분포 변화로 보는 관례를 따른다
+PSI_THRESHOLDS = (0.1, 0.2)
+TOP_SHARE_THRESHOLDS = (0.1, 0.2)
+NULL_RATE_THRESHOLD = 0.05
+FINGERPRINT_BYTES = 64 * 1024
+PSI_EPSILON = 1e-4
+
+
+def population_stability(baseline: Histogram, current: Histogram) -> float | None:
+    """Population stability index between two histograms on their common grid."""
+    if baseline.width is None or current.width is None:
+        return None
+    expected, actual = baseline.aligned(current)
+    if not expected.sum() or not actual.sum():
+        return None
+    p = np.maximum(expected / expected.sum(), PSI_EPSILON)
+    q = np.maximum(actual / actual.sum(), PSI_EPSILON)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+def top_share_distance(baseline: SpaceSaving, current: SpaceSaving) -> float | None:
+    """Total variation distance between the top-value shares (untracked values pooled as "other")."""
+    if not baseline.total or not current.total:
+        return None
+    items = baseline.counts.keys() | current.counts.keys()
+    p = np.array([baseline.counts.get(item, 0) / baseline.total for item in items])
+    q = np.array([current.counts.get(item, 0) / current.total for item in items])
+    other = abs((1 - p.sum()) - (1 - q.sum()))
+    return float(0.5 * (np.abs(p - q).sum() + other))
+
+
+def _new_distinct(baseline: HyperLogLog | None, current: HyperLogLog | None) -> int | None:
+    if baseline is None or current is None:
+        return None
+    union = HyperLogLog(baseline.precision)
+    union.registers = baseline.registers.copy()
+    union.merge(current)
+    return max(round(union.estimate() - baseline.estimate()), 0)
+
+
+def _status(value: float | None, thresholds: tuple[float, float]) -> int:
+    if value is None or math.isnan(value):
+        return 0
+    return 2 if value >= thresholds[1] else 1 if value >= thresholds[0] else 0
+
+
+def column_drift(baseline: ColumnAccumulator, current: ColumnAccumulator) -> dict:
+    base_null = baseline.null_count / baseline.count if baseline.count else None
+    cur_null = current.null_count / current.count if current.count else None
+    null_change = None if base_null is None or cur_null is None else cur_null - base_null
+    mean_shift = None
+    if baseline.numeric and current.moment_count and baseline.std:
+        mean_shift = (current.mean - baseline.mean) / baseline.std
+    psi = None
+    if baseline.histogram is not None and current.histogram is not None:
+        psi = population_stability(baseline.histogram, current.histogram)
+    top_distance = top_share_distance(baseline.top, current.top) if baseline.top and current.top else None
+    out_of_range = None
+    if baseline.min is not None and current.min is not None:
+        out_of_range = bool(current.min < baseline.min or current.max > baseline.max)
+    level = max(
+        _status(psi, PSI_THRESHOLDS),
+        _status(top_distance, TOP_SHARE_THRESHOLDS),
+        2 if null_change is not None and abs(null_change) >= NULL_RATE_THRESHOLD else 0,
+    )
+    return {
+        "column": baseline.name,
+        "baseline_rows": baseline.count,
+        "delta_rows": current.count,
+        "baseline_null_rate": base_null,
+        "delta_null_rate": cur_null,
+        "null_rate_change": null_change,
+        "mean_shift_std": mean_shift,
+        "psi": psi,
+        "top_share_distance": top_distance,
+        "new_distinct_estimate": _new_distinct(baseline.distinct, current.distinct),
+        "out_of_range": out_of_range,
+        "status": ("ok", "warning", "drift")[level],
+    }
+
+
+@dataclass
+class DriftReport:
+    baseline_rows: int
+    delta_rows: int
+    duplicate_rows_estimate: int
+    columns: pl.DataFrame
+    schema_changes: list[str] = field(default_factory=list)
+
+    @property
+    def drifted(self) -> list[str]:
+        return self.columns.filter(pl.col("status") == "drift")["column"].to_list() if self.columns.height else []
+
+    def to_dict(self) -> dict:
+        return {
+            "baseline_rows": self.baseline_rows,
+            "delta_rows": self.delta_rows,
+            "duplicate_rows_estimate": self.duplicate_rows_estimate,
+            "schema_changes": self.schema_changes,
+            "columns": self.columns.to_dicts(),
+        }
+
+
+def drift_report(baseline: StreamingProfiler, current: StreamingProfiler, duplicate_rows: int = 0) -> DriftReport:
+    rows = [
+        column_drift(accumulator, current.columns[name])
+        for name, accumulator in baseline.columns.items()
+        if name in current.columns and baseline.rows
+    ]
+    return DriftReport(baseline.rows, current.rows, duplicate_rows, pl.DataFrame(rows))
+
+
+class QualityMonitor:
+    """Baseline accumulator state persisted at ``path`` and updated with appended rows."""
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        top_k: int = 100,
+        bin_count: int = 20,
+        precision: int = 14,
+    ):
+        self.path = path
+        self.profile = StreamingProfiler(batch_size, top_k, bin_count, precision)
+        self.duplicates = DuplicateEstimator(precision)
+        # update_csv 가 이어 읽을 위치: 소비한 바이트 수, 헤더, 직전 구간의 지문
+        self.source: dict | None = None
+        self.history: list[dict] = []
+
+    @classmethod
+    def open(cls, path: str, **kwargs: int) -> "QualityMonitor":
+        """Load the monitor stored at ``path``, or start an empty baseline there."""
+        if not os.path.exists(path):
+            return cls(path, **kwargs)
+        with open(path, "rb") as f:
+            return cls.from_bytes(path, f.read())
+
+    @property
+    def rows(self) -> int:
+        return self.profile.rows
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps({"source": self.source, "history": self.history}).encode()
+        profile = self.profile.to_bytes()
+        duplicates = zlib.compress(self.duplicates.to_bytes())
+        sizes = struct.pack("<III", len(header), len(profile), len(duplicates))
+        return MONITOR_MAGIC + sizes + header + profile + duplicates
+
+    @classmethod
+    def from_bytes(cls, path: str, data: bytes) -> "QualityMonitor":
+        if data[:4] != MONITOR_MAGIC:
+            raise ValueError(f"{path} is not a quality monitor state file")
+        sizes = struct.unpack_from("<III", data, 4)
+        offset = 4 + struct.calcsize("<III")
+        header, profile, duplicates = (data[offset + sum(sizes[:i]) : offset + sum(sizes[: i + 1])] for i in range(3))
+        monitor = cls(path)
+        monitor.profile = StreamingProfiler.from_bytes(profile)
+        monitor.duplicates = DuplicateEstimator.from_bytes(zlib.decompress(duplicates))
+        state = json.loads(header)
+        monitor.source, monitor.history = state["source"], state["history"]
+        return monitor
+
+    def save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.to_bytes())
+        os.replace(tmp, self.path)
+
+    def _conform(self, batch: pl.DataFrame, changes: list[str]) -> pl.DataFrame:
+        # 기준선과 타입이 다른 컬럼은 기준선 타입으로 맞추고(변환 실패는 null), 변경 내역을 남긴다
+        schema = self.profile.schema
+        if not schema:
+            return batch
+        for name in schema.keys() - batch.columns:
+            changes.append(f"missing column: {name}")
+        for name in batch.columns:
+            if name not in schema:
+                changes.append(f"new column: {name}")
+            elif batch.schema[name] != schema[name]:
+                changes.append(f"dtype changed: {name} {schema[name]} -> {batch.schema[name]}")
+                batch = batch.with_columns(pl.col(name).cast(schema[name], strict=False))
+        return batch
+
+    def update(self, delta: pl.DataFrame | pl.LazyFrame | Iterable[pl.DataFrame]) -> DriftReport:
+        """Profile only ``delta``, report its drift against the baseline, then merge it in."""
+        if isinstance(delta, pl.LazyFrame):
+            delta = delta.collect_batches(chunk_size=self.profile.batch_size)
+        batches = [delta] if isinstance(delta, pl.DataFrame) else delta
+        profile = self.profile
+        current = StreamingProfiler(profile.batch_size, profile.top_k, profile.bin_count, profile.precision)
+        duplicates = DuplicateEstimator(self.profile.precision)
+        changes: list[str] = []
+        for batch in batches:
+            batch = self._conform(batch, changes)
+            current.update(batch)
+            duplicates.update(batch)
+        report = drift_report(self.profile, current, self._duplicate_rows(duplicates))
+        report.schema_changes = list(dict.fromkeys(changes))
+
+        self.profile.merge(current)
+        self.duplicates.merge(duplicates)
+        self.history.append(
+            {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "delta_rows": report.delta_rows,
+                "total_rows": self.profile.rows,
+                "duplicate_rows_estimate": report.duplicate_rows_estimate,
+                "drifted": report.drifted,
+                "schema_changes": report.schema_changes,
+            }
+        )
+        return report
+
+    def _duplicate_rows(self, delta: DuplicateEstimator) -> int:
+        # 델타 행 중 기준선이나 델타 안의 다른 행과 겹치는 행 수 (HLL 합집합으로 추정)
+        union = DuplicateEstimator(self.profile.precision)
+        union.merge(self.duplicates).merge(delta)
+        return max(delta.rows - (union.distinct_rows() - self.duplicates.distinct_rows()), 0)
+
+    def update_csv(self, path: str) -> DriftReport:
+        """Read only the bytes appended to ``path`` since the last update and process them.
+
+        The file must be the same CSV with rows appended: the header and the
+        last bytes consumed so far are checked before reading. An incomplete
+        last line is left for the next update.
+        """
+        with open(path, "rb") as f:
+            header = f.readline()
+            start = f.tell()
+            if self.source is not None:
+                if header.decode() != self.source["header"]:
+                    raise ValueError(f"{path} has a different header than the monitored feed")
+                start = self.source["offset"]
+                f.seek(max(start - FINGERPRINT_BYTES, 0))
+                if _fingerprint(f.read(start - max(start - FINGERPRINT_BYTES, 0))) != self.source["fingerprint"]:
+                    raise ValueError(f"{path} is not an append-only continuation of the monitored feed")
+            f.seek(start)
+            data = f.read()
+        # 아직 쓰는 중일 수 있는 마지막 줄(개행 없음)은 다음 갱신으로 미룬다
+        end = data.rfind(b"\n") + 1
+        chunk = data[:end]
+        schema = self.profile.schema
+        if chunk.strip():
+            delta = pl.read_csv(header + chunk, schema_overrides=dict(schema), **CSV_READ_OPTIONS)
+        else:
+            delta = pl.DataFrame(schema=schema)
+        report = self.update(delta)
+        consumed = start + end
+        tail_start = max(consumed - FINGERPRINT_BYTES, 0)
+        with open(path, "rb") as f:
+            f.seek(tail_start)
+            fingerprint = _fingerprint(f.read(consumed - tail_start))
+        self.source = {"offset": consumed, "header": header.decode(), "fingerprint": fingerprint}
+        return report
+
+
+def _fingerprint(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
@@ -0,0 +1,718 @@
+"""Headless dataset profile: the EDA report's computations without any UI.
+
+``EDAEngine`` computes every report section as plain data (one
+``compute_<section>`` method each). The Streamlit report renders those
+results; ``EDAEngine.profile`` returns them as a ``DatasetProfile`` instead,
+with JSON-safe section summaries and a per-column metrics table that can be
+shipped as Arrow IPC.
+"""
+
+import math
+import os
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+from functools import partial
+from typing import Any, overload
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from polaris.cache import ResultCache, cache_key, file_hash
+from polaris.correlation import check_correlation_method, correlate, correlate_batches, heatmap_columns, top_pairs
+from polaris.features import FeatureMatrix
+from polaris.instrument import Recorder, phase
+from polaris.lazy import INVALID_STRING_VALUES, NUMERIC_DTYPES, LazyProfile, columns_of
+from polaris.quality import QualityAssessment, RuleSet, rule_from_dict
+from polaris.render import histogram_bins
+from polaris.sampling import (
+    DEFAULT_ROW_BUDGET,
+    DEFAULT_SEED,
+    SCORE_BATCH_SIZE,
+    iter_frame_batches,
+    quantile_strata,
+    reservoir_sample,
+    sample_indices,
+    score_in_batches,
+    stratified_indices,
+)
+from polaris.scheduler import SectionRun, run_sections
+from polaris.sketches import SpaceSaving, check_method
+from polaris.source import DatasetSource, resolve_data_path
+
+# 이 크기 이상의 데이터셋은 기본적으로 lazy 모드로 분석
+LAZY_THRESHOLD_BYTES = 512 * 1024**2
+# JSON 요약에 담는 이상치 행 수
+OUTLIER_SAMPLE_ROWS = 20
+
+
+def to_pandas(frame: pl.DataFrame) -> pd.DataFrame:
+    # 렌더링용 pandas 복사본 (계측 대상 단계)
+    with phase("to_pandas", rows=frame.height, columns=frame.width):
+        return frame.to_pandas()
+
+
+class EDAEngine:
+    """Every EDA report section as a ``compute_<section>`` method returning plain data."""
+
+    # 리포트에 표시되는 순서
+    SECTIONS = [
+        ("dataset_overview", "📌 Dataset Overview"),
+        ("detect_anomalies", "🚨 Anomaly Detection"),
+        ("categorical_data_analysis", "🔢 Categorical Data Analysis"),
+        ("visualize_numeric_data", "📊 Numeric Data Distribution"),
+        ("timeseries_analysis", "📅 Time-Series Analysis"),
+        ("analyze_binary_data", "🔘 Binary Data Analysis"),
+        ("analyze_structured_data", "📂 Structured Data Analysis (List/Struct)"),
+        ("correlation_matrix", "📈 Correlation Matrix"),
+        ("feature_importance", "📌 Feature Importance (Random Forest)"),
+        ("cluster_analysis", "🔍 K-Means Clustering"),
+        ("pca_visualization", "📌 PCA Visualization"),
+    ]
+    # 섹션이 self.derived 에 남기는 파생 컬럼 (캐시 적중 시 결과와 함께 복원)
+    DERIVED = {"detect_anomalies": "outlier", "cluster_analysis": "cluster"}
+
+    def __init__(
+        self,
+        frame: pl.DataFrame | pl.LazyFrame,
+        lazy: bool = False,
+        row_budget: int = DEFAULT_ROW_BUDGET,
+        seed: int = DEFAULT_SEED,
+        feature_dtype: type = np.float64,
+        fingerprint: str | None = None,
+        result_cache: ResultCache | None = None,
+        recorder: Recorder | None = None,
+    ):
+        self.lazy = lazy or isinstance(frame, pl.LazyFrame)
+        # 모델 학습에 쓰는 최대 행 수와 표본 추출 시드 (결과 재현용)
+        self.row_budget = row_budget
+        self.seed = seed
+        self.df: pl.DataFrame | None
+        self.lf: pl.LazyFrame | None
+        if self.lazy:
+            # lazy 모드: 전체 프레임을 메모리에 올리지 않고 필요한 통계/컬럼만 계산
+            self.df = None
+            self.lf = frame.lazy()
+        else:
+            self.df = frame if isinstance(frame, pl.DataFrame) else frame.collect()
+            self.lf = None
+        # 섹션이 만든 파생 컬럼(outlier, cluster)은 원본 프레임과 분리해 보관 (수치형 행렬을 무효화하지 않음)
+        self.derived: dict[str, np.ndarray] = {}
+        # lazy 모드의 통계 (결과 캐시에 없는 섹션이 처음 쓸 때 한 번만 스캔)
+        self._stats: dict[tuple[str, str], pl.DataFrame] | None = None
+        self._stats_lock = threading.Lock()
+        self.timings: dict[str, dict[str, float]] = {}
+        # 모델 섹션이 공유하는 수치형 행렬과 학습 표본 (병렬 섹션에서 한 번만 만들도록 잠금)
+        self.feature_dtype = feature_dtype
+        self._features: FeatureMatrix | None = None
+        self._samples: dict[str | None, np.ndarray] = {}
+        self._features_lock = threading.RLock()
+        # fingerprint(원본 파일의 내용 해시)가 있을 때만 섹션 결과를 캐시한다
+        self.result_cache = result_cache if fingerprint else None
+        self.fingerprint: str | None = None
+        if fingerprint:
+            # 같은 파일이라도 스키마나 표본 설정이 다르면 다른 결과로 취급
+            frame_params = {
+                "schema": {name: str(dtype) for name, dtype in self.schema.items()},
+                "lazy": self.lazy,
+                "row_budget": row_budget,
+                "seed": seed,
+                "feature_dtype": np.dtype(feature_dtype).name,
+            }
+            self.fingerprint = cache_key(fingerprint, "frame", frame_params)
+        self.cache_hits: set[str] = set()
+        # 섹션별 계산 단계의 시간/메모리 기록 (없으면 계측하지 않음)
+        self.recorder = recorder
+
+    @property
+    def _df(self) -> pl.DataFrame:
+        # eager 모드에서만 쓰는 전체 프레임
+        assert self.df is not None
+        return self.df
+
+    @property
+    def _lf(self) -> pl.LazyFrame:
+        # lazy 모드에서만 쓰는 지연 프레임
+        assert self.lf is not None
+        return self.lf
+
+    @property
+    def stats(self) -> dict[tuple[str, str], pl.DataFrame]:
+        """Lazy mode's one-pass ``LazyProfile`` statistics, collected on first use."""
+        with self._stats_lock:
+            if self._stats is None:
+                if self.lazy:
+                    with phase("stats"):
+                        self._stats = LazyProfile(self._lf).collect()
+                else:
+                    self._stats = {}
+            return self._stats
+
+    @property
+    def schema(self) -> pl.Schema:
+        return self._lf.collect_schema() if self.lazy else self._df.schema
+
+    def _select(self, columns: list[str]) -> pl.DataFrame:
+        if self.lazy:
+            return self._lf.select(columns).collect()
+        return self._df.select(columns)
+
+    @property
+    def numeric_cols(self) -> list[str]:
+        return columns_of(self.schema, *NUMERIC_DTYPES)
+
+    @property
+    def features(self) -> FeatureMatrix:
+        with self._features_lock:
+            if self._features is None:
+                with phase("features", columns=len(self.numeric_cols)):
+                    if self.lazy:
+                        # lazy 모드: 대치 규칙만 통계에서 가져오고 행렬은 표본/배치 단위로 만든다
+                        stats = self.stats.get(("numeric", "features"), pl.DataFrame())
+                        self._features = FeatureMatrix.from_stats(stats, self.numeric_cols, self.feature_dtype)
+                    else:
+                        self._features = FeatureMatrix.from_frame(self._df, self.numeric_cols, self.feature_dtype)
+            return self._features
+
+    def _row_count(self) -> int:
+        return self.stats["overview", "rows"].item() if self.lazy else self._df.height
+
+    def _fit_sample(self, stratify_by: str | None = None) -> np.ndarray:
+        features = self.features
+        if self.lazy:
+            # 스트리밍 reservoir 표본은 층화 없이 한 번만 뽑아 모든 섹션이 공유
+            stratify_by = None
+        with self._features_lock:
+            if stratify_by not in self._samples:
+                with phase("sample", stratify_by=stratify_by):
+                    if self.lazy:
+                        batches = iter_frame_batches(self._lf.select(features.columns))
+                        sample, _ = reservoir_sample(batches, self.row_budget, self.seed)
+                        self._samples[stratify_by] = features.transform(sample)
+                    elif stratify_by is not None:
+                        strata = quantile_strata(features.column(stratify_by))
+                        indices = stratified_indices(strata, self.row_budget, self.seed)
+                        self._samples[stratify_by] = features.take(indices)
+                    else:
+                        indices = sample_indices(self._row_count(), self.row_budget, self.seed)
+                        self._samples[stratify_by] = features.take(indices)
+            return self._samples[stratify_by]
+
+    def _score_batches(self) -> Iterator[np.ndarray]:
+        features = self.features
+        if self.lazy:
+            return (features.transform(frame) for frame in iter_frame_batches(self._lf.select(features.columns)))
+        return features.batches(SCORE_BATCH_SIZE)
+
+    def compute_dataset_overview(self) -> dict:
+        height = self.stats["overview", "rows"].item() if self.lazy else self._df.height
+        return {"height": height, "width": len(self.schema), "schema": self.schema}
+
+    def compute_detect_anomalies(self) -> dict:
+        result: dict[str, Any] = {"numeric_cols": self.numeric_cols}
+        numeric_cols = result["numeric_cols"]
+
+        if numeric_cols:
+            from sklearn.ensemble import IsolationForest
+
+            # Isolation Forest for Numeric Outlier Detection (표본으로 학습, 전체 행은 배치로 채점)
+            sample = self._fit_sample()
+            model = IsolationForest(contamination=0.05, random_state=self.seed, n_jobs=-1)
+            with phase("fit", rows=len(sample), columns=sample.shape[1]):
+                model.fit(sample)
+            with phase("score"):
+                outliers = score_in_batches(model.predict, self._score_batches())
+            self.derived["outlier"] = outliers
+            result["sample_size"], result["total_rows"] = len(sample), len(outliers)
+
+            if self.lazy:
+                # 이상치 행만 다시 읽어온다 (전체 프레임은 materialize 하지 않음)
+                outlier_rows = pl.Series(np.flatnonzero(outliers == -1))
+                result["outlier_data"] = self._lf.filter(pl.int_range(pl.len()).is_in(outlier_rows)).collect()
+            else:
+                result["outlier_data"] = self._df.filter(pl.Series(outliers == -1))
+            result["outlier_count"] = (outliers == -1).sum()
+
+        # Detecting Invalid String Values
+        common_invalid_values = INVALID_STRING_VALUES
+
+        text_cols = columns_of(self.schema, pl.Utf8)
+
+        anomalies = []
+        for col in text_cols:
+            if self.lazy:
+                invalid_counts = self.stats["invalid", "counts"][col].item()
+                detected_values = self.stats["invalid", "values"][col].item().to_list()
+            else:
+                cleaned_col = self._df[col].cast(pl.Utf8).str.strip_chars().str.to_lowercase()
+                invalid_counts = cleaned_col.is_in(common_invalid_values).sum()
+                detected_values = self._df[col].filter(cleaned_col.is_in(common_invalid_values)).unique().to_list()
+
+            if invalid_counts > 0:
+                anomalies.append(
+                    {
+                        "Column": col,
+                        "Invalid Values Count": invalid_counts,
+                        "Detected Values": ", ".join(map(str, detected_values)),
+                    }
+                )
+        result["invalid_strings"] = anomalies
+        return result
+
+    def compute_visualize_numeric_data(self, chart: str = "plotly") -> dict:
+        numeric_cols = self.numeric_cols
+        result: dict[str, Any] = {"numeric_cols": numeric_cols, "chart": chart}
+        if self.lazy:
+            # 미리 계산된 20개 bin 으로 그린다 (KDE 는 원본 컬럼이 필요해 생략)
+            result["histograms"] = {col: LazyProfile.histogram(self.stats, col) for col in numeric_cols}
+        elif chart == "seaborn":
+            # KDE 는 결측을 뺀 원본 값이 필요하므로 대치된 행렬 대신 컬럼 버퍼를 그대로 넘긴다
+            result["values"] = {col: self._df[col].drop_nulls().to_numpy() for col in numeric_cols}
+        else:
+            # 원본 컬럼 대신 한 번의 select 로 계산한 bin 만 넘긴다
+            result["histograms"] = histogram_bins(self._df, numeric_cols)
+        return result
+
+    def compute_analyze_binary_data(self) -> dict:
+        binary_cols = columns_of(self.schema, pl.Boolean)
+        value_counts = {}
+        for col in binary_cols:
+            if self.lazy:
+                value_counts[col] = to_pandas(self.stats["top", col])
+            else:
+                value_counts[col] = to_pandas(self._df[col].value_counts())
+        return {"binary_cols": binary_cols, "value_counts": value_counts}
+
+    def compute_analyze_structured_data(self) -> dict:
+        structured_cols = columns_of(self.schema, pl.List, pl.Struct)
+        examples = {}
+        for col in structured_cols:
+            examples[col] = (self.stats["structured", "head"][col] if self.lazy else self._df[col].head(5)).to_list()
+        return {"structured_cols": structured_cols, "examples": examples}
+
+    def compute_correlation_matrix(self, method: str = "pearson", top_k: int = 20) -> dict:
+        check_correlation_method(method)
+        numeric_cols = self.numeric_cols
+        if len(numeric_cols) < 2:
+            return {"numeric_cols": numeric_cols}
+        if method == "pearson" and not self.lazy and self.features.complete:
+            # 결측이 없으면 공유 행렬의 배치 뷰로 바로 계산 (대치값이 섞이면 상관계수가 달라지므로 이 경우만)
+            corr = correlate_batches(numeric_cols, self.features.batches(SCORE_BATCH_SIZE))
+        else:
+            corr = correlate(self._lf if self.lazy else self._df, numeric_cols, method=method)
+        # 넓은 테이블은 강한 상관을 가진 컬럼만 군집 순서로 그린다
+        shown = heatmap_columns(corr, numeric_cols)
+        labels = [numeric_cols[i] for i in shown]
+        return {
+            "numeric_cols": numeric_cols,
+            "method": method,
+            "corr_matrix": pd.DataFrame(corr[np.ix_(shown, shown)], index=labels, columns=labels),
+            "top_pairs": top_pairs(corr, numeric_cols, k=top_k),
+        }
+
+    def compute_categorical_data_analysis(self, method: str = "exact") -> dict:
+        check_method(method)
+        cat_cols = columns_of(self.schema, pl.Utf8)
+        value_counts = {}
+        for col in cat_cols:
+            if self.lazy:
+                value_counts[col] = to_pandas(self.stats["top", col])
+            elif method == "sketch":
+                # Space-Saving 요약으로 전체 value_counts 없이 상위 10개를 근사
+                top = SpaceSaving(capacity=100)
+                top.update(self._df[col])
+                top_values = [(value, count) for value, count, _ in top.top(10)]
+                value_counts[col] = to_pandas(pl.DataFrame(top_values, schema=[col, "count"], orient="row"))
+            else:
+                value_counts[col] = to_pandas(self._df[col].value_counts(sort=True).head(10))
+        return {"cat_cols": cat_cols, "value_counts": value_counts}
+
+    def compute_timeseries_analysis(self) -> dict:
+        date_cols = columns_of(self.schema, pl.Date)
+        time_series = {}
+        for col in date_cols:
+            if self.lazy:
+                time_series[col] = self.stats["dates", col]
+            else:
+                time_series[col] = self._df.group_by(col).agg(pl.len().alias("count")).sort(col)
+        return {"date_cols": date_cols, "time_series": time_series}
+
+    def compute_feature_importance(self) -> dict:
+        numeric_cols = self.numeric_cols
+        if len(numeric_cols) < 2:
+            return {"numeric_cols": numeric_cols}
+
+        # 타깃 분위수로 층화한 표본으로 학습 (행렬의 마지막 컬럼이 타깃)
+        from sklearn.ensemble import RandomForestRegressor
+
+        sample = self._fit_sample(stratify_by=numeric_cols[-1])
+        model = RandomForestRegressor(n_jobs=-1, random_state=self.seed)
+        with phase("fit", rows=len(sample), columns=sample.shape[1] - 1):
+            model.fit(sample[:, :-1], sample[:, -1])
+        return {
+            "numeric_cols": numeric_cols,
+            "importance": model.feature_importances_,
+            "sample_size": len(sample),
+            "total_rows": self._row_count(),
+        }
+
+    def compute_cluster_analysis(self) -> dict:
+        numeric_cols = self.numeric_cols
+        if len(numeric_cols) < 2:
+            return {"numeric_cols": numeric_cols}
+
+        from sklearn.cluster import KMeans, MiniBatchKMeans
+
+        sample = self._fit_sample()
+        total_rows = self._row_count()
+        with phase("fit", rows=len(sample), columns=sample.shape[1]):
+            if total_rows > self.row_budget:
+                kmeans = MiniBatchKMeans(n_clusters=3, random_state=self.seed, n_init=3).fit(sample)
+            else:
+                kmeans = KMeans(n_clusters=3, random_state=self.seed).fit(sample)
+        with phase("score"):
+            labels = score_in_batches(kmeans.predict, self._score_batches())
+        self.derived["cluster"] = labels
+        return {
+            "numeric_cols": numeric_cols,
+            "points": sample[:, :2],
+            "point_labels": kmeans.predict(sample),
+            "labels": labels,
+            "sample_size": len(sample),
+            "total_rows": total_rows,
+        }
+
+    def compute_pca_visualization(self) -> dict:
+        numeric_cols = self.numeric_cols
+        if len(numeric_cols) < 2:
+            return {"numeric_cols": numeric_cols}
+
+        from sklearn.decomposition import PCA, IncrementalPCA
+
+        sample = self._fit_sample()
+        total_rows = self._row_count()
+        if total_rows > self.row_budget:
+            # 대용량: 전체 행을 배치로 흘려보내며 IncrementalPCA 로 학습
+            pca = IncrementalPCA(n_components=2)
+            with phase("fit", rows=total_rows, columns=sample.shape[1]):
+                for batch in self._score_batches():
+                    if len(batch) >= 2:
+                        pca.partial_fit(batch)
+            sample_size = total_rows
+        else:
+            with phase("fit", rows=len(sample), columns=sample.shape[1]):
+                pca = PCA(n_components=2, random_state=self.seed).fit(sample)
+            sample_size = len(sample)
+        reduced = pca.transform(sample)
+        return {
+            "numeric_cols": numeric_cols,
+            "reduced": reduced,
+            "explained_variance": pca.explained_variance_ratio_ * 100,
+            "sample_size": sample_size,
+            "total_rows": total_rows,
+        }
+
+    def section_tasks(
+        self,
+        sections: list[str] | None = None,
+        method: str = "exact",
+        chart: str = "plotly",
+        correlation: str = "pearson",
+    ) -> dict[str, Callable[[], dict]]:
+        """Zero-argument compute callables for ``sections`` (all by default), in report order."""
+        names = [name for name, _ in self.SECTIONS]
+        unknown = sorted(set(sections or ()) - set(names))
+        if unknown:
+            raise ValueError(f"unknown sections {unknown}; expected any of {names}")
+        kwargs = {
+            "categorical_data_analysis": {"method": method},
+            "visualize_numeric_data": {"chart": chart},
+            "correlation_matrix": {"method": correlation},
+        }
+        tasks: dict[str, Callable[[], dict]] = {}
+        for name in names:
+            if sections is None or name in sections:
+                compute: Callable[[], dict] = partial(getattr(self, f"compute_{name}"), **kwargs.get(name, {}))
+                if self.result_cache is not None:
+                    compute = partial(self._cached, name, compute, kwargs.get(name, {}))
+                if self.recorder is not None:
+                    compute = partial(self._recorded, name, compute)
+                tasks[name] = compute
+        return tasks
+
+    def _recorded(self, section: str, compute: Callable[[], dict]) -> dict:
+        assert self.recorder is not None
+        with self.recorder.span(section, "compute", columns=len(self.schema)) as span:
+            result = compute()
+            span.attributes["cached"] = section in self.cache_hits
+            # 모든 섹션이 캐시에서 나온 lazy 실행은 행 수를 알려고 통계 스캔을 돌리지 않는다
+            if not self.lazy or self._stats is not None:
+                span.rows = self._row_count()
+            return result
+
+    def _cached[T](self, section: str, compute: Callable[[], T], params: dict) -> T:
+        # 키에는 이 섹션의 파라미터만 들어가므로 파라미터를 바꾸면 해당 섹션만 다시 계산된다
+        assert self.result_cache is not None and self.fingerprint is not None
+        key = cache_key(self.fingerprint, section, params)
+        cached = self.result_cache.get(key)
+        if isinstance(cached, tuple):
+            result, derived = cached
+            self.derived.update(derived)
+            self.cache_hits.add(section)
+            return result
+        result = compute()
+        column = self.DERIVED.get(section)
+        derived = {column: self.derived[column]} if column in self.derived else {}
+        self.result_cache.put(key, (result, derived))
+        return result
+
+    def profile(
+        self,
+        sections: list[str] | None = None,
+        method: str = "exact",
+        correlation: str = "pearson",
+        max_workers: int | None = None,
+        on_section: Callable[[SectionRun], None] | None = None,
+    ) -> "DatasetProfile":
+        """Compute ``sections`` concurrently and return JSON-safe summaries plus column metrics."""
+        tasks = self.section_tasks(sections, method=method, correlation=correlation)
+        results: dict[str, dict] = {}
+        errors: dict[str, str] = {}
+        for run in run_sections(tasks, max_workers=max_workers):
+            if run.error is not None:
+                errors[run.name] = f"{type(run.error).__name__}: {run.error}"
+            else:
+                assert isinstance(run.result, dict)
+                results[run.name] = summarize_section(run.name, run.result)
+            self.timings[run.name] = {"compute_s": run.seconds}
+            if on_section is not None:
+                on_section(run)
+        columns = partial(column_metrics, self._lf if self.lazy else self._df)
+        return DatasetProfile(
+            columns=columns() if self.result_cache is None else self._cached("column_metrics", columns, {}),
+            sections={name: results[name] for name in tasks if name in results},
+            errors=errors,
+            timings={name: self.timings[name]["compute_s"] for name in tasks if name in self.timings},
+            cached=sorted(self.cache_hits),
+        )
+
+
+@dataclass
+class DatasetProfile:
+    # 컬럼별 지표 (한 행에 한 컬럼) — Arrow 로 내보내는 부분
+    columns: pl.DataFrame
+    sections: dict[str, dict] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    quality: dict | None = None
+    # 결과 캐시에서 가져온 섹션 이름
+    cached: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "columns": to_plain(self.columns),
+            "sections": self.sections,
+            "errors": self.errors,
+            "timings": self.timings,
+            "quality": self.quality,
+            "cached": self.cached,
+        }
+
+    def to_ipc(self) -> bytes:
+        """The column metrics table as an Arrow IPC stream."""
+        buffer = self.columns.write_ipc_stream(None)
+        return buffer.getvalue()
+
+
+def profile_frame(
+    frame: pl.DataFrame | pl.LazyFrame,
+    lazy: bool = False,
+    sections: list[str] | None = None,
+    rules: list[dict] | None = None,
+    method: str = "exact",
+    correlation: str = "pearson",
+    row_budget: int = DEFAULT_ROW_BUDGET,
+    seed: int = DEFAULT_SEED,
+    on_section: Callable[[SectionRun], None] | None = None,
+    fingerprint: str | None = None,
+    result_cache: ResultCache | None = None,
+) -> DatasetProfile:
+    """EDA sections plus data quality metrics and ``rules`` results for one dataset, without any UI.
+
+    With a ``fingerprint`` (content hash of the source) and a ``result_cache``,
+    sections and quality metrics computed before for the same data and
+    parameters are reused.
+    """
+    engine = EDAEngine(
+        frame, lazy=lazy, row_budget=row_budget, seed=seed, fingerprint=fingerprint, result_cache=result_cache
+    )
+    profile = engine.profile(sections, method=method, correlation=correlation, on_section=on_section)
+    if engine.df is not None:
+        assessment = QualityAssessment(engine.df, fingerprint=fingerprint, result_cache=result_cache)
+        metrics = assessment.assess_data_quality(method=method, rules=rules or ())
+        assert assessment.report is not None
+        profile.quality = {"metrics": to_plain(metrics.row(0, named=True)), **to_plain(assessment.report.to_dict())}
+    elif rules and engine.lf is not None:
+        # lazy 모드: 전체 행을 올려야 하는 지표는 건너뛰고 규칙만 스캔 한 번으로 평가
+        profile.quality = to_plain(RuleSet.from_dicts(rules).evaluate(engine.lf).to_dict())
+    return profile
+
+
+def profile_source(
+    source: DatasetSource, lazy: bool | None = None, result_cache: ResultCache | None = None, **options: Any
+) -> DatasetProfile:
+    """``profile_frame`` for the columns and rows ``source`` selects.
+
+    ``lazy=None`` goes lazy for sources of ``LAZY_THRESHOLD_BYTES`` or more on disk.
+    """
+    frame = source.scan()
+    if lazy is None:
+        lazy = source.size_bytes >= LAZY_THRESHOLD_BYTES
+    fingerprint = source.fingerprint() if result_cache is not None else None
+    return profile_frame(
+        frame if lazy else frame.collect(), lazy=lazy, fingerprint=fingerprint, result_cache=result_cache, **options
+    )
+
+
+def profile_path(
+    path: str,
+    lazy: bool | None = None,
+    result_cache: ResultCache | None = None,
+    columns: list[str] | None = None,
+    filters: list[dict] | None = None,
+    root: str | None = None,
+    **options: Any,
+) -> DatasetProfile:
+    """``profile_source`` for a file, directory or glob, reading only ``columns`` and rows passing ``filters``.
+
+    ``filters`` are rule specs (see ``polaris.quality.rule_from_dict``). With a
+    ``root``, the path must resolve inside it (see ``DatasetSource``).
+    """
+    if root is not None:
+        path = resolve_data_path(path, root)
+    # 단일 파일(업로드 등)은 내용 해시로, 디렉터리/glob 은 파일 크기와 수정 시각으로 식별한다
+    key = file_hash(path) if result_cache is not None and os.path.isfile(path) else None
+    source = DatasetSource(
+        path,
+        columns=tuple(columns) if columns else None,
+        filters=tuple(rule_from_dict(spec) for spec in filters or ()),
+        key=key,
+        root=root,
+    )
+    return profile_source(source, lazy=lazy, result_cache=result_cache, **options)
+
+
+def column_metrics(frame: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
+    """Count, nulls, distinct values, range and moments of every column in one ``select``.
+
+    Distinct counts are exact for a ``DataFrame`` and HyperLogLog estimates
+    for a ``LazyFrame``, which is only used for datasets too large to load.
+    """
+    schema = frame.collect_schema()
+    lazy = isinstance(frame, pl.LazyFrame)
+    exprs = [pl.len().alias("rows")]
+    for i, (name, dtype) in enumerate(schema.items()):
+        col = pl.col(name)
+        exprs.append(col.null_count().alias(f"{i}:nulls"))
+        if dtype.is_nested():
+            continue
+        exprs.append((col.approx_n_unique() if lazy else col.n_unique()).alias(f"{i}:distinct"))
+        exprs.append(col.min().cast(pl.Utf8).alias(f"{i}:min"))
+        exprs.append(col.max().cast(pl.Utf8).alias(f"{i}:max"))
+        if dtype.is_numeric():
+            exprs.append(col.cast(pl.Float64).mean().alias(f"{i}:mean"))
+            exprs.append(col.cast(pl.Float64).std().alias(f"{i}:std"))
+    out = frame.select(exprs)
+    if isinstance(out, pl.LazyFrame):
+        out = out.collect()
+    row = out.row(0, named=True)
+    rows = row.pop("rows")
+    metrics = []
+    for i, (name, dtype) in enumerate(schema.items()):
+        nulls = row[f"{i}:nulls"]
+        metrics.append(
+            {
+                "column": name,
+                "dtype": str(dtype),
+                "count": rows - nulls,
+                "null_count": nulls,
+                "null_rate": nulls / rows if rows else None,
+                "distinct": row.get(f"{i}:distinct"),
+                "min": row.get(f"{i}:min"),
+                "max": row.get(f"{i}:max"),
+                "mean": row.get(f"{i}:mean"),
+                "std": row.get(f"{i}:std"),
+            }
+        )
+    return pl.DataFrame(
+        metrics,
+        schema={
+            "column": pl.Utf8,
+            "dtype": pl.Utf8,
+            "count": pl.Int64,
+            "null_count": pl.Int64,
+            "null_rate": pl.Float64,
+            "distinct": pl.Int64,
+            "min": pl.Utf8,
+            "max": pl.Utf8,
+            "mean": pl.Float64,
+            "std": pl.Float64,
+        },
+    )
+
+
+@overload
+def to_plain(value: dict) -> dict: ...
+@overload
+def to_plain(value: object) -> object: ...
+def to_plain(value: object) -> object:
+    """Convert frames, arrays and scalars into JSON-safe Python values (NaN/inf become ``None``)."""
+    if isinstance(value, pl.Schema):
+        return {name: str(dtype) for name, dtype in value.items()}
+    if isinstance(value, pl.DataFrame):
+        return to_plain(value.to_dicts())
+    if isinstance(value, pd.DataFrame):
+        return to_plain(value.to_dict("records"))
+    if isinstance(value, pl.Series):
+        return to_plain(value.to_list())
+    if isinstance(value, np.ndarray):
+        return to_plain(value.tolist())
+    if isinstance(value, np.generic):
+        return to_plain(value.item())
+    if isinstance(value, dict):
+        return {str(key): to_plain(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [to_plain(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, date | time):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return value
+
+
+def summarize_section(name: str, result: dict) -> dict:
+    """JSON-safe summary of a ``compute_<name>`` result, without per-row arrays."""
+    result = dict(result)
+    if name == "detect_anomalies" and "outlier_data" in result:
+        result["outlier_data"] = result["outlier_data"].head(OUTLIER_SAMPLE_ROWS)
+    elif name == "visualize_numeric_data":
+        result.pop("values", None)
+    elif name == "correlation_matrix" and "corr_matrix" in result:
+        matrix = result.pop("corr_matrix")
+        result["matrix"] = {"columns": list(matrix.columns), "values": matrix.to_numpy()}
+    elif name == "feature_importance" and "importance" in result:
+        columns = result["numeric_cols"]
+        result["target"] = columns[-1]
+        result["importance"] = dict(zip(columns[:-1], result["importance"], strict=True))
+    elif name == "cluster_analysis" and "labels" in result:
+        result["cluster_sizes"] = np.bincount(result.pop("labels")).tolist()
+        del result["points"], result["point_labels"]
+    elif name == "pca_visualization":
+        result.pop("reduced", None)
+    plain = to_plain(result)
+    assert isinstance(plain, dict)
+    return plain
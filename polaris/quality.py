@@ -0,0 +1,420 @@
+"""Declarative data quality rules evaluated in a single pass.
+
+Each rule turns into a per-row boolean expression (null where the rule does
+not apply, e.g. a range check on a missing value). ``RuleSet.evaluate``
+aggregates every rule's pass/check counts and a few failing-row samples in
+one ``select``, so adding rules does not add scans over the data.
+``QualityAssessment`` builds the standard quality metrics on the same pass.
+"""
+
+import operator
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import polars as pl
+
+from polaris.cache import ResultCache, cache_key
+from polaris.sketches import DuplicateEstimator, HyperLogLog, check_method
+
+DEFAULT_SAMPLE_SIZE = 5
+ROW_INDEX = "__row__"
+COMPARE_OPS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+@dataclass(frozen=True)
+class Rule(ABC):
+    column: str
+    name: str | None = field(default=None, kw_only=True)
+
+    kind = "rule"
+
+    @property
+    def label(self) -> str:
+        return self.name or f"{self.kind}:{self.column}"
+
+    @property
+    def columns(self) -> list[str]:
+        return [self.column]
+
+    @abstractmethod
+    def check(self, schema: pl.Schema) -> pl.Expr:
+        """The rule's comparison on non-missing values."""
+
+    def expression(self, schema: pl.Schema) -> pl.Expr:
+        """True/False per row, null where the checked value is missing."""
+        return pl.when(pl.col(self.column).is_null()).then(None).otherwise(self.check(schema))
+
+    def predicate(self, schema: pl.Schema) -> pl.Expr:
+        """The rule as a row filter: a plain comparison that scans can push down (missing values drop out)."""
+        return self.check(schema)
+
+
+@dataclass(frozen=True)
+class RangeRule(Rule):
+    min: float | None = None
+    max: float | None = None
+
+    kind = "range"
+
+    def check(self, schema: pl.Schema) -> pl.Expr:
+        col = pl.col(self.column)
+        expr = pl.lit(True)
+        if self.min is not None:
+            expr = expr & (col >= self.min)
+        if self.max is not None:
+            expr = expr & (col <= self.max)
+        return expr
+
+
+@dataclass(frozen=True)
+class RegexRule(Rule):
+    pattern: str = ""
+    full_match: bool = True
+
+    kind = "regex"
+
+    def check(self, schema: pl.Schema) -> pl.Expr:
+        pattern = f"^(?:{self.pattern})$" if self.full_match else self.pattern
+        return pl.col(self.column).cast(pl.Utf8).str.contains(pattern)
+
+
+@dataclass(frozen=True)
+class AllowedValuesRule(Rule):
+    values: tuple = ()
+
+    kind = "allowed"
+
+    def check(self, schema: pl.Schema) -> pl.Expr:
+        return pl.col(self.column).is_in(list(self.values))
+
+
+@dataclass(frozen=True)
+class NotNullRule(Rule):
+    kind = "not_null"
+
+    def check(self, schema: pl.Schema) -> pl.Expr:
+        return pl.col(self.column).is_not_null()
+
+    def expression(self, schema: pl.Schema) -> pl.Expr:
+        # 빠진 값 자체가 검사 대상이므로 null 을 건너뛰지 않는다
+        return self.check(schema)
+
+
+@dataclass(frozen=True)
+class FreshnessRule(Rule):
+    max_age_days: float = 7
+    now: datetime | None = None
+
+    kind = "freshness"
+
+    def check(self, schema: pl.Schema) -> pl.Expr:
+        cutoff = (self.now or datetime.now()) - timedelta(days=self.max_age_days)
+        dtype = schema[self.column]
+        if dtype == pl.Date:
+            return pl.col(self.column) > cutoff.date()
+        if isinstance(dtype, pl.Datetime) and dtype.time_zone is not None:
+            return pl.col(self.column).dt.replace_time_zone(None) > cutoff
+        if dtype == pl.Utf8:
+            # CSV 는 날짜를 문자열로 읽으므로 파싱할 수 없는 값은 null (검사 대상 아님) 로 둔다
+            return pl.col(self.column).str.to_datetime(strict=False) > cutoff
+        return pl.col(self.column).cast(pl.Datetime) > cutoff
+
+
+@dataclass(frozen=True)
+class CompareRule(Rule):
+    """Cross-column check ``column <op> other`` (or ``column <op> value``)."""
+
+    op: str = "<="
+    other: str | None = None
+    value: object = None
+
+    kind = "compare"
+
+    def __post_init__(self) -> None:
+        if self.op not in COMPARE_OPS:
+            raise ValueError(f"op must be one of {list(COMPARE_OPS)}, got {self.op!r}")
+
+    @property
+    def label(self) -> str:
+        right = self.other if self.other is not None else repr(self.value)
+        return self.name or f"{self.column} {self.op} {right}"
+
+    @property
+    def columns(self) -> list[str]:
+        return [self.column] + ([self.other] if self.other is not None else [])
+
+    def check(self, schema: pl.Schema) -> pl.Expr:
+        right = pl.col(self.other) if self.other is not None else self._value(schema)
+        return COMPARE_OPS[self.op](pl.col(self.column), right)
+
+    def expression(self, schema: pl.Schema) -> pl.Expr:
+        # 비교식은 어느 한쪽이 null 이면 null 이 되어 검사 대상에서 빠진다
+        return self.check(schema)
+
+    def _value(self, schema: pl.Schema) -> pl.Expr:
+        # JSON 규칙은 날짜를 문자열로 보내므로 날짜/일시 컬럼과 비교할 때는 같은 타입의 값으로 읽는다
+        dtype = schema.get(self.column)
+        if isinstance(self.value, str) and dtype == pl.Date:
+            return pl.lit(date.fromisoformat(self.value))
+        if isinstance(self.value, str) and isinstance(dtype, pl.Datetime):
+            return pl.lit(datetime.fromisoformat(self.value)).cast(dtype)
+        return pl.lit(self.value)
+
+
+RULE_TYPES: dict[str, type[Rule]] = {
+    rule.kind: rule for rule in (RangeRule, RegexRule, AllowedValuesRule, NotNullRule, FreshnessRule, CompareRule)
+}
+
+
+def rule_from_dict(spec: dict) -> Rule:
+    """Build a rule from its declarative form, e.g. ``{"type": "range", "column": "age", "min": 0}``."""
+    spec = {key: value for key, value in spec.items() if value is not None}
+    kind = spec.pop("type", None)
+    if kind not in RULE_TYPES:
+        raise ValueError(f"unknown rule type {kind!r}; expected one of {list(RULE_TYPES)}")
+    if "values" in spec:
+        spec["values"] = tuple(spec["values"])
+    if isinstance(spec.get("now"), str):
+        spec["now"] = datetime.fromisoformat(spec["now"])
+    return RULE_TYPES[kind](**spec)
+
+
+@dataclass
+class RuleResult:
+    name: str
+    kind: str
+    columns: list[str]
+    checked: int
+    failed: int
+    samples: pl.DataFrame
+
+    @property
+    def pass_rate(self) -> float | None:
+        return (self.checked - self.failed) / self.checked if self.checked else None
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "columns": self.columns,
+            "checked": self.checked,
+            "failed": self.failed,
+            "pass_rate": self.pass_rate,
+            "samples": self.samples.to_dicts(),
+        }
+
+
+@dataclass
+class QualityReport:
+    rows: int
+    results: list[RuleResult]
+    metrics: dict = field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> RuleResult:
+        return next(result for result in self.results if result.name == name)
+
+    def to_frame(self) -> pl.DataFrame:
+        return pl.DataFrame(
+            [{key: value for key, value in result.to_dict().items() if key != "samples"} for result in self.results],
+            schema={
+                "name": pl.Utf8,
+                "kind": pl.Utf8,
+                "columns": pl.List(pl.Utf8),
+                "checked": pl.Int64,
+                "failed": pl.Int64,
+                "pass_rate": pl.Float64,
+            },
+        )
+
+    def to_dict(self) -> dict:
+        return {"rows": self.rows, "results": [result.to_dict() for result in self.results]}
+
+
+class RuleSet:
+    """Rules compiled into one aggregation: check/fail counts plus failing-row samples."""
+
+    def __init__(self, rules: list[Rule], sample_size: int = DEFAULT_SAMPLE_SIZE):
+        labels = [rule.label for rule in rules]
+        duplicated = {label for label in labels if labels.count(label) > 1}
+        if duplicated:
+            raise ValueError(f"rule names must be unique: {sorted(duplicated)}")
+        self.rules = rules
+        self.sample_size = sample_size
+
+    @classmethod
+    def from_dicts(cls, specs: list[dict], sample_size: int = DEFAULT_SAMPLE_SIZE) -> "RuleSet":
+        return cls([rule_from_dict(spec) for spec in specs], sample_size)
+
+    def expressions(self, schema: pl.Schema) -> list[pl.Expr]:
+        missing = sorted({col for rule in self.rules for col in rule.columns} - set(schema))
+        if missing:
+            raise ValueError(f"rules reference unknown columns: {missing}")
+        exprs = [pl.len().alias("rows")]
+        for i, rule in enumerate(self.rules):
+            passed = rule.expression(schema)
+            exprs.append(passed.count().alias(f"{i}:checked"))
+            exprs.append(passed.not_().sum().alias(f"{i}:failed"))
+            if self.sample_size:
+                sample = pl.struct(pl.int_range(pl.len()).alias(ROW_INDEX), *rule.columns)
+                exprs.append(sample.filter(passed.not_()).head(self.sample_size).implode().alias(f"{i}:samples"))
+        return exprs
+
+    def evaluate(self, frame: pl.DataFrame | pl.LazyFrame, metrics: dict[str, pl.Expr] | None = None) -> QualityReport:
+        """Evaluate every rule (and any extra ``metrics`` aggregates) in a single ``select``."""
+        schema = frame.collect_schema()
+        metrics = metrics or {}
+        out = frame.select(*self.expressions(schema), *(expr.alias(f"metric:{name}") for name, expr in metrics.items()))
+        if isinstance(out, pl.LazyFrame):
+            out = out.collect()
+        results = []
+        for i, rule in enumerate(self.rules):
+            results.append(
+                RuleResult(
+                    name=rule.label,
+                    kind=rule.kind,
+                    columns=rule.columns,
+                    checked=out[f"{i}:checked"].item(),
+                    failed=out[f"{i}:failed"].item() or 0,
+                    samples=self._samples(out, f"{i}:samples"),
+                )
+            )
+        return QualityReport(
+            rows=out["rows"].item(),
+            results=results,
+            metrics={name: out[f"metric:{name}"].item() for name in metrics},
+        )
+
+    @staticmethod
+    def _samples(out: pl.DataFrame, name: str) -> pl.DataFrame:
+        if name not in out.columns:
+            return pl.DataFrame()
+        return out.select(pl.col(name).explode()).unnest(name).drop_nulls(ROW_INDEX)
+
+
+def rule_to_dict(rule: Rule) -> dict:
+    spec = {"type": rule.kind, **asdict(rule)}
+    if isinstance(rule, FreshnessRule) and rule.now is not None:
+        spec["now"] = rule.now.isoformat()
+    return {key: value for key, value in spec.items() if value is not None}
+
+
+class QualityAssessment:
+    """Completeness, accuracy, timeliness, consistency and uniqueness metrics of one frame."""
+
+    def __init__(self, df: pl.DataFrame, fingerprint: str | None = None, result_cache: ResultCache | None = None):
+        self.df = df
+        # fingerprint(원본 파일의 내용 해시)가 있으면 같은 데이터/파라미터의 평가 결과를 재사용
+        self.fingerprint = fingerprint
+        self.result_cache = result_cache if fingerprint else None
+        # method="sketch" 로 계산한 스케치 (직렬화 후 다른 청크의 결과와 병합 가능)
+        self.sketches: dict[str, HyperLogLog | DuplicateEstimator] = {}
+        # 마지막 assess_data_quality 의 규칙별 결과 (실패 행 샘플 포함)
+        self.report: QualityReport | None = None
+
+    def calculate_completeness(self) -> pl.DataFrame:
+        return self.df.null_count() / len(self.df)
+
+    def calculate_accuracy(self, column: str, valid_range: tuple) -> float:
+        rule = RangeRule(column, valid_range[0], valid_range[1])
+        pass_rate = RuleSet([rule], sample_size=0).evaluate(self.df)[rule.label].pass_rate
+        return np.nan if pass_rate is None else pass_rate
+
+    def calculate_timeliness(self, column: str, days_threshold: int = 7) -> float:
+        if self.df[column].dtype not in (pl.Datetime, pl.Date):
+            return np.nan
+        rule = FreshnessRule(column, max_age_days=days_threshold)
+        pass_rate = RuleSet([rule], sample_size=0).evaluate(self.df)[rule.label].pass_rate
+        return np.nan if pass_rate is None else pass_rate
+
+    def calculate_consistency(self, subset: list, method: str = "exact") -> float:
+        check_method(method)
+        if method == "sketch":
+            estimator = DuplicateEstimator()
+            estimator.update(self.df, subset)
+            self.sketches["__rows__"] = estimator
+            return estimator.distinct_rows() / self.df.height
+        return self.df.unique(subset=subset).height / self.df.height
+
+    def calculate_uniqueness(self, column: str, method: str = "exact") -> float:
+        check_method(method)
+        if method == "sketch":
+            sketch = HyperLogLog()
+            sketch.update(self.df[column])
+            self.sketches[column] = sketch
+            # n_unique() 와 마찬가지로 null 도 하나의 값으로 센다
+            distinct = min(round(sketch.estimate()), len(self.df)) + (self.df[column].null_count() > 0)
+            return distinct / len(self.df)
+        return self.df[column].n_unique() / len(self.df)
+
+    def assess_data_quality(
+        self,
+        accuracy_params: dict | None = None,
+        timeliness_column: str | None = None,
+        method: str = "exact",
+        rules: Iterable[Rule | dict] = (),
+    ) -> pl.DataFrame:
+        check_method(method)
+        if self.result_cache is not None and self.fingerprint is not None:
+            rules = list(rules)
+            params = {
+                "schema": {name: str(dtype) for name, dtype in self.df.schema.items()},
+                "accuracy_params": accuracy_params,
+                "timeliness_column": timeliness_column,
+                "method": method,
+                "rules": rules,
+            }
+            key = cache_key(self.fingerprint, "data_quality", params)
+            cached = self.result_cache.get(key)
+            if isinstance(cached, tuple):
+                metrics, self.report, self.sketches = cached
+            else:
+                metrics = self._assess(accuracy_params, timeliness_column, method, rules)
+                self.result_cache.put(key, (metrics, self.report, self.sketches))
+            return metrics
+        return self._assess(accuracy_params, timeliness_column, method, rules)
+
+    def _assess(
+        self, accuracy_params: dict | None, timeliness_column: str | None, method: str, rules: Iterable[Rule | dict]
+    ) -> pl.DataFrame:
+        accuracy_params = accuracy_params or {}
+        columns = self.df.columns
+        checks = [rule_from_dict(rule) if isinstance(rule, dict) else rule for rule in rules]
+        for column, valid_range in accuracy_params.items():
+            checks.append(RangeRule(column, valid_range[0], valid_range[1], name=f"Accuracy_{column}"))
+        timely = timeliness_column in columns and self.df.schema[timeliness_column] in (pl.Datetime, pl.Date)
+        if timely and timeliness_column is not None:
+            checks.append(FreshnessRule(timeliness_column, name="Timeliness"))
+
+        # 규칙 검사와 완전성/일관성/고유성 지표를 하나의 select 로 한 번에 계산
+        metrics = {"Completeness": pl.struct((pl.col(col).null_count() / pl.len()).alias(col) for col in columns)}
+        if method == "exact":
+            metrics["Consistency"] = pl.struct(columns).n_unique() / pl.len()
+            metrics.update({f"Uniqueness_{col}": pl.col(col).n_unique() / pl.len() for col in columns})
+        self.report = RuleSet(checks).evaluate(self.df, metrics)
+
+        quality_metrics = {"Completeness": self.report.metrics["Completeness"]}
+        for column in accuracy_params:
+            quality_metrics[f"Accuracy_{column}"] = self.report[f"Accuracy_{column}"].pass_rate
+        timeliness = self.report["Timeliness"].pass_rate if timely else None
+        quality_metrics["Timeliness"] = np.nan if timeliness is None else timeliness
+
+        if method == "sketch":
+            quality_metrics["Consistency"] = self.calculate_consistency(columns, method=method)
+            for column in columns:
+                quality_metrics[f"Uniqueness_{column}"] = self.calculate_uniqueness(column, method=method)
+        else:
+            quality_metrics["Consistency"] = self.report.metrics["Consistency"]
+            for column in columns:
+                quality_metrics[f"Uniqueness_{column}"] = self.report.metrics[f"Uniqueness_{column}"]
+
+        return pl.DataFrame({name: [value] for name, value in quality_metrics.items()})
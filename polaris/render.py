@@ -0,0 +1,98 @@
+"""Figure rendering helpers: right-sized PNGs, an image cache and bin-based charts.
+
+Figures are built with ``matplotlib.figure.Figure`` instead of ``pyplot`` so
+they hold no global state and can be drawn from worker threads.
+"""
+
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import numpy as np
+import plotly.graph_objs as go
+import polars as pl
+
+from polaris.instrument import phase
+
+if TYPE_CHECKING:
+    # matplotlib 은 import 에 0.5초 이상 걸려 실제로 그림을 만들 때만 불러온다
+    from matplotlib.figure import Figure
+
+DEFAULT_WIDTH_PX = 800
+# 고해상도 화면에서도 선명하도록 표시 폭의 2배 픽셀로 래스터화
+PIXEL_RATIO = 2
+
+
+def figure_to_png(fig: "Figure", width_px: int = DEFAULT_WIDTH_PX, pixel_ratio: int = PIXEL_RATIO) -> bytes:
+    """Rasterize ``fig`` at the DPI that makes it ``width_px * pixel_ratio`` pixels wide."""
+    dpi = width_px * pixel_ratio / fig.get_figwidth()
+    buf = BytesIO()
+    with phase("rasterize", width_px=width_px):
+        fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+    return buf.getvalue()
+
+
+class ImageCache:
+    """LRU of rendered PNG bytes bounded by total size."""
+
+    def __init__(self, max_bytes: int = 256 * 1024**2):
+        self.max_bytes = max_bytes
+        self._images: OrderedDict[str, bytes] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def put(self, key: str, image: bytes) -> None:
+        with self._lock:
+            if key in self._images:
+                return
+            self._images[key] = image
+            self._total += len(image)
+            while self._total > self.max_bytes and len(self._images) > 1:
+                _, evicted = self._images.popitem(last=False)
+                self._total -= len(evicted)
+
+
+def histogram_bins(df: pl.DataFrame, columns: list[str], bin_count: int = 20) -> dict[str, pl.DataFrame]:
+    """Histogram bins (right-edge ``breakpoint`` and ``count``) for every column in one pass."""
+    if not columns:
+        return {}
+    hist = df.select(pl.col(col).hist(bin_count=bin_count, include_breakpoint=True) for col in columns)
+    return {col: hist.select(pl.col(col)).unnest(col) for col in columns}
+
+
+def _bin_geometry(bins: pl.DataFrame) -> tuple[np.ndarray, np.ndarray, float]:
+    edges = bins["breakpoint"].to_numpy()
+    width = float(edges[1] - edges[0]) if len(edges) > 1 else 1.0
+    return edges - width, bins["count"].to_numpy(), width
+
+
+def histogram_chart(bins: pl.DataFrame, title: str | None = None, height: int = 260) -> go.Figure:
+    left, counts, width = _bin_geometry(bins)
+    fig = go.Figure(go.Bar(x=left + width / 2, y=counts, width=width, marker_line_width=0))
+    fig.update_layout(title=title, height=height, margin=dict(l=10, r=10, t=30 if title else 10, b=10), bargap=0)
+    return fig
+
+
+def small_multiples(bins: dict[str, pl.DataFrame], cols_per_row: int = 4, panel_size: tuple = (3, 2)) -> "Figure":
+    """One figure with a histogram panel per column, instead of one figure per column."""
+    from matplotlib.figure import Figure
+
+    rows = max(1, -(-len(bins) // cols_per_row))
+    fig = Figure(figsize=(panel_size[0] * cols_per_row, panel_size[1] * rows), layout="constrained")
+    axes = fig.subplots(rows, cols_per_row, squeeze=False)
+    for ax, (col, col_bins) in zip(axes.flat, bins.items(), strict=False):
+        left, counts, width = _bin_geometry(col_bins)
+        ax.bar(left, counts, width=width, align="edge")
+        ax.set_title(col, fontsize=9)
+        ax.tick_params(labelsize=7)
+    for ax in axes.flat[len(bins) :]:
+        ax.set_visible(False)
+    return fig
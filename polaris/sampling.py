@@ -0,0 +1,87 @@
+"""Seeded row sampling so model fits stay within a fixed row budget."""
+
+from collections.abc import Callable, Iterable, Iterator
+
+import numpy as np
+import polars as pl
+
+DEFAULT_ROW_BUDGET = 200_000
+DEFAULT_SEED = 42
+SCORE_BATCH_SIZE = 100_000
+
+
+def sample_indices(n_rows: int, budget: int, seed: int = DEFAULT_SEED) -> np.ndarray | None:
+    """Sorted uniform sample of row positions, or ``None`` when every row fits the budget."""
+    if n_rows <= budget:
+        return None
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(n_rows, size=budget, replace=False))
+
+
+def stratified_indices(strata: np.ndarray, budget: int, seed: int = DEFAULT_SEED) -> np.ndarray | None:
+    """Sample positions with each stratum represented in proportion to its size."""
+    if len(strata) <= budget:
+        return None
+    rng = np.random.default_rng(seed)
+    labels, inverse, sizes = np.unique(strata, return_inverse=True, return_counts=True)
+    quotas = np.maximum(np.floor(sizes * budget / len(strata)).astype(np.int64), 1)
+    picked = []
+    for label in range(len(labels)):
+        members = np.flatnonzero(inverse == label)
+        picked.append(rng.choice(members, size=min(quotas[label], len(members)), replace=False))
+    return np.sort(np.concatenate(picked))
+
+
+def quantile_strata(values: np.ndarray, bins: int = 10) -> np.ndarray:
+    """Bucket a numeric target into quantile bins so regression samples keep its distribution."""
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return np.zeros(len(values), dtype=np.int64)
+    edges = np.unique(np.quantile(finite, np.linspace(0, 1, bins + 1)[1:-1]))
+    strata = np.searchsorted(edges, values)
+    strata[~np.isfinite(values)] = -1
+    return strata
+
+
+def iter_frame_batches(lf: pl.LazyFrame, batch_size: int = SCORE_BATCH_SIZE) -> Iterator[pl.DataFrame]:
+    if hasattr(lf, "collect_batches"):
+        yield from lf.collect_batches(chunk_size=batch_size)
+    else:
+        yield from lf.collect().iter_slices(batch_size)
+
+
+def reservoir_sample(
+    batches: Iterable[pl.DataFrame], budget: int, seed: int = DEFAULT_SEED
+) -> tuple[pl.DataFrame, int]:
+    """Uniform sample of ``budget`` rows from a stream of batches (Algorithm R), plus the rows seen."""
+    rng = np.random.default_rng(seed)
+    reservoir: pl.DataFrame | None = None
+    seen = 0
+    for batch in batches:
+        if reservoir is None or reservoir.height < budget:
+            take = budget - (0 if reservoir is None else reservoir.height)
+            head, batch = batch.head(take), batch.slice(take)
+            reservoir = head if reservoir is None else pl.concat([reservoir, head])
+            seen += head.height
+        if batch.height == 0:
+            continue
+        # t 번째 행은 budget / t 확률로 임의의 칸을 대체한다
+        positions = seen + 1 + np.arange(batch.height)
+        slots = (rng.random(batch.height) * positions).astype(np.int64)
+        accepted = np.flatnonzero(slots < budget)
+        seen += batch.height
+        if len(accepted) == 0:
+            continue
+        # 같은 칸을 여러 번 대체하면 마지막 행만 남긴다. 칸의 순서는 의미가 없으므로
+        # 대체된 칸을 빼고 새 행을 뒤에 붙여도 균등 표본이 유지된다
+        last_slots, last_rows = np.unique(slots[accepted][::-1], return_index=True)
+        replaced = np.zeros(budget, dtype=bool)
+        replaced[last_slots] = True
+        reservoir = pl.concat([reservoir.filter(pl.Series(~replaced)), batch[accepted[::-1][last_rows]]])
+    return (reservoir if reservoir is not None else pl.DataFrame()), seen
+
+
+def score_in_batches(predict: Callable[[np.ndarray], np.ndarray], batches: Iterable[np.ndarray]) -> np.ndarray:
+    """Apply ``predict`` batch by batch so scoring never materializes a full temporary matrix."""
+    scores = [predict(batch) for batch in batches]
+    return np.concatenate(scores) if scores else np.array([])
@@ -0,0 +1,46 @@
+"""Concurrent execution of independent report sections.
+
+Section compute steps only touch Polars/NumPy/scikit-learn, which release the
+GIL for their heavy work, so a thread pool overlaps them without copying the
+dataset into worker processes. Rendering stays on the caller's thread.
+"""
+
+import contextvars
+import os
+import time
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+
+@dataclass
+class SectionRun:
+    name: str
+    result: object = None
+    error: BaseException | None = None
+    seconds: float = 0.0
+
+
+def _timed(name: str, compute: Callable[[], object]) -> SectionRun:
+    start = time.perf_counter()
+    try:
+        return SectionRun(name, result=compute(), seconds=time.perf_counter() - start)
+    except Exception as error:  # 한 섹션의 실패가 리포트 전체를 멈추지 않도록 결과로 전달
+        return SectionRun(name, error=error, seconds=time.perf_counter() - start)
+
+
+def run_sections(tasks: Mapping[str, Callable[[], object]], max_workers: int | None = None) -> Iterator[SectionRun]:
+    """Run every task concurrently and yield each ``SectionRun`` as soon as it finishes."""
+    if max_workers is None:
+        max_workers = min(len(tasks), os.cpu_count() or 1) or 1
+    if max_workers == 1:
+        for name, compute in tasks.items():
+            yield _timed(name, compute)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="polaris-section") as pool:
+        # 호출한 스레드의 컨텍스트(활성 계측 스팬 등)를 각 작업 스레드로 넘긴다
+        futures = [
+            pool.submit(contextvars.copy_context().run, _timed, name, compute) for name, compute in tasks.items()
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,262 @@
+"""Dataset sources: CSV, Parquet, Arrow IPC/Feather and NDJSON files, globs and hive-partitioned directories.
+
+A ``DatasetSource`` names where a dataset lives and which part of it a report
+covers. ``scan()`` returns a lazy ``pl.scan_*`` frame with the selected
+``columns`` and row ``filters`` applied. Readers therefore decode only those
+columns. They also skip the ``key=value`` partition directories, Parquet row
+groups and IPC record batches that the filters rule out. Filters use the
+declarative data quality rule specs. For example,
+``{"type": "freshness", "column": "day", "max_age_days": 7}`` keeps the
+last seven days.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from urllib.parse import unquote
+
+import polars as pl
+
+from polaris.ingest import FORMATS, SUFFIX_FORMATS, detect_format, scan_files
+from polaris.quality import FreshnessRule, Rule, rule_from_dict, rule_to_dict
+
+# 경로의 key=value 파티션을 Polars 가 직접 해석하는 포맷 (나머지는 파일별로 읽어 파티션 컬럼을 붙인다)
+NATIVE_HIVE_FORMATS = ("parquet", "ipc")
+# API, 작업, 파이프라인이 요청으로 받은 경로를 읽을 수 있는 디렉터리 (그 밖은 PermissionError)
+DATA_ROOT = os.environ.get("POLARIS_DATA_ROOT", os.path.join(os.path.expanduser("~"), ".polaris", "data"))
+OUTSIDE_ROOT_MESSAGE = "path is outside the data root"
+
+
+def static_prefix(path: str) -> str:
+    """The part of ``path`` before its first wildcard segment (the path itself when it has none)."""
+    if not glob.has_magic(path):
+        return path
+    static = []
+    for segment in path.split(os.sep):
+        if glob.has_magic(segment):
+            break
+        static.append(segment)
+    return os.sep.join(static) or os.curdir
+
+
+def inside_root(path: str, root: str) -> bool:
+    # 심볼릭 링크까지 따라간 실제 위치로 비교한다
+    real_root = os.path.realpath(root)
+    return os.path.commonpath([os.path.realpath(path), real_root]) == real_root
+
+
+def resolve_data_path(path: str, root: str) -> str:
+    """``path`` (relative to ``root``, or absolute inside it) as a normalized absolute path.
+
+    Raises ``PermissionError`` when it could reach outside ``root``: a ``..``
+    segment, or a location that resolves (following symlinks) elsewhere. The
+    message never repeats the path.
+    """
+    if ".." in path.replace(os.sep, "/").split("/"):
+        raise PermissionError(OUTSIDE_ROOT_MESSAGE)
+    resolved = os.path.normpath(os.path.join(os.path.abspath(root), path))
+    if not inside_root(static_prefix(resolved), root):
+        raise PermissionError(OUTSIDE_ROOT_MESSAGE)
+    return resolved
+
+
+def partition_values(path: str) -> dict[str, str]:
+    """``key=value`` directory segments of ``path`` (hive-style partitioning)."""
+    segments = os.path.normpath(os.path.dirname(path)).split(os.sep)
+    return dict(unquote(segment).split("=", 1) for segment in segments if "=" in segment)
+
+
+def _typed(values: pl.Series) -> pl.Series:
+    # Polars 의 hive 파티션 해석처럼 정수 -> 실수 -> 날짜 -> 일시 -> 문자열 순으로 타입을 고른다
+    for convert in (
+        lambda s: s.cast(pl.Int64),
+        lambda s: s.cast(pl.Float64),
+        lambda s: s.str.to_date(),
+        lambda s: s.str.to_datetime(),
+    ):
+        try:
+            return convert(values)
+        except pl.exceptions.PolarsError:
+            continue
+    return values
+
+
+@dataclass(frozen=True)
+class DatasetSource:
+    """A file, directory or glob plus the ``columns`` and row ``filters`` a report reads from it.
+
+    ``key`` identifies the data (e.g. the content hash of an upload). Without
+    it, the fingerprint is built from the real path, size and modification
+    time of every file, so a partitioned dataset is never read just to be
+    identified. With a ``root``, ``path`` is resolved against it and every matched file must lie
+    inside it (``PermissionError`` otherwise).
+    """
+
+    path: str
+    format: str | None = None
+    columns: tuple[str, ...] | None = None
+    filters: tuple[Rule, ...] = ()
+    key: str | None = None
+    root: str | None = field(default=None, repr=False, compare=False)
+    _files: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.format is not None and self.format not in FORMATS:
+            raise ValueError(f"format must be one of {list(FORMATS)}, got {self.format!r}")
+        # 끝이나 중간의 구분자가 겹쳐도 같은 경로로 보도록 정규화한다 (파티션 기준 경로와 식별자가 여기서 정해진다)
+        path = resolve_data_path(self.path, self.root) if self.root is not None else os.path.normpath(self.path)
+        object.__setattr__(self, "path", path)
+        files = self._list_files()
+        object.__setattr__(self, "_files", tuple(files))
+        object.__setattr__(self, "format", self.format or detect_format(files[0]))
+        if self.columns is not None:
+            object.__setattr__(self, "columns", tuple(self.columns))
+        # "최근 N일" 같은 상대 기간은 현재 시각(시 단위)에 고정해 재실행과 섹션 간에 같은 행을 보고 캐시도 공유한다
+        anchor = datetime.now().replace(minute=0, second=0, microsecond=0)
+        filters = tuple(
+            replace(rule, now=anchor) if isinstance(rule, FreshnessRule) and rule.now is None else rule
+            for rule in self.filters
+        )
+        object.__setattr__(self, "filters", filters)
+
+    @classmethod
+    def from_dict(cls, spec: dict, root: str | None = None) -> "DatasetSource":
+        """Build a source from ``{"path": ..., "format": ..., "columns": [...], "filters": [rule specs]}``."""
+        return cls(
+            spec["path"],
+            format=spec.get("format"),
+            columns=tuple(spec["columns"]) if spec.get("columns") else None,
+            filters=tuple(rule_from_dict(rule) for rule in spec.get("filters") or ()),
+            key=spec.get("key"),
+            root=root,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "format": self.format,
+            "columns": list(self.columns) if self.columns is not None else None,
+            "filters": [rule_to_dict(rule) for rule in self.filters],
+        }
+
+    def _list_files(self) -> list[str]:
+        if glob.has_magic(self.path):
+            files = sorted(path for path in glob.glob(self.path, recursive=True) if os.path.isfile(path))
+        elif os.path.isdir(self.path):
+            files = []
+            for root, dirs, names in os.walk(self.path):
+                # _SUCCESS, .crc 같은 숨김/메타 파일과 디렉터리는 건너뛴다
+                dirs[:] = sorted(name for name in dirs if not name.startswith(("_", ".")))
+                files.extend(
+                    os.path.join(root, name)
+                    for name in sorted(names)
+                    if not name.startswith(("_", ".")) and os.path.splitext(name)[1].lower() in SUFFIX_FORMATS
+                )
+            if self.format is not None:
+                files = [path for path in files if SUFFIX_FORMATS[os.path.splitext(path)[1].lower()] == self.format]
+        elif os.path.isfile(self.path):
+            files = [self.path]
+        else:
+            files = []
+        if not files:
+            raise FileNotFoundError(self.path)
+        if self.root is not None and not all(inside_root(path, self.root) for path in files):
+            # glob 이나 디렉터리 안의 심볼릭 링크가 루트 밖을 가리키는 경우
+            raise PermissionError(OUTSIDE_ROOT_MESSAGE)
+        return files
+
+    def files(self) -> list[str]:
+        """Every data file of the source (before partition pruning)."""
+        return list(self._files)
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(os.path.getsize(path) for path in self._files)
+
+    @property
+    def scoped(self) -> bool:
+        """Whether the source reads only part of the data (a column selection or row filters)."""
+        return self.columns is not None or bool(self.filters)
+
+    def partitions(self) -> pl.DataFrame:
+        """One row per file: its path and typed ``key=value`` partition values."""
+        values = [partition_values(os.path.relpath(path, self._root())) for path in self._files]
+        keys = list(dict.fromkeys(key for row in values for key in row))
+        frame = pl.DataFrame({"path": list(self._files)})
+        return frame.with_columns(
+            _typed(pl.Series(key, [row.get(key) for row in values], dtype=pl.Utf8)) for key in keys
+        )
+
+    def _root(self) -> str:
+        # glob 은 와일드카드 앞까지의 고정 경로, 디렉터리는 그 자체가 파티션 경로의 기준
+        if glob.has_magic(self.path):
+            return static_prefix(self.path)
+        return self.path if os.path.isdir(self.path) else os.path.dirname(self.path)
+
+    def pruned_partitions(self) -> pl.DataFrame:
+        """``partitions()`` without the files that filters on partition columns rule out."""
+        partitions = self.partitions()
+        keys = set(partitions.columns) - {"path"}
+        for rule in self.filters:
+            if rule.columns and set(rule.columns) <= keys:
+                partitions = partitions.filter(rule.predicate(partitions.schema).fill_null(False))
+        if partitions.is_empty():
+            # 모든 파일이 걸러져도 스키마는 필요하므로 첫 파일을 읽고 필터가 행을 모두 제거하게 둔다
+            return self.partitions().head(1)
+        return partitions
+
+    def scan(self) -> pl.LazyFrame:
+        """Lazy frame of the selected columns and rows; nothing is read until it is collected."""
+        assert self.format is not None  # __post_init__ 가 파일 확장자로 정해 둔다
+        partitions = self.pruned_partitions()
+        keys = [column for column in partitions.columns if column != "path"]
+        if not keys or self.format in NATIVE_HIVE_FORMATS:
+            lf = scan_files(partitions["path"].to_list(), self.format, hive=bool(keys))
+        else:
+            # CSV/NDJSON 은 파티션 디렉터리별로 읽어 경로의 값을 상수 컬럼으로 붙인다
+            frames = []
+            for values, group in partitions.group_by(keys, maintain_order=True):
+                constants = zip(keys, values, strict=True)
+                frames.append(
+                    scan_files(group["path"].to_list(), self.format).with_columns(
+                        pl.lit(value, dtype=partitions.schema[key]).alias(key) for key, value in constants
+                    )
+                )
+            lf = pl.concat(frames, how="diagonal_relaxed")
+        schema = lf.collect_schema()
+        referenced = {col for rule in self.filters for col in rule.columns} | set(self.columns or ())
+        missing = sorted(referenced - set(schema))
+        if missing:
+            raise ValueError(f"source references unknown columns: {missing}")
+        if self.filters:
+            lf = lf.filter(*(rule.predicate(schema) for rule in self.filters))
+        if self.columns is not None:
+            lf = lf.select(self.columns)
+        return lf
+
+    def fingerprint(self) -> str:
+        """Identity of the data this source reads: ``key`` (or file paths, sizes, mtimes) with columns and filters."""
+        if self.key is not None and not self.scoped:
+            return self.key
+        # key 가 데이터를 식별하면 파일을 다시 보지 않는다 (범위만 더한다).
+        # 이름·크기·수정 시각이 같은 다른 디렉터리의 파일과 구분되도록 실제 절대 경로를 넣는다
+        files: list[tuple[str, int, int]] = []
+        if self.key is None:
+            for path in self._files:
+                stat = os.stat(path)
+                files.append((os.path.realpath(path), stat.st_size, stat.st_mtime_ns))
+        payload = json.dumps(
+            {
+                "key": self.key,
+                "format": self.format,
+                "files": files,
+                "columns": self.columns,
+                "filters": [rule_to_dict(rule) for rule in self.filters],
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
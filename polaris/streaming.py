@@ -0,0 +1,418 @@
+"""Bounded-memory profiling of CSV files read in record batches.
+
+Each column keeps a mergeable accumulator (counts, min/max, Welford moments,
+a fixed-bin histogram, top-k counters and a HyperLogLog), so memory depends
+on the number of columns and the batch size, not on the file size.
+"""
+
+import base64
+import json
+import math
+import os
+import zlib
+from collections.abc import Callable, Iterator
+from datetime import date, datetime, time, timedelta
+from io import BytesIO
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from polaris.ingest import CSV_READ_OPTIONS
+from polaris.sketches import HyperLogLog, SpaceSaving
+
+DEFAULT_BATCH_SIZE = 100_000
+PROFILE_MAGIC = b"PSP1"
+
+
+def iter_batches(source: str | pl.LazyFrame, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pl.DataFrame]:
+    """Batches of a CSV file or of any lazy frame (e.g. a ``DatasetSource`` scan with pushed-down filters)."""
+    lf = pl.scan_csv(source, **CSV_READ_OPTIONS) if isinstance(source, str) else source
+    # collect_batches 가 없는 예전 Polars 는 배치 CSV 리더로 읽는다 (이후 버전에서는 빠진 API)
+    read_csv_batched = getattr(pl, "read_csv_batched", None)
+    if hasattr(lf, "collect_batches"):
+        yield from lf.collect_batches(chunk_size=batch_size)
+    elif isinstance(source, str) and read_csv_batched is not None:
+        reader = read_csv_batched(source, batch_size=batch_size, **CSV_READ_OPTIONS)
+        while batches := reader.next_batches(1):
+            yield from batches
+    else:
+        yield from lf.collect(engine="streaming").iter_slices(batch_size)
+
+
+class Histogram:
+    """Fixed number of equal-width bins whose width doubles as the range grows.
+
+    Widths are powers of two and bin edges are multiples of the width, so any
+    two histograms can be merged exactly by coarsening the finer one.
+    """
+
+    def __init__(self, bin_count: int = 20):
+        self.bin_count = bin_count
+        self.width: float | None = None
+        self.start = 0.0
+        self.counts = np.zeros(bin_count, dtype=np.int64)
+
+    @property
+    def edges(self) -> np.ndarray:
+        return self.start + (self.width or 1.0) * np.arange(self.bin_count + 1)
+
+    def update(self, values: np.ndarray) -> None:
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return
+        low, high = float(values.min()), float(values.max())
+        if self.width is None:
+            span = high - low
+            self.width = 2.0 ** math.ceil(math.log2(span / self.bin_count)) if span > 0 else 1.0
+            self.start = math.floor(low / self.width) * self.width
+        self._cover(low, high)
+        index = np.clip((values - self.start) // self.width, 0, self.bin_count - 1).astype(np.int64)
+        self.counts += np.bincount(index, minlength=self.bin_count)
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        other = other._copy()
+        if other.width is None:
+            return self
+        if self.width is None:
+            self.width, self.start, self.counts = other.width, other.start, other.counts
+            return self
+        occupied = np.flatnonzero(other.counts)
+        if len(occupied) == 0:
+            return self
+        while True:
+            while other.width < self.width:
+                other._coarsen()
+            while self.width < other.width:
+                self._coarsen()
+            occupied = np.flatnonzero(other.counts)
+            width = self.width
+            self._cover(other.start + occupied[0] * other.width, other.start + occupied[-1] * other.width)
+            if self.width == width:
+                break
+        offset = int(round((other.start - self.start) / self.width))
+        for i in occupied:
+            self.counts[offset + i] += other.counts[i]
+        return self
+
+    def _cover(self, low: float, high: float) -> None:
+        assert self.width is not None
+        occupied = np.flatnonzero(self.counts)
+        if len(occupied):
+            low = min(low, self.start + occupied[0] * self.width)
+            high = max(high, self.start + occupied[-1] * self.width)
+        # 기존 데이터와 새 범위가 bin_count 개 안에 모두 들어갈 때까지 폭을 두 배로 늘린다
+        while high >= math.floor(low / self.width) * self.width + self.width * self.bin_count:
+            self._coarsen()
+        self._shift(math.floor(low / self.width) * self.width)
+
+    def _coarsen(self) -> None:
+        assert self.width is not None
+        width = 2 * self.width
+        start = math.floor(self.start / width) * width
+        offset = int(round((self.start - start) / self.width))
+        padded = np.concatenate([np.zeros(offset, dtype=np.int64), self.counts])
+        if len(padded) % 2:
+            padded = np.append(padded, 0)
+        pairs = padded.reshape(-1, 2).sum(axis=1)
+        self.counts = np.zeros(self.bin_count, dtype=np.int64)
+        self.counts[: len(pairs)] = pairs
+        self.width, self.start = width, start
+
+    def _shift(self, start: float) -> None:
+        assert self.width is not None
+        shift = int(round((start - self.start) / self.width))
+        if shift > 0:
+            self.counts = np.concatenate([self.counts[shift:], np.zeros(shift, dtype=np.int64)])
+        elif shift < 0:
+            self.counts = np.concatenate([np.zeros(-shift, dtype=np.int64), self.counts[:shift]])
+        self.start = start
+
+    def _copy(self) -> "Histogram":
+        copy = Histogram(self.bin_count)
+        copy.width, copy.start, copy.counts = self.width, self.start, self.counts.copy()
+        return copy
+
+    def aligned(self, other: "Histogram") -> tuple[np.ndarray, np.ndarray]:
+        """Counts of both histograms on one common grid, for comparing distributions."""
+        grid = self._copy().merge(other)
+        return grid._project(self), grid._project(other)
+
+    def _project(self, other: "Histogram") -> np.ndarray:
+        counts = np.zeros(self.bin_count, dtype=np.int64)
+        other = other._copy()
+        if other.width is None or self.width is None:
+            return counts
+        while other.width < self.width:
+            other._coarsen()
+        offset = int(round((other.start - self.start) / self.width))
+        for i in np.flatnonzero(other.counts):
+            counts[offset + i] += other.counts[i]
+        return counts
+
+    def to_state(self) -> dict:
+        return {"bin_count": self.bin_count, "width": self.width, "start": self.start, "counts": self.counts.tolist()}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Histogram":
+        histogram = cls(state["bin_count"])
+        histogram.width, histogram.start = state["width"], state["start"]
+        histogram.counts = np.array(state["counts"], dtype=np.int64)
+        return histogram
+
+
+def _encode_value(value: object) -> object:
+    # min/max 의 날짜·시간 값은 JSON 에서 타입을 잃지 않도록 태그를 붙여 저장
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, time):
+        return {"time": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"timedelta": value.total_seconds()}
+    return value
+
+
+def _decode_value(value: object) -> object:
+    if not isinstance(value, dict):
+        return value
+    ((tag, raw),) = value.items()
+    if tag == "timedelta":
+        return timedelta(seconds=raw)
+    parsers: dict[str, Callable[[str], object]] = {
+        "datetime": datetime.fromisoformat,
+        "date": date.fromisoformat,
+        "time": time.fromisoformat,
+    }
+    return parsers[tag](raw)
+
+
+class ColumnAccumulator:
+    def __init__(self, name: str, dtype: pl.DataType, top_k: int = 100, bin_count: int = 20, precision: int = 14):
+        self.name = name
+        self.dtype = dtype
+        self.count = 0
+        self.null_count = 0
+        # 같은 컬럼의 값끼리만 비교하므로 비교 가능한 타입이라는 것만 가정한다
+        self.min: Any = None
+        self.max: Any = None
+        self.moment_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.numeric = dtype.is_numeric()
+        self.categorical = dtype in (pl.Utf8, pl.Boolean, pl.Categorical)
+        self.histogram = Histogram(bin_count) if self.numeric else None
+        self.top = SpaceSaving(top_k) if self.categorical else None
+        self.distinct = HyperLogLog(precision) if not dtype.is_nested() else None
+
+    def update(self, values: pl.Series) -> None:
+        self.count += values.len()
+        self.null_count += values.null_count()
+        present = values.drop_nulls()
+        if present.is_empty():
+            return
+        if self.distinct is not None:
+            self.distinct.update(present)
+        if self.top is not None:
+            self.top.update(values)
+        if self.dtype.is_nested():
+            return
+        self._update_range(present.min(), present.max())
+        if self.histogram is not None:
+            data = present.cast(pl.Float64).to_numpy()
+            self._merge_moments(len(data), float(data.mean()), float(((data - data.mean()) ** 2).sum()))
+            self.histogram.update(data)
+
+    def merge(self, other: "ColumnAccumulator") -> "ColumnAccumulator":
+        self.count += other.count
+        self.null_count += other.null_count
+        if other.min is not None:
+            self._update_range(other.min, other.max)
+        if self.histogram is not None and other.histogram is not None:
+            self._merge_moments(other.moment_count, other.mean, other.m2)
+            self.histogram.merge(other.histogram)
+        if self.top is not None and other.top is not None:
+            self.top.merge(other.top)
+        if self.distinct is not None and other.distinct is not None:
+            self.distinct.merge(other.distinct)
+        return self
+
+    def _update_range(self, low: Any, high: Any) -> None:
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    def _merge_moments(self, n: int, mean: float, m2: float) -> None:
+        # Chan et al. 의 병렬 Welford 결합식
+        if n == 0:
+            return
+        total = self.moment_count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.moment_count * n / total
+        self.moment_count = total
+
+    def to_state(self) -> dict:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "null_count": self.null_count,
+            "min": _encode_value(self.min),
+            "max": _encode_value(self.max),
+            "moment_count": self.moment_count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "histogram": self.histogram.to_state() if self.histogram else None,
+            "top": json.loads(self.top.to_bytes()) if self.top else None,
+            "distinct": base64.b64encode(self.distinct.to_bytes()).decode() if self.distinct else None,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict, dtype: pl.DataType) -> "ColumnAccumulator":
+        accumulator = cls(state["name"], dtype)
+        accumulator.count, accumulator.null_count = state["count"], state["null_count"]
+        accumulator.min, accumulator.max = _decode_value(state["min"]), _decode_value(state["max"])
+        accumulator.moment_count, accumulator.mean, accumulator.m2 = state["moment_count"], state["mean"], state["m2"]
+        if state["histogram"] is not None:
+            accumulator.histogram = Histogram.from_state(state["histogram"])
+        if state["top"] is not None:
+            accumulator.top = SpaceSaving.from_bytes(json.dumps(state["top"]).encode())
+        if state["distinct"] is not None:
+            accumulator.distinct = HyperLogLog.from_bytes(base64.b64decode(state["distinct"]))
+        return accumulator
+
+    @property
+    def std(self) -> float | None:
+        return math.sqrt(self.m2 / (self.moment_count - 1)) if self.moment_count > 1 else None
+
+    def summary(self) -> dict:
+        distinct = self.distinct.estimate() if self.distinct is not None else None
+        present = self.count - self.null_count
+        return {
+            "column": self.name,
+            "dtype": str(self.dtype),
+            "count": self.count,
+            "null_count": self.null_count,
+            "completeness": present / self.count if self.count else None,
+            "min": None if self.min is None else str(self.min),
+            "max": None if self.max is None else str(self.max),
+            "mean": self.mean if self.numeric and present else None,
+            "std": self.std,
+            "distinct_estimate": None if distinct is None else round(min(distinct, present)),
+            "uniqueness_estimate": None if distinct is None or not self.count else min(distinct, present) / self.count,
+        }
+
+
+class StreamingProfiler:
+    """Profiles a CSV file (or any lazy frame) batch by batch with per-column accumulators."""
+
+    def __init__(
+        self, batch_size: int = DEFAULT_BATCH_SIZE, top_k: int = 100, bin_count: int = 20, precision: int = 14
+    ):
+        self.batch_size = batch_size
+        self.top_k = top_k
+        self.bin_count = bin_count
+        self.precision = precision
+        self.columns: dict[str, ColumnAccumulator] = {}
+        self.rows = 0
+
+    def update(self, batch: pl.DataFrame) -> None:
+        for name, values in batch.to_dict().items():
+            if name not in self.columns:
+                self.columns[name] = ColumnAccumulator(name, values.dtype, self.top_k, self.bin_count, self.precision)
+            self.columns[name].update(values)
+        self.rows += batch.height
+
+    def merge(self, other: "StreamingProfiler") -> "StreamingProfiler":
+        for name, accumulator in other.columns.items():
+            if name in self.columns:
+                self.columns[name].merge(accumulator)
+            else:
+                self.columns[name] = accumulator
+        self.rows += other.rows
+        return self
+
+    def profile_csv(self, path: str, progress: Callable[[float], None] | None = None) -> "StreamingProfiler":
+        file_size = os.path.getsize(path)
+        bytes_per_row = None
+        for batch in iter_batches(path, self.batch_size):
+            if bytes_per_row is None and batch.height:
+                # 첫 배치의 CSV 크기로 전체 행 수를 추정해 진행률을 계산
+                bytes_per_row = max(len(batch.head(1000).write_csv(include_header=False)) / min(batch.height, 1000), 1)
+            self.update(batch)
+            if progress and bytes_per_row:
+                progress(min(self.rows * bytes_per_row / file_size, 0.99))
+        if progress:
+            progress(1.0)
+        return self
+
+    def profile_frame(
+        self, lf: pl.LazyFrame, progress: Callable[[float], None] | None = None, total_rows: int | None = None
+    ) -> "StreamingProfiler":
+        """Profile any lazy frame batch by batch.
+
+        ``progress`` is called after every batch (so callers can cancel between batches); without ``total_rows``
+        the fraction stays at 0 until the end.
+        """
+        for batch in iter_batches(lf, self.batch_size):
+            self.update(batch)
+            if progress:
+                progress(min(self.rows / total_rows, 0.99) if total_rows else 0.0)
+        if progress:
+            progress(1.0)
+        return self
+
+    def summary(self) -> pl.DataFrame:
+        return pl.DataFrame([accumulator.summary() for accumulator in self.columns.values()])
+
+    @property
+    def schema(self) -> pl.Schema:
+        return pl.Schema({name: accumulator.dtype for name, accumulator in self.columns.items()})
+
+    def to_bytes(self) -> bytes:
+        """Compact serialized state: zlib-compressed JSON, with the schema as an empty IPC frame."""
+        schema = BytesIO()
+        pl.DataFrame(schema=self.schema).write_ipc(schema)
+        payload = {
+            "batch_size": self.batch_size,
+            "top_k": self.top_k,
+            "bin_count": self.bin_count,
+            "precision": self.precision,
+            "rows": self.rows,
+            "schema": base64.b64encode(schema.getvalue()).decode(),
+            "columns": [accumulator.to_state() for accumulator in self.columns.values()],
+        }
+        return PROFILE_MAGIC + zlib.compress(json.dumps(payload).encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StreamingProfiler":
+        if data[: len(PROFILE_MAGIC)] != PROFILE_MAGIC:
+            raise ValueError("not a serialized StreamingProfiler state")
+        payload = json.loads(zlib.decompress(data[len(PROFILE_MAGIC) :]))
+        profiler = cls(payload["batch_size"], payload["top_k"], payload["bin_count"], payload["precision"])
+        profiler.rows = payload["rows"]
+        schema = pl.read_ipc(BytesIO(base64.b64decode(payload["schema"]))).schema
+        for state in payload["columns"]:
+            profiler.columns[state["name"]] = ColumnAccumulator.from_state(state, schema[state["name"]])
+        return profiler
+
+    def histogram(self, column: str) -> pl.DataFrame:
+        histogram = self.columns[column].histogram
+        assert histogram is not None, f"{column} is not numeric"
+        return pl.DataFrame({"breakpoint": histogram.edges[1:], "count": histogram.counts})
+
+    def top_values(self, column: str, k: int = 10) -> pl.DataFrame:
+        top = self.columns[column].top
+        assert top is not None, f"{column} has no top-value counters"
+        return pl.DataFrame(top.top(k), schema=[column, "count", "max_error"], orient="row")
+
+    def error_bounds(self) -> dict:
+        return {
+            "distinct_relative_error": 1.04 / math.sqrt(1 << self.precision),
+            "top_k_max_overcount": {
+                name: accumulator.top.max_error for name, accumulator in self.columns.items() if accumulator.top
+            },
+            "histogram_bin_width": {
+                name: accumulator.histogram.width for name, accumulator in self.columns.items() if accumulator.histogram
+            },
+        }
@@ -0,0 +1,32 @@
+import importlib
+
+# 페이지별 모듈로 나눈 Streamlit 헬퍼. 각 페이지는 필요한 하위 모듈만 import 하고,
+# `from utils import ...` 로 쓰던 기존 코드는 해당 이름이 처음 쓰일 때 그 모듈만 불러온다.
+_EXPORTS = {
+    "MONITOR_DIR": "utils.datasets",
+    "dataset_key": "utils.datasets",
+    "get_dataset_cache": "utils.datasets",
+    "UPLOAD_TYPES": "utils.datasets",
+    "get_result_cache": "utils.datasets",
+    "load_dataset": "utils.datasets",
+    "load_source": "utils.datasets",
+    "monitor_path": "utils.datasets",
+    "scan_dataset": "utils.datasets",
+    "scan_source": "utils.datasets",
+    "scope_source": "utils.datasets",
+    "session_source": "utils.datasets",
+    "spill_dataset": "utils.datasets",
+    "PolarisEDA": "utils.eda",
+    "get_image_cache": "utils.eda",
+    "show_fig_as_image": "utils.eda",
+    "StreamingEDA": "utils.streaming",
+    "DataQuality": "utils.quality",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name]), name)
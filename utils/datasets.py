@@ -0,0 +1,110 @@
+import json
+import os
+from dataclasses import replace
+
+import polars as pl
+import streamlit as st
+
+from polaris.cache import RESULT_CACHE_DIR, DatasetCache, ResultCache, content_hash, default_spill_dir
+from polaris.ingest import SUFFIX_FORMATS, read_upload, scan_path
+from polaris.quality import rule_from_dict
+from polaris.source import DATA_ROOT, DatasetSource
+
+# 업로드할 수 있는 파일 확장자 (경로로 여는 데이터는 디렉터리/glob 도 가능)
+UPLOAD_TYPES = [suffix.lstrip(".") for suffix in SUFFIX_FORMATS]
+# 드리프트 모니터의 기준선 상태 파일을 보관하는 디렉터리
+MONITOR_DIR = os.environ.get("POLARIS_MONITOR_DIR", os.path.join(os.path.expanduser("~"), ".polaris", "monitors"))
+
+
+@st.cache_resource
+def get_dataset_cache():
+    # 프로세스 전체(모든 세션)에서 공유하는 파싱 결과 캐시
+    return DatasetCache(spill_dir=default_spill_dir())
+
+
+def dataset_key(file):
+    keys = st.session_state.setdefault("dataset_keys", {})
+    file_id = getattr(file, "file_id", None) or (file.name, file.size)
+    if file_id not in keys:
+        keys[file_id] = content_hash(file)
+    return keys[file_id]
+
+
+def load_dataset(file):
+    cache = get_dataset_cache()
+    return cache.get_or_load(dataset_key(file), lambda: read_upload(file, cache.spill_dir))
+
+
+def scan_dataset(file):
+    ipc_path = get_dataset_cache().ipc_path(dataset_key(file))
+    if ipc_path:
+        return pl.scan_ipc(ipc_path)
+    return scan_path(spill_dataset(file))
+
+
+def spill_dataset(file):
+    # 업로드 사본은 파싱 캐시의 디스크 한도 안에서 관리되므로 지워졌으면 다시 쓴다
+    return get_dataset_cache().spill_upload(dataset_key(file), file)
+
+
+def session_source():
+    # 메인 페이지에서 입력한 경로는 그대로, 업로드는 디스크 사본을 내용 해시로 식별하는 소스로 연다
+    if "dataset_path" in st.session_state:
+        return DatasetSource(st.session_state["dataset_path"], root=DATA_ROOT)
+    if "uploaded_file" in st.session_state:
+        file = st.session_state["uploaded_file"]
+        return DatasetSource(spill_dataset(file), key=dataset_key(file))
+    return None
+
+
+def scope_source(source):
+    # 사이드바에서 고른 컬럼과 행 필터를 스캔에 내려 보내 나머지 컬럼/파티션은 읽지 않는다
+    with st.sidebar.expander("🎯 분석 범위"):
+        columns = st.multiselect(
+            "컬럼",
+            list(source.scan().collect_schema()),
+            help="고른 컬럼만 읽습니다. 비워 두면 모든 컬럼을 분석합니다.",
+        )
+        filters_text = st.text_area(
+            "행 필터 (JSON)",
+            "[]",
+            help=(
+                "검증 규칙과 같은 형식으로, 모든 필터를 통과한 행만 분석합니다. "
+                "파티션 컬럼에 대한 필터는 해당 디렉터리를 아예 읽지 않습니다.\n\n"
+                '예: [{"type": "freshness", "column": "day", "max_age_days": 7}, '
+                '{"type": "allowed", "column": "country", "values": ["KR", "JP"]}]'
+            ),
+        )
+    try:
+        filters = tuple(rule_from_dict(spec) for spec in json.loads(filters_text or "[]"))
+        scoped = replace(source, columns=tuple(columns) or None, filters=filters)
+        scoped.scan()
+    except (json.JSONDecodeError, ValueError, TypeError, pl.exceptions.PolarsError) as error:
+        st.sidebar.error(f"행 필터를 적용할 수 없습니다: {error}")
+        return source
+    return scoped
+
+
+def load_source(source):
+    # 전체 프레임이 필요한 페이지에서 처음 쓸 때 한 번만 파싱하고 이후에는 캐시에서 꺼낸다
+    # (범위를 좁히지 않은 업로드의 키 = 내용 해시)
+    cache = get_dataset_cache()
+    return cache.get_or_load(source.fingerprint(), lambda: source.scan().collect())
+
+
+def scan_source(source):
+    ipc_path = get_dataset_cache().ipc_path(source.fingerprint())
+    if ipc_path:
+        return pl.scan_ipc(ipc_path)
+    return source.scan()
+
+
+def monitor_path(name):
+    safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in name)
+    return os.path.join(MONITOR_DIR, f"{safe}.pqm")
+
+
+@st.cache_resource
+def get_result_cache():
+    # 섹션 계산 결과: 메모리는 프로세스 내 세션끼리, 디스크는 백엔드와도 공유
+    return ResultCache(RESULT_CACHE_DIR)
@@ -0,0 +1,534 @@
+import json
+import time
+
+import numpy as np
+import polars as pl
+import streamlit as st
+
+from polaris.cache import cache_key
+from polaris.instrument import Recorder
+from polaris.profile import EDAEngine
+from polaris.render import ImageCache, figure_to_png, histogram_chart, small_multiples
+from polaris.sampling import DEFAULT_ROW_BUDGET, DEFAULT_SEED
+from polaris.scheduler import run_sections
+from utils.datasets import dataset_key, get_result_cache, load_dataset, scan_dataset
+
+# matplotlib.pyplot 과 seaborn(scipy.stats 포함)은 import 만으로 1초 이상 걸리므로
+# 모듈 상단이 아니라 실제로 그림을 그리는 메서드 안에서 import 한다.
+# 섹션은 작업 스레드에서 동시에 그려지므로 그림은 pyplot 의 전역 상태 대신 Figure 로 직접 만든다
+
+
+@st.cache_resource
+def get_image_cache():
+    return ImageCache()
+
+
+def show_fig_as_image(fig, width_px=800):
+    import matplotlib.pyplot as plt
+
+    # 600 dpi 고정 대신 표시 폭에 맞춘 dpi 로 래스터화
+    st.image(figure_to_png(fig, width_px), width=width_px)
+    plt.close(fig)
+
+
+class PolarisEDA(EDAEngine):
+    """Streamlit rendering of the ``EDAEngine`` sections."""
+
+    # 리포트는 항상 계측한다 (Performance 패널)
+    recorder: Recorder
+
+    def __init__(
+        self,
+        file,
+        lazy=False,
+        key=None,
+        row_budget=DEFAULT_ROW_BUDGET,
+        seed=DEFAULT_SEED,
+        feature_dtype=np.float64,
+        recorder=None,
+    ):
+        lazy = lazy or isinstance(file, pl.LazyFrame)
+        # 렌더링된 이미지 캐시의 키로 쓰는 데이터셋 식별자 (없으면 캐시하지 않음)
+        self.key = key if key is not None or isinstance(file, (pl.DataFrame, pl.LazyFrame)) else dataset_key(file)
+        if lazy:
+            frame = file if isinstance(file, pl.LazyFrame) else scan_dataset(file)
+        else:
+            frame = file if isinstance(file, pl.DataFrame) else load_dataset(file)
+        super().__init__(
+            frame,
+            lazy=lazy,
+            row_budget=row_budget,
+            seed=seed,
+            feature_dtype=feature_dtype,
+            fingerprint=self.key,
+            result_cache=get_result_cache(),
+            recorder=recorder or Recorder(),
+        )
+
+    def _write_sample_note(self, result):
+        if result["sample_size"] < result["total_rows"]:
+            st.write(
+                f"🎯 Model fitted on a seeded sample of {result['sample_size']:,} of {result['total_rows']:,} rows "
+                f"(seed {self.seed}); all rows were scored."
+            )
+        else:
+            st.write(f"🎯 Model fitted on all {result['total_rows']:,} rows (seed {self.seed}).")
+
+    def _show_figure(self, section, build, params=None, width_px=800):
+        params = {"lazy": self.lazy, "row_budget": self.row_budget, "seed": self.seed, **(params or {})}
+        key = cache_key(self.key, section, params) if self.key else None
+        image = get_image_cache().get(key) if key else None
+        if image is None:
+            image = figure_to_png(build(), width_px)
+            if key:
+                get_image_cache().put(key, image)
+        st.image(image, width=width_px)
+
+    def generate_eda_report(
+        self, method="exact", chart="plotly", correlation="pearson", parallel=True, max_workers=None
+    ):
+        st.title("📊 Polaris EDA Report")
+        st.write("### Comprehensive Exploratory Data Analysis Report")
+        st.write(
+            "This report provides an in-depth analysis of the dataset, "
+            "covering various statistical and visualization insights."
+        )
+
+        if self.recorder.profiler:
+            # 프로파일러는 한 번에 한 스레드에서만 켤 수 있어 섹션을 순서대로 계산
+            parallel = False
+        tasks = self.section_tasks(method=method, chart=chart, correlation=correlation)
+        # 섹션 순서대로 자리를 먼저 잡고, 계산이 끝나는 대로 해당 자리에 그린다
+        placeholders = {}
+        for name, title in self.SECTIONS:
+            placeholders[name] = st.empty()
+            placeholders[name].info(f"⏳ {title} — computing...")
+
+        with self.recorder.span("eda_report", "report", rows=self._row_count(), columns=len(self.schema)):
+            for run in run_sections(tasks, max_workers=max_workers if parallel else 1):
+                start = time.perf_counter()
+                with placeholders[run.name].container(), self.recorder.span(run.name, "render"):
+                    if run.error is not None:
+                        st.error(f"⚠️ `{run.name}` failed: {run.error}")
+                    else:
+                        getattr(self, f"render_{run.name}")(run.result)
+                self.timings[run.name] = {
+                    "compute_s": run.seconds,
+                    "render_s": time.perf_counter() - start,
+                    "cached": run.name in self.cache_hits,
+                }
+
+        self.render_performance()
+
+    def render_performance(self):
+        with st.expander("⚡ Performance"):
+            spans = self.recorder.rows()
+            st.write(
+                "Wall time, CPU time (section thread / whole process), "
+                "peak RSS growth and data shape of every section and phase."
+            )
+            columns = [
+                "name",
+                "phase",
+                "parent",
+                "wall_s",
+                "cpu_s",
+                "process_cpu_s",
+                "peak_mb",
+                "rows",
+                "columns",
+                "error",
+            ]
+            rows = [
+                {**{column: span[column] for column in columns}, "cached": span.get("attributes", {}).get("cached")}
+                for span in spans
+            ]
+            st.dataframe(pl.DataFrame(rows))
+            st.download_button(
+                "⬇️ Download spans (JSON lines)",
+                "\n".join(json.dumps(span, default=str) for span in spans),
+                file_name="polaris-spans.jsonl",
+                mime="application/x-ndjson",
+            )
+            profiles = {f"{span.name} ({span.phase})": span.profile for span in self.recorder.spans if span.profile}
+            if profiles:
+                choice = st.selectbox(f"🔬 {self.recorder.profiler} profile", list(profiles))
+                st.code(profiles[choice], language="text")
+
+    def dataset_overview(self):
+        self.render_dataset_overview(self.compute_dataset_overview())
+
+    def render_dataset_overview(self, result):
+        st.subheader("📌 Dataset Overview")
+        st.write(
+            "Understanding the structure of the dataset helps to gain insights into the type and distribution of data."
+        )
+        st.write(f"🔹 Total Rows: {result['height']}")
+        st.write(f"🔹 Total Columns: {result['width']}")
+        st.write("🔹 Data Types:")
+        st.dataframe(result["schema"])
+
+    def detect_anomalies(self):
+        self.render_detect_anomalies(self.compute_detect_anomalies())
+
+    def render_detect_anomalies(self, result):
+        st.subheader("🚨 Anomaly Detection")
+        st.write(
+            "Anomalies in the dataset can indicate potential data entry errors or extreme values that need attention."
+        )
+        numeric_cols = result["numeric_cols"]
+
+        if not numeric_cols:
+            st.write("⚠️ No numeric columns for anomaly detection.")
+            return
+
+        outlier_count = result["outlier_count"]
+        outlier_data = result["outlier_data"]
+        st.write(f"🔍 Detected {outlier_count} potential anomalies using Isolation Forest.")
+        self._write_sample_note(result)
+
+        if outlier_count > 0:
+            st.write("### 🚨 Outlier Summary")
+            st.dataframe(outlier_data)
+
+            st.write("### 📌 Anomaly Analysis Report")
+            for col in numeric_cols:
+                outlier_values = outlier_data[col].to_list()
+                if outlier_values:
+                    st.write(
+                        f"- **{col}** contains {len(outlier_values)} potential outliers. Example values: "
+                        f"{outlier_values[:5]}"
+                    )
+            st.write("🔍 These anomalies might indicate data entry errors or unusual patterns.")
+        else:
+            st.write("✅ No significant anomalies detected.")
+
+        st.subheader("🔍 Invalid String Values Detection")
+        anomalies = result["invalid_strings"]
+        if anomalies:
+            st.subheader("🔍 Detected Invalid String Values")
+            st.table(anomalies)
+            st.write(
+                "⚠️ The above values are commonly used to represent missing or incorrect data. "
+                "Consider cleaning or replacing them appropriately."
+            )
+        else:
+            st.write("✅ No invalid string values detected.")
+
+    def visualize_numeric_data(self, chart="plotly"):
+        self.render_visualize_numeric_data(self.compute_visualize_numeric_data(chart=chart))
+
+    def render_visualize_numeric_data(self, result):
+        st.subheader("📊 Numeric Data Distribution")
+        st.write("The following histograms represent the distribution of numeric variables in the dataset.")
+
+        numeric_cols = result["numeric_cols"]
+
+        if not numeric_cols:
+            st.write("⚠️ No numeric columns detected.")
+            return
+
+        # 4열씩 배치
+        cols_per_row = 4
+        if result["chart"] == "small_multiples" and "histograms" in result:
+            # 모든 컬럼을 한 장의 이미지로 그린다
+            self._show_figure(
+                "visualize_numeric_data",
+                lambda: small_multiples(result["histograms"], cols_per_row=cols_per_row),
+                params={"chart": "small_multiples"},
+                width_px=1200,
+            )
+            return
+
+        for i in range(0, len(numeric_cols), cols_per_row):
+            row_cols = st.columns(cols_per_row)
+            for j, col in enumerate(numeric_cols[i : i + cols_per_row]):
+                with row_cols[j]:
+                    st.markdown(f"**{col}**")
+                    if "histograms" in result:
+                        st.plotly_chart(histogram_chart(result["histograms"][col]), key=f"hist-{col}")
+                    else:
+                        import seaborn as sns
+                        from matplotlib.figure import Figure
+
+                        fig = Figure(figsize=(4, 3))
+                        sns.histplot(result["values"][col], bins=20, kde=True, ax=fig.subplots())
+                        st.pyplot(fig)
+
+    def analyze_binary_data(self):
+        self.render_analyze_binary_data(self.compute_analyze_binary_data())
+
+    def render_analyze_binary_data(self, result):
+        st.subheader("🔘 Binary Data Analysis")
+        st.write(
+            "Binary data consists of values that can take only two unique states, typically 0/1 or True/False. "
+            "Analyzing its distribution helps understand categorical distinctions."
+        )
+
+        binary_cols = result["binary_cols"]
+
+        if not binary_cols:
+            st.write("⚠️ No binary columns detected.")
+            return
+
+        for col in binary_cols:
+            st.write(f"🔹 **{col}**")
+            st.bar_chart(result["value_counts"][col].set_index(col))
+
+            st.write("- The distribution of binary values in this column is displayed above.")
+            st.write(
+                "- If a binary column is highly imbalanced, "
+                "consider addressing class imbalance issues if used for classification."
+            )
+
+    def analyze_structured_data(self):
+        self.render_analyze_structured_data(self.compute_analyze_structured_data())
+
+    def render_analyze_structured_data(self, result):
+        st.subheader("📂 Structured Data Analysis (List/Struct)")
+        st.write(
+            "Structured data includes list-type and structured columns that store nested values. "
+            "Analyzing their usage can provide insights into hierarchical data."
+        )
+
+        structured_cols = result["structured_cols"]
+
+        if not structured_cols:
+            st.write("⚠️ No structured data columns detected.")
+            return
+
+        for col in structured_cols:
+            st.write(f"🔹 **{col}**")
+            st.write(f"- Example values: {result['examples'][col]}")
+            st.write("- List columns store multiple values per row, whereas struct columns hold named subfields.")
+            st.write("- Consider expanding or normalizing structured data for better interpretability.")
+
+    def correlation_matrix(self, method="pearson"):
+        self.render_correlation_matrix(self.compute_correlation_matrix(method=method))
+
+    def render_correlation_matrix(self, result):
+        st.subheader("📈 Correlation Matrix")
+        st.write("The heatmap below shows the correlation between numeric variables in the dataset.")
+
+        if len(result["numeric_cols"]) < 2:
+            st.write("⚠️ Not enough numeric columns for correlation matrix.")
+            return
+
+        corr_matrix = result["corr_matrix"]
+        shown = len(corr_matrix)
+        if shown < len(result["numeric_cols"]):
+            st.write(
+                f"🔹 Showing the {shown} of {len(result['numeric_cols'])} columns "
+                f"with the strongest {result['method']} correlations, clustered."
+            )
+
+        def build():
+            import seaborn as sns
+            from matplotlib.figure import Figure
+
+            fig = Figure()
+            ax = fig.subplots()
+            # 컬럼이 많으면 숫자 표기 없이 색만 표시
+            sns.heatmap(
+                corr_matrix,
+                annot=shown <= 15,
+                cmap="coolwarm",
+                fmt=".2f",
+                ax=ax,
+                annot_kws={"size": 6},
+                vmin=-1,
+                vmax=1,
+            )
+            size = max(4, shown * 0.25)
+            fig.set_size_inches(size, size * 0.75)
+            return fig
+
+        self._show_figure("correlation_matrix", build, params={"method": result["method"]})
+
+        st.write(f"🔗 Strongest {result['method']} correlations:")
+        st.dataframe(result["top_pairs"])
+
+    def categorical_data_analysis(self, method="exact"):
+        self.render_categorical_data_analysis(self.compute_categorical_data_analysis(method=method))
+
+    def render_categorical_data_analysis(self, result):
+        st.subheader("🔢 Categorical Data Analysis")
+        st.write(
+            "Categorical variables contain discrete values that represent different categories or labels. "
+            "Understanding their distribution helps identify dominant classes and potential imbalances."
+        )
+
+        cat_cols = result["cat_cols"]
+
+        if not cat_cols:
+            st.write("⚠️ No categorical columns detected.")
+            return
+
+        for col in cat_cols:
+            st.write(f"🔹 **{col}**")
+            value_counts = result["value_counts"][col]
+
+            st.write(f"The top 10 most frequent values in `{col}` column are shown below.")
+            st.bar_chart(value_counts.set_index(col))
+
+            most_common = value_counts.iloc[0][col]
+            st.write(
+                f"- The most frequent value is `{most_common}`, appearing `{value_counts.iloc[0]['count']}` times."
+            )
+            st.write(
+                "- If a single category dominates, "
+                "consider balancing the data to improve model performance in classification tasks."
+            )
+
+    def timeseries_analysis(self):
+        self.render_timeseries_analysis(self.compute_timeseries_analysis())
+
+    def render_timeseries_analysis(self, result):
+        st.subheader("📅 Time-Series Analysis")
+        st.write(
+            "Time-series data consists of observations collected over time. "
+            "Analyzing temporal trends can reveal seasonality, trends, and anomalies."
+        )
+
+        date_cols = result["date_cols"]
+
+        if not date_cols:
+            st.write("⚠️ No date columns detected.")
+            return
+
+        for col in date_cols:
+            st.write(f"🔹 **{col}**")
+            st.write(f"The time-series trend for `{col}` column is displayed below.")
+            st.line_chart(result["time_series"][col].to_pandas().set_index(col))
+
+            st.write(
+                "- Peaks and dips in the time-series graph "
+                "may indicate seasonality or external events affecting the data."
+            )
+            st.write("- If missing time periods exist, consider imputing missing values to maintain consistency.")
+
+    def feature_importance(self):
+        self.render_feature_importance(self.compute_feature_importance())
+
+    def render_feature_importance(self, result):
+        st.subheader("📌 Feature Importance (Random Forest)")
+        st.write(
+            "Feature importance helps to identify which variables have the most impact on the target variable. "
+            "This is useful for feature selection and understanding the predictive power of variables."
+        )
+
+        numeric_cols = result["numeric_cols"]
+
+        if len(numeric_cols) < 2:
+            st.write("⚠️ Not enough numeric columns for feature importance analysis.")
+            return
+
+        importance = result["importance"]
+        self._write_sample_note(result)
+
+        st.write(
+            "The following bar chart represents the relative importance of each feature "
+            "in predicting the target variable."
+        )
+
+        def build():
+            import seaborn as sns
+            from matplotlib.figure import Figure
+
+            fig = Figure()
+            ax = fig.subplots()
+            sns.barplot(x=numeric_cols[:-1], y=importance, ax=ax)
+            return fig
+
+        self._show_figure("feature_importance", build)
+
+        most_important_feature = numeric_cols[np.argmax(importance)]
+        least_important_feature = numeric_cols[np.argmin(importance)]
+
+        st.write(f"- **{most_important_feature}** is the most influential feature in the model.")
+        st.write(f"- **{least_important_feature}** has the least impact on predictions.")
+        st.write("🔍 Consider removing features with low importance to simplify the model and improve efficiency.")
+
+    def cluster_analysis(self):
+        self.render_cluster_analysis(self.compute_cluster_analysis())
+
+    def render_cluster_analysis(self, result):
+        st.subheader("🔍 K-Means Clustering")
+        st.write(
+            "Clustering is an unsupervised learning technique that groups similar data points together. "
+            "It helps in identifying patterns and segmenting the dataset."
+        )
+
+        numeric_cols = result["numeric_cols"]
+
+        if len(numeric_cols) < 2:
+            st.write("⚠️ Not enough numeric columns for clustering.")
+            return
+
+        points, labels = result["points"], result["labels"]
+        self._write_sample_note(result)
+
+        st.write("📊 Cluster Visualization")
+
+        def build():
+            from matplotlib.figure import Figure
+
+            fig = Figure()
+            ax = fig.subplots()
+            scatter = ax.scatter(points[:, 0], points[:, 1], c=result["point_labels"], cmap="viridis", alpha=0.6)
+            ax.set_xlabel(numeric_cols[0])
+            ax.set_ylabel(numeric_cols[1])
+            fig.colorbar(scatter, label="Cluster")
+            return fig
+
+        self._show_figure("cluster_analysis", build, params={"n_clusters": 3})
+
+        st.write("### 📌 Cluster Analysis Report")
+        st.write(
+            "The dataset has been segmented into **3 clusters** using the K-Means algorithm. "
+            "Each cluster represents a group of similar data points."
+        )
+
+        for i in range(3):
+            cluster_size = (labels == i).sum()
+            st.write(f"- **Cluster {i}** contains {cluster_size} data points.")
+
+        st.write("### 🔍 Key Observations")
+        st.write("- Clusters are determined based on feature similarities.")
+        st.write("- If clusters are overlapping, feature scaling or a different number of clusters may be needed.")
+        st.write("- Further domain knowledge can help interpret the clusters for actionable insights.")
+
+    def pca_visualization(self):
+        self.render_pca_visualization(self.compute_pca_visualization())
+
+    def render_pca_visualization(self, result):
+        st.subheader("📌 PCA Visualization")
+        st.write(
+            "Principal Component Analysis (PCA) is used to reduce dimensionality "
+            "while retaining important data patterns."
+        )
+
+        if len(result["numeric_cols"]) < 2:
+            st.write("⚠️ Not enough numeric columns for PCA.")
+            return
+
+        reduced = result["reduced"]
+        self._write_sample_note(result)
+        if len(reduced) < result["total_rows"]:
+            st.write(f"🔹 The projection plots the {len(reduced):,}-row sample.")
+
+        def build():
+            from matplotlib.figure import Figure
+
+            fig = Figure()
+            ax = fig.subplots()
+            ax.scatter(reduced[:, 0], reduced[:, 1], alpha=0.5)
+            ax.set_title("PCA Projection")
+            return fig
+
+        self._show_figure("pca_visualization", build)
+
+        explained_variance = result["explained_variance"]
+        st.write(f"- **First Principal Component** explains {explained_variance[0]:.2f}% of the variance.")
+        st.write(f"- **Second Principal Component** explains {explained_variance[1]:.2f}% of the variance.")
+        st.write("🔍 PCA reduces dimensionality while retaining key patterns in data.")
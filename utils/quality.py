@@ -0,0 +1,68 @@
+import polars as pl
+import streamlit as st
+
+from polaris.monitor import QualityMonitor
+from polaris.quality import QualityAssessment
+from utils.datasets import get_result_cache
+
+
+class DataQuality(QualityAssessment):
+    def __init__(self, df, fingerprint=None):
+        super().__init__(df, fingerprint=fingerprint, result_cache=get_result_cache())
+
+    def plot_quality_metrics(self, quality_metrics: pl.DataFrame):
+        import plotly.graph_objs as go
+        from plotly.subplots import make_subplots
+
+        st.subheader("📊 Data Quality Metrics Overview")
+        st.dataframe(quality_metrics)
+
+        fig = make_subplots(
+            rows=3, cols=2, subplot_titles=("Completeness", "Accuracy", "Timeliness", "Consistency", "Uniqueness")
+        )
+
+        metrics = ["Completeness", "Timeliness", "Consistency"]
+        for i, metric in enumerate(metrics, 1):
+            fig.add_trace(
+                go.Bar(x=[metric], y=[quality_metrics[metric][0]], name=metric), row=(i + 1) // 2, col=(i % 2) + 1
+            )
+
+        st.plotly_chart(fig)
+
+    def update_monitor(self, path, appended_csv=None):
+        # appended_csv 가 주어지면 이전 갱신 이후 파일 끝에 추가된 바이트만 읽는다
+        monitor = QualityMonitor.open(path)
+        report = monitor.update_csv(appended_csv) if appended_csv else monitor.update(self.df)
+        monitor.save()
+        return monitor, report
+
+    def plot_drift_report(self, monitor, report):
+        st.subheader("📈 Drift Against Baseline")
+        if not report.baseline_rows:
+            st.write(f"🆕 Started a new baseline with {report.delta_rows:,} rows.")
+            return
+        st.write(
+            f"🔹 Compared {report.delta_rows:,} new rows with a baseline of {report.baseline_rows:,} rows; "
+            f"the baseline now holds {monitor.rows:,} rows."
+        )
+        st.write(f"🔹 Estimated duplicate rows in the delta: {report.duplicate_rows_estimate:,}")
+        for change in report.schema_changes:
+            st.warning(f"⚠️ Schema change: {change}")
+        if report.drifted:
+            st.error(f"🚨 Drift detected in: {', '.join(report.drifted)}")
+        else:
+            st.success("✅ No significant drift detected.")
+        st.dataframe(report.columns)
+        with st.expander("🕒 Monitor History"):
+            st.dataframe(pl.DataFrame(monitor.history).drop("drifted", "schema_changes", strict=False))
+
+    def plot_rule_results(self, report=None):
+        report = report or self.report
+        if report is None or not report.results:
+            return
+        st.subheader("📏 Rule Results")
+        st.dataframe(report.to_frame())
+        for result in report.results:
+            if result.failed:
+                with st.expander(f"❌ {result.name} — {result.failed:,} of {result.checked:,} checked rows failed"):
+                    st.dataframe(result.samples)
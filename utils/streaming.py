@@ -0,0 +1,90 @@
+import polars as pl
+import streamlit as st
+
+from polaris.source import NATIVE_HIVE_FORMATS, DatasetSource
+from polaris.streaming import StreamingProfiler
+
+
+class StreamingEDA:
+    def __init__(self, source, batch_size=100_000):
+        progress = st.progress(0.0, text="Profiling in batches...")
+
+        def report(fraction):
+            progress.progress(fraction, text=f"Profiling in batches... {fraction:.0%}")
+
+        profiler = StreamingProfiler(batch_size=batch_size)
+        if not isinstance(source, DatasetSource):
+            source = DatasetSource(source)
+        if source.format == "csv" and len(source.files()) == 1 and not source.scoped:
+            # 단일 CSV 는 읽은 바이트로 진행률을 계산
+            self.profiler = profiler.profile_csv(source.files()[0], progress=report)
+        else:
+            # Parquet/IPC 의 전체 행 수는 메타데이터로 바로 알 수 있다 (그 외에는 완료 시점에만 표시)
+            native = source.format in NATIVE_HIVE_FORMATS and not source.filters
+            total_rows = source.scan().select(pl.len()).collect().item() if native else None
+            self.profiler = profiler.profile_frame(source.scan(), progress=report, total_rows=total_rows)
+        progress.empty()
+        self.summary = self.profiler.summary()
+        self.error_bounds = self.profiler.error_bounds()
+
+    def generate_eda_report(self):
+        st.title("📊 Polaris EDA Report (Streaming)")
+        st.write(
+            "This report was built batch by batch from mergeable per-column accumulators, "
+            "so it covers files larger than memory. "
+            "Distinct counts and top values are approximate; their error bounds are listed below."
+        )
+
+        self.dataset_overview()
+        self.visualize_numeric_data()
+        self.categorical_data_analysis()
+        self.approximation_report()
+
+    def dataset_overview(self):
+        st.subheader("📌 Dataset Overview")
+        st.write(f"🔹 Total Rows: {self.profiler.rows}")
+        st.write(f"🔹 Total Columns: {len(self.profiler.columns)}")
+        st.write("🔹 Column Summary (completeness, range, moments, estimated uniqueness):")
+        st.dataframe(self.summary)
+
+    def visualize_numeric_data(self):
+        st.subheader("📊 Numeric Data Distribution")
+        numeric_cols = [name for name, acc in self.profiler.columns.items() if acc.histogram is not None]
+
+        if not numeric_cols:
+            st.write("⚠️ No numeric columns detected.")
+            return
+
+        cols_per_row = 4
+        for i in range(0, len(numeric_cols), cols_per_row):
+            row_cols = st.columns(cols_per_row)
+            for j, col in enumerate(numeric_cols[i : i + cols_per_row]):
+                with row_cols[j]:
+                    st.markdown(f"**{col}**")
+                    st.bar_chart(self.profiler.histogram(col).to_pandas().set_index("breakpoint"))
+
+    def categorical_data_analysis(self):
+        st.subheader("🔢 Categorical Data Analysis")
+        cat_cols = [name for name, acc in self.profiler.columns.items() if acc.top is not None]
+
+        if not cat_cols:
+            st.write("⚠️ No categorical columns detected.")
+            return
+
+        for col in cat_cols:
+            st.write(f"🔹 **{col}**")
+            top_values = self.profiler.top_values(col)
+            st.bar_chart(top_values.select(col, "count").to_pandas().set_index(col))
+            max_overcount = self.error_bounds["top_k_max_overcount"][col]
+            st.write(f"- Counts may overestimate the true frequency by at most `max_error` (here ≤ {max_overcount}).")
+
+    def approximation_report(self):
+        st.subheader("📏 Approximation Error Bounds")
+        relative_error = self.error_bounds["distinct_relative_error"]
+        st.write(f"- Distinct counts: relative standard error ≈ {relative_error:.2%} (HyperLogLog).")
+        st.write(
+            "- Top values: Space-Saving counters; "
+            "every value more frequent than rows / capacity is guaranteed to be listed."
+        )
+        st.write("- Histograms: exact counts over power-of-two bin widths:")
+        st.table(self.error_bounds["histogram_bin_width"])